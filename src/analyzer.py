@@ -10,15 +10,26 @@ serve as the contextual baseline for the LLM reporting agent.
 import pandas as pd
 import re
 import os
-from typing import Optional, Dict, Any
+import warnings
+from typing import Optional, Dict, Any, List, Tuple
+from atomic_io import write_csv_atomically
+from tracing import traced
+from leagues import active_division
+from league_db import open_db
 
 # --- CONFIGURATION & FILE PATHS ---
-DETAILS_FILE = "data/game_details.csv"
-TEAM_STATS_FILE = "data/team_stats.csv"
-PLAYER_STATS_FILE = "data/player_stats.csv"
-MANIFEST_FILE = "data/games_manifest.csv"
-PLAYOFF_STATS_FILE = "data/playoff_standings.csv" 
-PLAYOFF_MATCHUP_FILE = "data/playoff_matchups.csv"
+# Partitioned per division (see leagues.py); the default division reads data/
+DIVISION = active_division()
+DETAILS_FILE = DIVISION.data_path("game_details.csv")
+TEAM_STATS_FILE = DIVISION.data_path("team_stats.csv")
+PLAYER_STATS_FILE = DIVISION.data_path("player_stats.csv")
+MANIFEST_FILE = DIVISION.data_path("games_manifest.csv")
+PLAYOFF_STATS_FILE = DIVISION.data_path("playoff_standings.csv")
+PLAYOFF_MATCHUP_FILE = DIVISION.data_path("playoff_matchups.csv")
+PLAYER_GAME_LINES_FILE = DIVISION.data_path("player_game_lines.csv")
+
+# Additive standings columns (rank and goal differential are derived from these)
+STANDINGS_TOTALS = ['GP', 'W', 'L', 'T', 'Pts', 'GF', 'GA', 'PIM']
 
 
 # --- DATA NORMALIZATION & UTILITY HELPERS ---
@@ -59,18 +70,96 @@ def parse_integer_value(val: Any) -> int:
         return 0
 
 
+def parse_goal_participants(description: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Splits a raw goal description (e.g., '#12 Jane Doe (#4 John Roe, #9 Sam Poe)') 
+    into the goal scorer and the credited assistants.
+    
+    Args:
+        description (str): Raw goal description from the play-by-play data.
+        
+    Returns:
+        Tuple[str | None, List[str]]: The scorer (None if unparseable) and assistant names.
+    """
+    desc = str(description)
+    
+    # Goal Scorer: Player Name positioned before the parentheses
+    scorer_match = re.search(r'#\d+\s+([^(:]+)', desc)
+    scorer = scorer_match.group(1).strip() if scorer_match else None
+    
+    # Assistants: comma-separated names from within the parentheses
+    assists = []
+    assist_chunk = re.search(r'\((.*?)\)', desc)
+    if assist_chunk:
+        for raw in assist_chunk.group(1).split(','):
+            a_match = re.search(r'#\d+\s+([^,]+)', raw)
+            if a_match:
+                assists.append(a_match.group(1).strip())
+    return scorer, assists
+
+
+def impute_season_year(date_str: Any) -> Any:
+    """
+    The raw manifest lacks year declarations. Impute the correct year based on 
+    standard winter sports seasonality (Fall = Year 1, Winter/Spring = Year 2).
+    
+    Args:
+        date_str (Any): Raw manifest date (e.g., 'Wed Feb 25').
+        
+    Returns:
+        Any: The date string with the season year appended (NaN passes through).
+    """
+    if pd.isna(date_str): 
+        return date_str
+    if any(m in str(date_str) for m in ['Jan', 'Feb', 'Mar', 'Apr']):
+        return f"{date_str} 2026"
+    return f"{date_str} 2025"
+
+
+def parse_manifest_dates(manifest_df: pd.DataFrame) -> pd.Series:
+    """
+    Resolves every scheduled game to a calendar date.
+    
+    Args:
+        manifest_df (pd.DataFrame): The raw schedule manifest.
+        
+    Returns:
+        pd.Series: Parsed game dates indexed by string GameID.
+    """
+    with warnings.catch_warnings():
+        # Suppress Pandas parsing warnings for mixed formats to maintain clean terminal output
+        warnings.simplefilter('ignore', category=UserWarning)
+        dates = pd.to_datetime(manifest_df['Date'].apply(impute_season_year), format='mixed', errors='coerce')
+    return pd.Series(dates.values, index=manifest_df['GameID'].astype(str).values)
+
+
+@traced()
 def initialize_game_data() -> Optional[pd.DataFrame]:
     """
-    Loads and normalizes the master telemetry dataset.
+    Loads and normalizes the master telemetry dataset from the league database.
     Standardizes casing and team names to ensure reliable programmatic joins.
     
     Returns:
-        pd.DataFrame | None: The cleaned details dataframe, or None if the file is missing.
+        pd.DataFrame | None: The cleaned details dataframe, or None if no telemetry is on file.
     """
-    if not os.path.exists(DETAILS_FILE):
+    with open_db() as db:
+        df = db.events()
+    if df.empty:
         return None
+    return normalize_details(df)
+
+
+def normalize_details(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the telemetry normalization used by `initialize_game_data` to any slice of events
+    read from the league database (string GameIDs, canonical team names).
+    
+    Args:
+        df (pd.DataFrame): Raw event rows (see `LeagueDB.events`).
         
-    df = pd.read_csv(DETAILS_FILE)
+    Returns:
+        pd.DataFrame: The same rows, normalized in place.
+    """
     df['GameID'] = df['GameID'].astype(str)
     
     # Normalize team names to Title Case and fix apostrophe edge cases for joins
@@ -80,6 +169,7 @@ def initialize_game_data() -> Optional[pd.DataFrame]:
 
 # --- CORE ANALYTICS ENGINES ---
 
+@traced()
 def compute_standings_engine(df: pd.DataFrame, manifest_subset: pd.DataFrame) -> pd.DataFrame:
     """
     Calculates cumulative league standings (W/L/T/Pts/GF/GA/PIM).
@@ -94,8 +184,7 @@ def compute_standings_engine(df: pd.DataFrame, manifest_subset: pd.DataFrame) ->
     teams = pd.concat([manifest_subset['Home'], manifest_subset['Away']]).unique()
     
     # Initialize standings dictionary (ignoring structural 'Bye' weeks)
-    standings = {t: {'GP': 0, 'W': 0, 'L': 0, 'T': 0, 'Pts': 0, 'GF': 0, 'GA': 0, 'PIM': 0} 
-                 for t in teams if "Bye" not in t}
+    standings = {t: dict.fromkeys(STANDINGS_TOTALS, 0) for t in teams if "Bye" not in t}
 
     # Isolate the final score events to determine match outcomes
     finals = df[(df['EventType'] == 'PeriodScore') & (df['Period'] == 'Final')].copy()
@@ -145,6 +234,7 @@ def compute_standings_engine(df: pd.DataFrame, manifest_subset: pd.DataFrame) ->
     return std_df
 
 
+@traced()
 def compute_playoff_matchups(df: pd.DataFrame, po_manifest: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregates individual playoff games into a 'Series Points' view.
@@ -164,7 +254,7 @@ def compute_playoff_matchups(df: pd.DataFrame, po_manifest: pd.DataFrame) -> pd.
     
     # Create an agnostic pairing key (e.g., 'Team A-vs-Team B') to group multi-game series
     temp_po = po_manifest.copy()
-    temp_po['Pairing'] = temp_po.apply(lambda x: "-vs-".join(sorted([x['Home'], x['Away']])), axis=1)
+    temp_po['Pairing'] = series_pairings(temp_po)
     
     finals = df[(df['EventType'] == 'PeriodScore') & (df['Period'] == 'Final')].copy()
 
@@ -197,141 +287,357 @@ def compute_playoff_matchups(df: pd.DataFrame, po_manifest: pd.DataFrame) -> pd.
     return pd.DataFrame(matchups)
 
 
-def compute_player_statistics(df: pd.DataFrame) -> pd.DataFrame:
+def series_pairings(po_manifest: pd.DataFrame) -> pd.Series:
+    """Home/away-agnostic series key per playoff game (e.g., 'Team A-vs-Team B')."""
+    if po_manifest.empty:
+        return pd.Series(dtype=object, index=po_manifest.index)
+    return po_manifest.apply(lambda x: "-vs-".join(sorted([x['Home'], x['Away']])), axis=1)
+
+
+def merge_standings(previous: pd.DataFrame, delta: pd.DataFrame, manifest_subset: pd.DataFrame) -> pd.DataFrame:
+    """
+    Folds the standings of newly played games into an archived standings table.
+    
+    Args:
+        previous (pd.DataFrame): The archived table (output of `compute_standings_engine`).
+        delta (pd.DataFrame): `compute_standings_engine` over the new games only.
+        manifest_subset (pd.DataFrame): The full schedule subset the table covers; fixes the
+            team order so ties rank exactly as a full recomputation would.
+        
+    Returns:
+        pd.DataFrame: The re-ranked standings table.
+    """
+    teams = [t for t in pd.concat([manifest_subset['Home'], manifest_subset['Away']]).unique() if "Bye" not in t]
+    totals = pd.concat([previous, delta])[['Team'] + STANDINGS_TOTALS].groupby('Team').sum()
+    std_df = totals.reindex(teams, fill_value=0).astype(int).reset_index().rename(columns={'index': 'Team'})
+    std_df['Diff'] = std_df['GF'] - std_df['GA']
+    std_df = std_df.sort_values(by=['Pts', 'W', 'Diff'], ascending=False).reset_index(drop=True)
+    std_df.insert(0, 'Rk', range(1, len(std_df) + 1))
+    return std_df
+
+
+def _resolve_game_winners(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds the GWG (Game-Winning Goal) lookup for every decided game.
+    
+    A goal is the GWG if it is the goal that puts the winning team 
+    exactly one point ahead of the losing team's FINAL score.
+    
+    Args:
+        df (pd.DataFrame): Master details dataframe.
+        
+    Returns:
+        pd.DataFrame: Columns GameID, Winner, GWGNumber (ties and incomplete games omitted).
+    """
+    finals = df[(df['EventType'] == 'PeriodScore') & (df['Period'] == 'Final')].copy()
+    finals = finals[finals.groupby('GameID')['GameID'].transform('size') == 2]
+    finals['Score'] = finals['Description'].apply(parse_integer_value)
+    finals['Side'] = finals.groupby('GameID').cumcount()
+
+    sides = finals.pivot(index='GameID', columns='Side', values=['Team', 'Score'])
+    if sides.empty:
+        return pd.DataFrame(columns=['GameID', 'Winner', 'GWGNumber'])
+
+    s1, s2 = sides[('Score', 0)], sides[('Score', 1)]
+    winners = pd.DataFrame({
+        'Winner': sides[('Team', 0)].where(s1 > s2, sides[('Team', 1)]),
+        'GWGNumber': s2.where(s1 > s2, s1) + 1,
+    })[s1 != s2]
+    return winners.reset_index()
+
+
+@traced()
+def compute_player_game_lines(df: pd.DataFrame, game_dates: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    Materializes the per-player, per-game box score table in a single vectorized pass.
+    
+    Every roster appearance, goal, assist and penalty is flattened into one long event 
+    frame and grouped by (Player, GameID), so weekly leaders, last-N-games form and 
+    streaks become cheap slices instead of repeated regex parsing of raw descriptions.
+    
+    Args:
+        df (pd.DataFrame): Master details dataframe.
+        game_dates (pd.Series, optional): Game dates indexed by GameID (see `parse_manifest_dates`).
+        
+    Returns:
+        pd.DataFrame: One row per player-game (Player, GameID, Team, Date, G, A, Pts, PIM, 
+        PPG, SHG, GWG, Seq), ordered by the first appearance of each player in the telemetry.
+    """
+    stat_cols = ['G', 'A', 'PIM', 'PPG', 'SHG', 'GWG']
+    frames = []
+
+    # Roster Appearances (establish Games Played and primary team affiliation)
+    roster = df[df['EventType'] == 'RosterAppearance']
+    frames.append(pd.DataFrame({
+        'Player': roster['Description'].astype(str).str.strip(),
+        'GameID': roster['GameID'], 'Team': roster['Team'],
+        'Phase': 0, 'Row': roster.index, 'Slot': 0,
+    }))
+
+    # Scoring Events: running per-team goal count identifies the GWG event
+    goals = df[df['EventType'] == 'Goal'].copy()
+    goals['GoalNum'] = goals.groupby(['GameID', 'Team']).cumcount() + 1
+    goals = goals.reset_index().merge(_resolve_game_winners(df), on='GameID', how='left').set_index('index')
+    strength = goals['Strength'].astype(str).str.strip()
+
+    scorers = goals['Description'].astype(str).str.extract(r'#\d+\s+([^(:]+)')[0].str.strip()
+    has_scorer = scorers.notna()
+    frames.append(pd.DataFrame({
+        'Player': scorers[has_scorer], 'GameID': goals['GameID'][has_scorer], 'Team': goals['Team'][has_scorer],
+        'G': 1,
+        'PPG': (strength[has_scorer] == 'PP').astype(int),
+        'SHG': (strength[has_scorer] == 'SH').astype(int),
+        'GWG': ((goals['Winner'] == goals['Team']) & (goals['GoalNum'] == goals['GWGNumber']))[has_scorer].astype(int),
+        'Phase': 1, 'Row': goals.index[has_scorer], 'Slot': 0,
+    }))
+
+    # Assistants: comma-separated names from within the parentheses
+    assist_chunks = goals['Description'].astype(str).str.extract(r'\((.*?)\)')[0].dropna().str.split(',').explode()
+    assist_names = assist_chunks.str.extract(r'#\d+\s+([^,]+)')[0].str.strip()
+    assist_slot = assist_names.groupby(level=0).cumcount() + 1
+    assisted = assist_names.notna()
+    assist_names, assist_slot = assist_names[assisted], assist_slot[assisted]
+    frames.append(pd.DataFrame({
+        'Player': assist_names.values,
+        'GameID': goals.loc[assist_names.index, 'GameID'].values,
+        'Team': goals.loc[assist_names.index, 'Team'].values,
+        'A': 1, 'Phase': 1, 'Row': assist_names.index, 'Slot': assist_slot.values,
+    }))
+
+    # Penalty Events (credited only to players already known from rosters or scoring)
+    known_players = set(pd.concat([f['Player'] for f in frames]))
+    penalties = df[df['EventType'] == 'Penalty']
+    offenders = penalties['Description'].astype(str).str.extract(r'#\d+\s+([^:]+)')[0].str.strip()
+    credited = offenders.isin(known_players)
+    frames.append(pd.DataFrame({
+        'Player': offenders[credited], 'GameID': penalties['GameID'][credited], 'Team': penalties['Team'][credited],
+        'PIM': penalties['Description'][credited].apply(extract_pims_from_description),
+        'Phase': 2, 'Row': penalties.index[credited], 'Slot': 0,
+    }))
+
+    events = pd.concat(frames, ignore_index=True)
+    for col in stat_cols:
+        events[col] = pd.to_numeric(events[col], errors='coerce').fillna(0).astype(int)
+
+    # Replay the original processing order so team affiliation is "first seen wins"
+    events = events.sort_values(by=['Phase', 'Row', 'Slot'], kind='stable')
+    events['Seq'] = range(len(events))
+
+    lines = events.groupby(['Player', 'GameID'], sort=False).agg(
+        Team=('Team', 'first'), Seq=('Seq', 'min'), **{col: (col, 'sum') for col in stat_cols}
+    ).reset_index()
+    lines['Pts'] = lines['G'] + lines['A']
+    lines['Date'] = lines['GameID'].map(game_dates) if game_dates is not None else pd.NaT
+
+    return lines[['Player', 'GameID', 'Team', 'Date', 'G', 'A', 'Pts', 'PIM', 'PPG', 'SHG', 'GWG', 'Seq']]
+
+
+def summarize_player_lines(lines: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapses player-game lines into one row per player (GP and summed totals).
+    
+    Args:
+        lines (pd.DataFrame): Output (or any slice) of `compute_player_game_lines`.
+        
+    Returns:
+        pd.DataFrame: Player, Team, GP, G, A, Pts, PIM, PPG, SHG, GWG in first-seen order.
+    """
+    ordered = lines.sort_values(by='Seq', kind='stable')
+    totals = ordered.groupby('Player', sort=False).agg(
+        Team=('Team', 'first'), GP=('GameID', 'nunique'),
+        G=('G', 'sum'), A=('A', 'sum'), Pts=('Pts', 'sum'), PIM=('PIM', 'sum'),
+        PPG=('PPG', 'sum'), SHG=('SHG', 'sum'), GWG=('GWG', 'sum'),
+    )
+    return totals.reset_index()
+
+
+@traced()
+def compute_player_statistics(df: pd.DataFrame, lines: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Parses play-by-play events to generate an individual player leaderboard.
     
     Extracts goals, assists, penalty minutes, and specific game contexts (Power Play, 
-    Shorthanded, Game-Winning Goals) using regex parsing on raw event descriptions.
+    Shorthanded, Game-Winning Goals) by aggregating the player-game line table.
     
     Args:
         df (pd.DataFrame): Master details dataframe.
+        lines (pd.DataFrame, optional): Pre-computed player-game lines to reuse.
         
     Returns:
         pd.DataFrame: Comprehensive player statistics sorted by total points.
     """
     print("👤 Calculating Player Stats...")
-    player_metrics = {}
-    player_games = {} 
+    if lines is None:
+        lines = compute_player_game_lines(df)
+    return summarize_player_lines(lines).sort_values(by='Pts', ascending=False)
 
-    # --- GWG (Game-Winning Goal) State Machine ---
-    # A goal is the GWG if it is the goal that puts the winning team 
-    # exactly one point ahead of the losing team's FINAL score.
-    finals = df[(df['EventType'] == 'PeriodScore') & (df['Period'] == 'Final')].copy()
-    game_winners = {} 
-    
-    for gid in finals['GameID'].unique():
-        game_res = finals[finals['GameID'] == gid]
-        if len(game_res) == 2:
-            s1 = parse_integer_value(game_res.iloc[0]['Description'])
-            s2 = parse_integer_value(game_res.iloc[1]['Description'])
-            t1, t2 = game_res.iloc[0]['Team'], game_res.iloc[1]['Team']
-            
-            if s1 > s2:
-                game_winners[gid] = {'winner': t1, 'gwg_number': s2 + 1}
-            elif s2 > s1:
-                game_winners[gid] = {'winner': t2, 'gwg_number': s1 + 1}
-
-    def init_player(p_name: str, team: str):
-        """Helper to initialize a player record in the metrics dictionary."""
-        if p_name not in player_metrics:
-            player_metrics[p_name] = {
-                'Team': team, 'G': 0, 'A': 0, 'Pts': 0, 
-                'PIM': 0, 'PPG': 0, 'SHG': 0, 'GWG': 0
-            }
-            player_games[p_name] = set()
-
-    # Track Games Played via Roster Appearances
-    for _, row in df[df['EventType'] == 'RosterAppearance'].iterrows():
-        p_name, team, gid = row['Description'].strip(), row['Team'], row['GameID']
-        init_player(p_name, team)
-        player_games[p_name].add(gid)
-
-    # Track running scores per game to correctly identify the GWG event
-    running_scores = {}
-
-    # Parse Scoring Events (Goals & Assists)
-    for _, row in df[df['EventType'] == 'Goal'].iterrows():
-        desc = row['Description']
-        gid = row['GameID']
-        team = row['Team']
-        strength = str(row['Strength']).strip()
+
+# --- COMPACT GAME SUMMARIES ---
+
+# Strength codes worth surfacing; even-strength goals are the default and omitted
+SPECIAL_STRENGTHS = {'PP', 'SH', 'EN', 'EA', 'PS'}
+
+
+def summarize_game(game_events: pd.DataFrame, manifest_row: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Collapses one game's raw play-by-play rows into a compact summary object.
+    
+    Repeated per-row fields (GameID, ScrapedAt, 'N/A' placeholders) are dropped and each 
+    event keeps only what a reader needs: final score, goal timeline with scorer, assists 
+    and strength, penalties, officials and roster sizes.
+    
+    Args:
+        game_events (pd.DataFrame): All detail rows for a single GameID.
+        manifest_row (Dict, optional): The game's manifest record (date, teams, game type).
         
-        # Increment running score state
-        if gid not in running_scores: running_scores[gid] = {}
-        if team not in running_scores[gid]: running_scores[gid][team] = 0
-        running_scores[gid][team] += 1
-        current_goal_num = running_scores[gid][team]
-
-        # Extract Goal Scorer (Regex looks for Player Name before parentheses)
-        scorer_match = re.search(r'#\d+\s+([^(:]+)', desc)
-        if scorer_match:
-            p_name = scorer_match.group(1).strip()
-            init_player(p_name, team)
-            
-            player_metrics[p_name]['G'] += 1
-            player_metrics[p_name]['Pts'] += 1
-            
-            # Special Teams Context
-            if strength == 'PP': player_metrics[p_name]['PPG'] += 1
-            if strength == 'SH': player_metrics[p_name]['SHG'] += 1
-            
-            # GWG Logic Evaluation
-            if gid in game_winners and game_winners[gid]['winner'] == team and current_goal_num == game_winners[gid]['gwg_number']:
-                player_metrics[p_name]['GWG'] += 1
-            
-            player_games[p_name].add(gid)
-
-        # Extract Assistants (Regex pulls comma-separated names from within parentheses)
-        assist_chunk = re.search(r'\((.*?)\)', desc)
-        if assist_chunk:
-            for raw in assist_chunk.group(1).split(','):
-                a_match = re.search(r'#\d+\s+([^,]+)', raw)
-                if a_match:
-                    a_name = a_match.group(1).strip()
-                    init_player(a_name, team)
-                    
-                    player_metrics[a_name]['A'] += 1
-                    player_metrics[a_name]['Pts'] += 1
-                    player_games[a_name].add(gid)
-
-    # Parse Penalty Events
-    for _, row in df[df['EventType'] == 'Penalty'].iterrows():
-        desc, gid, team = row['Description'], row['GameID'], row['Team']
-        name_match = re.search(r'#\d+\s+([^:]+)', desc)
-        if name_match:
-            p_name = name_match.group(1).strip()
-            if p_name in player_metrics:
-                player_metrics[p_name]['PIM'] += extract_pims_from_description(desc)
-                player_games[p_name].add(gid)
-
-    # Compile final structured payload
-    stats = []
-    for name, m in player_metrics.items():
-        gp = len(player_games.get(name, set()))
-        stats.append({
-            'Player': name, 'Team': m['Team'], 'GP': gp, 
-            'G': m['G'], 'A': m['A'], 'Pts': m['Pts'], 'PIM': m['PIM'],
-            'PPG': m['PPG'], 'SHG': m['SHG'], 'GWG': m['GWG']
+    Returns:
+        Dict[str, Any]: The compact game summary.
+    """
+    summary: Dict[str, Any] = {'game_id': str(game_events['GameID'].iloc[0]) if not game_events.empty else None}
+    if manifest_row is not None:
+        summary.update({
+            'date': manifest_row.get('Date'),
+            'home': manifest_row.get('Home'),
+            'away': manifest_row.get('Away'),
+            'game_type': manifest_row.get('GameType'),
         })
+
+    finals = game_events[(game_events['EventType'] == 'PeriodScore') & (game_events['Period'] == 'Final')]
+    summary['final_score'] = {row['Team']: parse_integer_value(row['Description']) for _, row in finals.iterrows()}
+
+    goals = []
+    for _, row in game_events[game_events['EventType'] == 'Goal'].iterrows():
+        scorer, assists = parse_goal_participants(row['Description'])
+        goal = {'period': row['Period'], 'time': row['Time'], 'team': row['Team'], 'scorer': scorer}
+        if assists:
+            goal['assists'] = assists
+        strength = str(row['Strength']).strip()
+        if strength in SPECIAL_STRENGTHS:
+            goal['strength'] = strength
+        goals.append(goal)
+    summary['goals'] = goals
+
+    summary['penalties'] = [
+        {'period': row['Period'], 'time': row['Time'], 'team': row['Team'], 'infraction': row['Description']}
+        for _, row in game_events[game_events['EventType'] == 'Penalty'].iterrows()
+    ]
+    summary['officials'] = game_events.loc[game_events['EventType'] == 'Official', 'Description'].tolist()
+    summary['roster_size'] = (
+        game_events[game_events['EventType'] == 'RosterAppearance'].groupby('Team').size().to_dict()
+    )
+    return summary
+
+
+@traced()
+def build_game_summaries(details_df: pd.DataFrame, manifest_df: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+    """
+    Builds compact summaries for every game present in a details slice.
+    
+    Args:
+        details_df (pd.DataFrame): Play-by-play rows (any subset of games).
+        manifest_df (pd.DataFrame, optional): Manifest used to attach date and matchup metadata.
+        
+    Returns:
+        List[Dict[str, Any]]: One summary per game, in manifest (or first-seen) order.
+    """
+    details_df = details_df.copy()
+    details_df['GameID'] = details_df['GameID'].astype(str)
+    manifest_rows = {}
+    order = list(details_df['GameID'].unique())
+    if manifest_df is not None:
+        manifest_rows = {str(r['GameID']): r for r in manifest_df.to_dict(orient='records')}
+        order = [gid for gid in manifest_rows if gid in set(order)] + [gid for gid in order if gid not in manifest_rows]
+
+    grouped = dict(tuple(details_df.groupby('GameID', sort=False)))
+    return [summarize_game(grouped[gid], manifest_rows.get(gid)) for gid in order if gid in grouped]
+
+
+# --- PLAYER-GAME SLICES ---
+
+def load_player_game_lines(game_ids: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Loads the materialized player-game table indexed by (Player, Date).
+    
+    Args:
+        game_ids (List[str], optional): Only load these games' lines (a GameID index lookup).
+        
+    Returns:
+        pd.DataFrame | None: The indexed table, or None if the analyzer has not run.
+    """
+    with open_db() as db:
+        if not db.has_table("player_game_lines"):
+            return None
+        lines = db.table("player_game_lines", game_ids=game_ids)
+    lines['GameID'] = lines['GameID'].astype(str)
+    lines['Date'] = pd.to_datetime(lines['Date'])
+    return lines.set_index(['Player', 'Date']).sort_index()
+
+
+def weekly_player_leaders(lines: pd.DataFrame, start: Any, end: Any) -> pd.DataFrame:
+    """
+    Aggregates every player's production between two dates (inclusive).
     
-    return pd.DataFrame(stats).sort_values(by='Pts', ascending=False)
+    Args:
+        lines (pd.DataFrame): Indexed output of `load_player_game_lines`.
+        start, end: Window boundaries (anything `pd.Timestamp` accepts).
+        
+    Returns:
+        pd.DataFrame: Per-player window totals ranked by points, goals and game-winners.
+    """
+    window = lines.loc[(slice(None), slice(pd.Timestamp(start), pd.Timestamp(end))), :].reset_index()
+    return summarize_player_lines(window).sort_values(by=['Pts', 'G', 'GWG'], ascending=False)
+
+
+def last_n_games_form(lines: pd.DataFrame, player: str, n: int = 5) -> pd.DataFrame:
+    """Returns a player's most recent `n` game lines in chronological order."""
+    if player not in lines.index.get_level_values('Player'):
+        return lines.iloc[0:0]
+    return lines.xs(player, level='Player').tail(n)
 
 
-def run_analysis_pipeline():
+def compute_point_streaks(lines: pd.DataFrame) -> pd.Series:
+    """
+    Measures each player's active point streak (consecutive most-recent games with a point).
+    
+    Returns:
+        pd.Series: Streak length indexed by player, longest first.
+    """
+    flat = lines.reset_index().sort_values(by=['Player', 'Date'])
+    # A new block starts every time a pointless game breaks the run
+    breaks = (flat['Pts'] == 0).groupby(flat['Player']).cumsum()
+    trailing = flat[breaks == breaks.groupby(flat['Player']).transform('max')]
+    streaks = trailing[trailing['Pts'] > 0].groupby('Player').size()
+    return streaks.sort_values(ascending=False)
+
+
+@traced()
+def run_analysis_pipeline(df: Optional[pd.DataFrame] = None, manifest_df: Optional[pd.DataFrame] = None):
     """
     Main execution orchestrator.
     Cleans the schedule manifest, triggers calculations for regular season, 
-    playoffs, and players, then archives the structured data to CSV.
+    playoffs, and players, then archives the structured data to CSV and the league database.
+    
+    Args:
+        df (pd.DataFrame, optional): Normalized details already held in memory (e.g., by the
+            watcher). Loaded from disk when omitted.
+        manifest_df (pd.DataFrame, optional): The raw manifest, likewise.
     """
     print("🚀 Starting Data Analysis...")
-    df = initialize_game_data()
+    df = df if df is not None else initialize_game_data()
     if df is None: 
         print("❌ Missing source telemetry. Analysis aborted.")
         return
 
-    manifest_df = pd.read_csv(MANIFEST_FILE)
-    
+    db = open_db()
+    try:
+        _run_analysis(df, manifest_df.copy() if manifest_df is not None else db.manifest(), db)
+    finally:
+        db.close()
+    print(f"🏁 Analysis pipeline complete.")
+
+
+def _clean_manifest(manifest_df: pd.DataFrame) -> pd.DataFrame:
+    """Normalizes a manifest copy for joins against the telemetry (Notes, team names)."""
     # Ensure Notes column is present and strictly strings for downstream LLM safety
     if 'Notes' not in manifest_df.columns: 
         manifest_df['Notes'] = ""
@@ -340,30 +646,119 @@ def run_analysis_pipeline():
     # Clean team names in manifest for consistent programmatic joining
     for col in ['Home', 'Away']:
         manifest_df[col] = manifest_df[col].str.strip().str.title().replace("'S", "'s", regex=True)
+    return manifest_df
+
+
+def _run_analysis(df: pd.DataFrame, manifest_df: pd.DataFrame, db) -> None:
+    """Computes and archives every derived table (see `run_analysis_pipeline`)."""
+    manifest_df = _clean_manifest(manifest_df)
 
     # --- EXECUTION: Regular Season Standings ---
     rs_manifest = manifest_df[manifest_df['GameType'] == 'Regular Season']
     if not rs_manifest.empty:
         rs_standings = compute_standings_engine(df, rs_manifest)
-        rs_standings.to_csv(TEAM_STATS_FILE, index=False)
+        write_csv_atomically(rs_standings, TEAM_STATS_FILE, index=False)
+        db.replace_table("team_stats", rs_standings)
         print(f"✅ Season stats archived.")
 
     # --- EXECUTION: Playoff Tracking ---
     po_manifest = manifest_df[manifest_df['GameType'] == 'Playoffs'].copy()
     if not po_manifest.empty:
         po_standings = compute_standings_engine(df, po_manifest)
-        po_standings.to_csv(PLAYOFF_STATS_FILE, index=False)
+        write_csv_atomically(po_standings, PLAYOFF_STATS_FILE, index=False)
+        db.replace_table("playoff_standings", po_standings)
         
         po_matchups = compute_playoff_matchups(df, po_manifest)
-        po_matchups.to_csv(PLAYOFF_MATCHUP_FILE, index=False)
+        write_csv_atomically(po_matchups, PLAYOFF_MATCHUP_FILE, index=False)
+        db.replace_table("playoff_matchups", po_matchups)
         print(f"✅ Playoff Ranked Table & Matchups archived.")
 
     # --- EXECUTION: Player Leaderboards ---
-    player_stats = compute_player_statistics(df)
-    player_stats.to_csv(PLAYER_STATS_FILE, index=False)
+    game_lines = compute_player_game_lines(df, parse_manifest_dates(manifest_df))
+    sorted_lines = game_lines.sort_values(by=['Player', 'Date'])
+    write_csv_atomically(sorted_lines, PLAYER_GAME_LINES_FILE, index=False)
+    db.replace_table("player_game_lines", sorted_lines)
+    print(f"✅ Player-game lines archived.")
+
+    player_stats = compute_player_statistics(df, game_lines)
+    write_csv_atomically(player_stats, PLAYER_STATS_FILE, index=False)
+    db.replace_table("player_stats", player_stats)
     print(f"✅ Player stats archived.")
+
+
+@traced()
+def update_analysis(df: pd.DataFrame, game_ids: List[str], manifest_df: Optional[pd.DataFrame] = None) -> bool:
+    """
+    Folds newly ingested games into the archived derived tables without recomputing the season.
     
-    print(f"🏁 Analysis pipeline complete.")
+    Only the new games' player-game lines, the standings rows they move and the playoff series
+    they belong to are computed; player totals are re-aggregated from the line table.
+    
+    Args:
+        df (pd.DataFrame): Normalized details including the new games (e.g., the watcher's cache).
+        game_ids (List[str]): The newly ingested GameIDs.
+        manifest_df (pd.DataFrame, optional): The raw manifest. Loaded from the database when omitted.
+        
+    Returns:
+        bool: False if the archive cannot be updated in place (no archived lines yet, or the
+        games are already counted); run `run_analysis_pipeline` instead.
+    """
+    game_ids = [str(gid) for gid in game_ids]
+    db = open_db()
+    try:
+        archived = db.table("player_game_lines")
+        if archived.empty or archived['GameID'].astype(str).isin(game_ids).any():
+            return False
+        manifest_df = _clean_manifest(manifest_df.copy() if manifest_df is not None else db.manifest())
+        fresh = df[df['GameID'].isin(game_ids)]
+        is_fresh = manifest_df['GameID'].astype(str).isin(game_ids)
+
+        # --- Standings rows touched by the new games ---
+        for table, game_type, path in [("team_stats", "Regular Season", TEAM_STATS_FILE),
+                                       ("playoff_standings", "Playoffs", PLAYOFF_STATS_FILE)]:
+            subset = manifest_df[manifest_df['GameType'] == game_type]
+            if subset.empty or not is_fresh[subset.index].any():
+                continue
+            previous = db.table(table)
+            if previous.empty:
+                standings = compute_standings_engine(df, subset)
+            else:
+                standings = merge_standings(previous, compute_standings_engine(fresh, subset[is_fresh[subset.index]]), subset)
+            write_csv_atomically(standings, path, index=False)
+            db.replace_table(table, standings)
+
+        # --- Playoff series containing a new game ---
+        po_manifest = manifest_df[manifest_df['GameType'] == 'Playoffs']
+        if not po_manifest.empty and is_fresh[po_manifest.index].any():
+            pairings = series_pairings(po_manifest)
+            touched = set(pairings[is_fresh[po_manifest.index]])
+            series_games = po_manifest[pairings.isin(touched)]
+            updated = compute_playoff_matchups(df[df['GameID'].isin(series_games['GameID'].astype(str))], series_games)
+            previous = db.table("playoff_matchups")
+            if not previous.empty:
+                updated = pd.concat([previous[~previous['Matchup'].isin(touched)], updated])
+            order = {pairing: rank for rank, pairing in enumerate(pairings.unique())}
+            po_matchups = updated.sort_values(by='Matchup', key=lambda s: s.map(order)).reset_index(drop=True)
+            write_csv_atomically(po_matchups, PLAYOFF_MATCHUP_FILE, index=False)
+            db.replace_table("playoff_matchups", po_matchups)
+
+        # --- Player-game lines for the new games; totals re-aggregated from the lines ---
+        new_lines = compute_player_game_lines(fresh, parse_manifest_dates(manifest_df))
+        new_lines['Seq'] += int(archived['Seq'].max()) + 1
+        archived['GameID'] = archived['GameID'].astype(str)
+        archived['Date'] = pd.to_datetime(archived['Date'])
+        game_lines = pd.concat([archived, new_lines], ignore_index=True)
+        sorted_lines = game_lines.sort_values(by=['Player', 'Date'])
+        write_csv_atomically(sorted_lines, PLAYER_GAME_LINES_FILE, index=False)
+        db.replace_table("player_game_lines", sorted_lines)
+
+        player_stats = compute_player_statistics(fresh, game_lines)
+        write_csv_atomically(player_stats, PLAYER_STATS_FILE, index=False)
+        db.replace_table("player_stats", player_stats)
+    finally:
+        db.close()
+    print(f"✅ Derived tables updated for {len(game_ids)} new game(s).")
+    return True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+Atomic File Writes
+
+Every pipeline artifact (CSV datasets, posts, charts, caches, run state) is written to a
+temporary sibling file and swapped into place with `os.replace`, so a crashed or
+concurrent run never leaves a half-written file for the next stage to read.
+"""
+
+import os
+import shutil
+import tempfile
+import contextlib
+from typing import IO, Iterator
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = "w", encoding: str = "utf-8") -> Iterator[IO]:
+    """
+    Opens a temporary file next to `path` and atomically replaces `path` on success.
+
+    Args:
+        path (str): Final destination.
+        mode (str): 'w' for text or 'wb' for binary content.
+        encoding (str): Text encoding (ignored in binary mode).
+
+    Yields:
+        IO: The open temporary file. On an exception it is discarded and `path` is untouched.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": encoding})) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def write_text_atomically(path: str, content: str) -> None:
+    """Writes a complete text file in a single atomic swap."""
+    with atomic_write(path) as f:
+        f.write(content)
+
+
+def append_csv_atomically(df, path: str, **kwargs) -> None:
+    """
+    Appends rows to an existing CSV through an atomic swap: the current file is copied into
+    the temporary file, the rows are written after it, and the result replaces `path`.
+    """
+    with atomic_write(path) as f:
+        with open(path, "r", encoding="utf-8") as current:
+            shutil.copyfileobj(current, f)
+        df.to_csv(f, header=False, **kwargs)
+
+
+def write_csv_atomically(df, path: str, **kwargs) -> None:
+    """
+    `DataFrame.to_csv` with an atomic swap. Keyword arguments are passed through; pandas
+    is deliberately not imported here so lightweight callers stay fast to start.
+    """
+    with atomic_write(path) as f:
+        df.to_csv(f, **kwargs)
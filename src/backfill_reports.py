@@ -1,10 +1,12 @@
 import os
 import json
-import time
 import pandas as pd
 from datetime import datetime, timedelta
-from google import genai
 from dotenv import load_dotenv
+from llm_backend import LazyBackend
+from llm_scheduler import print_ledger
+from stat_renderer import render_stat_sections
+from analyzer import build_game_summaries
 
 # Load environment variables
 load_dotenv()
@@ -36,8 +38,7 @@ def generate_last_ten_thursdays():
 
 BACKFILL_DATES = ["2026-02-05"]
 
-api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-client = genai.Client(api_key=api_key)
+backend = LazyBackend()
 
 def get_historical_brief(target_date):
     """
@@ -69,18 +70,14 @@ def get_historical_brief(target_date):
         if this_week_details.empty:
             return None
 
-        officials = this_week_details[this_week_details['EventType'] == 'Official']
-        ref_map = officials.groupby('GameID')['Description'].apply(list).to_dict()
-
         weekly_manifest['ParsedDate'] = weekly_manifest['ParsedDate'].dt.strftime('%Y-%m-%d')
         
         brief = {
             "data_sources": {
                 "league_standings": standings.to_dict(orient='records'),
                 "individual_leaders": player_stats.to_dict(orient='records'),
-                "weekly_play_by_play": this_week_details.to_dict(orient='records'),
-                "schedule_and_arenas": weekly_manifest.to_dict(orient='records'),
-                "official_assignments": ref_map
+                "weekly_game_summaries": build_game_summaries(this_week_details, weekly_manifest),
+                "schedule_and_arenas": weekly_manifest.to_dict(orient='records')
             },
             "report_metadata": {
                 "current_date": target_date.strftime('%B %d, %Y'),
@@ -114,11 +111,11 @@ def run_backfill():
     2. DATA-DRIVEN INSIGHTS: Highlight specific player discrepancies.
     3. THE OFFICIALS: Comment on officiating volume and whether or not it impacted the game. 
     4. VIBE & VENUE: Contextualize results based on arena/time. Paint a visual by adding in weather data on that specific day. 
-    5. 80/20 Rule: 80% COVERAGE is Focused on the 'weekly_play_by_play' events and 20% CONTEXT: Ground results in standings and leaders.
+    5. 80/20 Rule: 80% COVERAGE is Focused on the 'weekly_game_summaries' events and 20% CONTEXT: Ground results in standings and leaders.
     6. Make sure to weave in a summary of every game that happened this week. Every team has to be mentioned. 
-    7. Use the 'player_stats' to highlight specific player performances. Use the 'weekly_play_by_play' to highlight specific game events.
+    7. Use the 'player_stats' to highlight specific player performances. Use the 'weekly_game_summaries' to highlight specific game events.
     8. Use the 'schedule_and_arenas' to highlight specific arena and time of day of the games.
-    9. Use the 'official_assignments' to highlight specific referees and linesmen only if they called a lot of penalities or no penalities at all.
+    9. Use the 'officials' in each game summary to highlight specific referees and linesmen only if they called a lot of penalities or no penalities at all.
     10. Use the 'game_details' to highlight specific game events. Weave in the game details into the narrative.
     11. If there is a big story, make sure to weave it in to the narrative.
 
@@ -127,10 +124,7 @@ def run_backfill():
     - WORD LIMIT: Approximately 200 words.
 
     THE THREE STARS:
-    Must be strictly based on weekly data.
-    - 1st Star: Most points, favoring goals. Emphasis on important goals. 
-    - 2nd Star: Second most points, emphasis on goals. 
-    - 3rd Star: The 'Productive Agitator' who contributes on the scoresheet and as a team contirbuter or the top goalie. 
+    The Three Stars are computed from the weekly data and appended automatically. Do NOT write them.
 
     OUTPUT FORMAT:
     - Your response MUST begin with a unique 'Headline' and 'Subline' on the first two lines.
@@ -147,9 +141,9 @@ def run_backfill():
         print(f"🎙️ Generating Dispatch for {date_str}...")
 
         try:
-            response = client.models.generate_content(
-                model="gemini-2.5-flash", 
-                contents=[system_instruction, f"DATA BRIEF:\n{json_brief}\n\nTask: Generate a historical newsletter dispatch."]
+            response = backend.generate(
+                [system_instruction, f"DATA BRIEF:\n{json_brief}\n\nTask: Generate a historical newsletter dispatch."],
+                call_site="backfill"
             )
             report_text = response.text
 
@@ -165,6 +159,7 @@ def run_backfill():
             generated_subline = lines[1].strip() if len(lines) > 1 else "Data-driven analysis of the DMHL."
             # The actual body content starts after the headline/subline
             actual_content = "\n".join(lines[2:]).strip()
+            actual_content += "\n\n" + render_stat_sections(json.loads(json_brief)) + "\n"
             
             # JEKYLL FILENAME CONVENTION
             filename = f"{date_str}-dispatch.md"
@@ -187,12 +182,12 @@ author_profile: true
                 f.write(front_matter + actual_content)
 
             print(f"✅ Created: {filename} with teaser: {teaser_logo}")
-            time.sleep(12) # Slightly faster for backfill but still safe
 
+        # Pacing and retries are handled by the shared LLM scheduler (see llm_scheduler)
         except Exception as e:
             print(f"❌ Error during AI generation for {date_str}: {e}")
-            time.sleep(30)
 
+    print_ledger()
     print("\n🏁 Backfill complete.")
 
 if __name__ == "__main__":
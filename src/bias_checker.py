@@ -5,20 +5,66 @@ This module serves as the final Quality Assurance (QA) gate in the publishing pi
 It leverages a secondary LLM inference call to audit generated newsletters for narrative 
 skew, unjustified causality, or subjective character attacks, ensuring the output maintains 
 journalistic objectivity while preserving stylistic color.
+
+Posts are audited incrementally: the article is split into sections (and oversized
+sections into paragraph groups), a local lexicon pre-screen (`bias_lexicon`) clears
+sections with no red-flag language, the remaining chunks are audited concurrently, and
+verdicts are cached by chunk hash so that an editor's fix only re-sends the paragraphs
+that changed. Set BIAS_PRESCREEN=0 to send every section to the LLM.
+
+The lexicon cannot screen Outcome Skew or Player Fixation: both are judgments about balance
+across the whole post, not red-flag words. The sections it clears are therefore still sent
+together as one combined chunk that is audited for those two categories only.
+
+`audit_bias` returns a structured verdict; `--json` and `--policy` run the gate unattended
+(see `gate_policy` for the policy file and exit codes).
 """
 
 import os
 import re
 import sys
-from typing import Optional
-from google import genai
+import json
+import time
+import hashlib
+import argparse
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
+from llm_backend import shared_backend, BIAS_CATEGORIES, DEFAULT_MODEL
+from llm_metrics import record_cache_hits
+from stat_renderer import strip_stat_sections
+from bias_lexicon import screen_chunks
+from atomic_io import atomic_write
+from tracing import propagate, traced
+from leagues import active_division
+from gate_policy import EXIT_ERROR, EXIT_PUBLISHABLE, POLICY_FILE, apply_policy, emit_verdict, exit_code, load_policy
 
 # Load environment variables
 load_dotenv()
 
 # --- CONFIGURATION & CONSTANTS ---
-POSTS_DIR = "docs/_posts"
+POSTS_DIR = active_division().posts_dir
+BIAS_CACHE_FILE = "data/bias_cache.json"
+
+# Bump when the audit prompt changes so stale cached verdicts are not reused
+AUDIT_PROMPT_VERSION = "3"
+# Whole-post balance categories the lexicon cannot screen; always reviewed by the LLM
+BALANCE_CATEGORIES = ("Outcome Skew", "Player Fixation")
+# Backends whose verdicts are never persisted (the offline fake always answers 'Absent')
+UNCACHED_BACKENDS = {"fake"}
+CHUNK_CHAR_LIMIT = 2000    # Paragraphs are packed into chunks up to roughly this size
+MAX_CHUNK_WORKERS = 4      # Concurrent chunk audits
+
+FRONT_MATTER_PATTERN = re.compile(r'\A---\n.*?\n---\n', re.DOTALL)
+VERDICT_PATTERN = re.compile(r'^[-*\s]*\[?(?P<category>[^:\]\n]+?)\]?\s*:\s*\**\s*(?P<verdict>Present|Absent|Pass|Fail)\b', re.IGNORECASE)
+
+_cache_lock = threading.Lock()
+
+
+class AuditCancelled(Exception):
+    """Raised when a caller cancels an in-progress bias audit (e.g., the factual gate failed)."""
 
 class TermColors:
     """Standardized ANSI escape codes for CLI output formatting."""
@@ -29,47 +75,105 @@ class TermColors:
     ENDC = '\033[0m'
 
 
-def evaluate_dispatch_bias(filepath: str) -> bool:
+# --- CHUNKING & CACHING ---
+
+def split_into_chunks(article_text: str) -> List[str]:
     """
-    Executes a Natural Language Processing (NLP) audit on a generated artifact.
-    
-    Flow:
-    1. Ingests the raw Markdown text.
-    2. Prompts the LLM with a strict editorial framework to classify specific bias types.
-    3. Parses the structured response to count violations.
-    4. Halts the CI/CD pipeline if systemic bias is detected, requiring human intervention.
+    Splits a post into audit units: one chunk per Markdown section, with sections that 
+    exceed `CHUNK_CHAR_LIMIT` packed paragraph-by-paragraph (each piece keeps its heading).
+    Front-matter and the deterministic stat sections carry no narrative and are dropped.
     
     Args:
-        filepath (str): The relative or absolute path to the generated Markdown file.
+        article_text (str): The raw Markdown post.
         
     Returns:
-        bool: True if the audit passes or is manually overridden. Exits the system if rejected.
+        List[str]: Ordered, non-empty chunks.
     """
-    
-    # --- PHASE 1: INITIALIZATION ---
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        print(f"{TermColors.RED}❌ Error: No API Key found in environment variables.{TermColors.ENDC}")
-        return False
-        
-    client = genai.Client(api_key=api_key)
+    body = strip_stat_sections(FRONT_MATTER_PATTERN.sub('', article_text))
 
-    print(f"🔍 Auditing Narrative Balance: {filepath}")
-    
-    # --- PHASE 2: CONTENT INGESTION ---
+    sections, current = [], []
+    for line in body.splitlines():
+        if line.startswith("#") and current:
+            sections.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    sections.append("\n".join(current).strip())
+
+    chunks = []
+    for section in filter(None, sections):
+        if len(section) <= CHUNK_CHAR_LIMIT:
+            chunks.append(section)
+            continue
+        heading = section.splitlines()[0] if section.startswith("#") else ""
+        paragraphs = [p.strip() for p in re.split(r'\n\s*\n', section[len(heading):]) if p.strip()]
+        packed = ""
+        for paragraph in paragraphs:
+            if packed and len(packed) + len(paragraph) > CHUNK_CHAR_LIMIT:
+                chunks.append(f"{heading}\n\n{packed}".strip())
+                packed = ""
+            packed = f"{packed}\n\n{paragraph}".strip()
+        if packed:
+            chunks.append(f"{heading}\n\n{packed}".strip())
+    return chunks
+
+
+def chunk_key(chunk: str, backend_name: str, model: str = DEFAULT_MODEL,
+              categories: Optional[Tuple[str, ...]] = None) -> str:
+    """Cache key for a chunk verdict (prompt version + backend + model + categories + normalized chunk text)."""
+    normalized = " ".join(chunk.split())
+    scope = "|".join(categories) if categories else "all"
+    payload = f"{AUDIT_PROMPT_VERSION}\n{backend_name}\n{model}\n{scope}\n{normalized}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_bias_cache(path: str = BIAS_CACHE_FILE) -> Dict[str, str]:
+    """Loads cached chunk evaluations (an unreadable cache is treated as empty)."""
+    if not os.path.exists(path):
+        return {}
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            article_text = f.read()
-    except FileNotFoundError:
-        print(f"{TermColors.RED}❌ Error: Target file not found at {filepath}{TermColors.ENDC}")
-        return False
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_bias_cache(cache: Dict[str, str], path: str = BIAS_CACHE_FILE) -> None:
+    """Persists the verdict cache atomically so concurrent runs never see a torn file."""
+    with _cache_lock, atomic_write(path) as f:
+        json.dump(cache, f, indent=2, ensure_ascii=False)
 
-    # --- PHASE 3: NLP FRAMEWORK DEFINITION ---
+
+# Audit question per category (the prompt lists all of them, or a requested subset)
+CATEGORY_CRITERIA = {
+    "Outcome Skew": "Does the report erase the losing team's positive statistical contributions just to force a \"hero\" narrative for the winner?",
+    "Player Fixation": "Is there a disproportionate focus on a single player's narrative that ignores or overshadows the actual statistical leaders of the game?",
+    "Unjustified Causality": "Does the text invent a direct reason for the outcome (e.g., \"destiny\", or blaming an entire loss on one minor penalty) without statistical backing?",
+    "Assumed Intent & Moral Judgment": "Does the text invent psychological motives (e.g., \"lost his temper\", \"gave up\") or assign moral labels to standard hockey plays (e.g., \"malicious\", \"dirty\")? ",
+    "Subjective Dismissal": "Is demeaning language used toward a team or player (e.g., 'outclassed', 'flat') without accompanying statistical context?",
+}
+
+
+def build_audit_prompt(chunk_text: str, categories: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Builds the editorial audit prompt for a single section of a post.
+
+    Args:
+        chunk_text (str): The section (or combined sections) to audit.
+        categories (Tuple[str, ...], optional): Only evaluate these categories. Defaults to all.
+
+    Returns:
+        str: The audit prompt.
+    """
+    criteria = "\n    ".join(
+        f"{i}. {category}: {CATEGORY_CRITERIA[category]}"
+        for i, category in enumerate(categories or BIAS_CATEGORIES, start=1)
+    )
     # This prompt establishes the boundary between acceptable stylistic flair 
     # (e.g., sports hyperbole) and unacceptable journalistic bias.
-    audit_prompt = f"""
+    return f"""
     You are an Auditor for a sophisticated, data-driven sports newsletter. 
     Evaluate the text below for 'Narrative Bias' while respecting the established style guide.
+    The text is one section of a longer article; judge only what this excerpt itself states.
 
     --- STRICT AUDIT CRITERIA & EXCLUSION ZONES ---
     1. ANALYTICAL COLOR (DO NOT FLAG): High-energy verbs and sports metaphors (e.g., 'dominance', 'relentless', 'chippy', 'intense', 'gritty', 'commanding') are EXPECTED and ALLOWED. If a word falls under standard sports hyperbole and aligns with the score/penalties, YOU MUST NOT FLAG IT.
@@ -80,14 +184,10 @@ def evaluate_dispatch_bias(filepath: str) -> bool:
     ----------------------
 
     Text to Audit: 
-    {article_text}
+    {chunk_text}
     
     Categories to evaluate:
-    1. Outcome Skew: Does the report erase the losing team's positive statistical contributions just to force a "hero" narrative for the winner?
-    2. Player Fixation: Is there a disproportionate focus on a single player's narrative that ignores or overshadows the actual statistical leaders of the game?
-    3. Unjustified Causality: Does the text invent a direct reason for the outcome (e.g., "destiny", or blaming an entire loss on one minor penalty) without statistical backing?
-    4. Assumed Intent & Moral Judgment: Does the text invent psychological motives (e.g., "lost his temper", "gave up") or assign moral labels to standard hockey plays (e.g., "malicious", "dirty")? 
-    5. Subjective Dismissal: Is demeaning language used toward a team or player (e.g., 'outclassed', 'flat') without accompanying statistical context?
+    {criteria}
 
     Format your response STRICTLY as follows:
     - [Category Name]: [Present/Absent]
@@ -96,52 +196,256 @@ def evaluate_dispatch_bias(filepath: str) -> bool:
     Do not provide snippets for 'Absent' categories.
     """
 
-    # --- PHASE 4: INFERENCE EXECUTION ---
+
+def parse_evaluation(evaluation: str) -> Dict[str, List[str]]:
+    """
+    Parses one chunk evaluation into the categories flagged as present.
+    
+    Args:
+        evaluation (str): Raw LLM response in the '- Category: Present/Absent' format.
+        
+    Returns:
+        Dict[str, List[str]]: Present category -> supporting snippets.
+    """
+    findings: Dict[str, List[str]] = {}
+    current = None
+    for line in evaluation.splitlines():
+        line = line.strip()
+        match = VERDICT_PATTERN.match(line)
+        if match:
+            raw = match.group('category').strip()
+            category = next((c for c in BIAS_CATEGORIES if c.lower() in raw.lower()), raw)
+            if match.group('verdict').lower() in ('present', 'fail'):
+                findings.setdefault(category, [])
+                current = category
+            else:
+                current = None
+        elif line.startswith(">") and current:
+            findings[current].append(line.lstrip("> ").strip())
+    return findings
+
+
+def merge_findings(chunk_findings: List[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """Unions per-chunk findings so each category counts once toward the gate."""
+    merged: Dict[str, List[str]] = {}
+    for findings in chunk_findings:
+        for category, snippets in findings.items():
+            merged[category] = list(dict.fromkeys(merged.get(category, []) + snippets))
+    return merged
+
+
+@traced()
+def audit_chunks(backend, chunks: List[str], cache: Dict[str, str],
+                 cancel: Optional[threading.Event] = None,
+                 scopes: Optional[List[Optional[Tuple[str, ...]]]] = None) -> Tuple[List[str], int]:
+    """
+    Evaluates every chunk, reusing cached verdicts and auditing the rest concurrently.
+    
+    Args:
+        backend (LLMBackend): The active LLM backend.
+        chunks (List[str]): Output of `split_into_chunks`.
+        cache (Dict[str, str]): Chunk hash -> raw evaluation (updated in place, except for
+            backends in `UNCACHED_BACKENDS`).
+        cancel (threading.Event, optional): When set, no further chunks are sent to the LLM.
+        scopes (List, optional): Categories to evaluate per chunk (None entries mean all).
+        
+    Returns:
+        Tuple containing:
+            - Raw evaluations, aligned with `chunks`.
+            - Number of chunks served from the cache.
+            
+    Raises:
+        AuditCancelled: If `cancel` is set before every chunk has been evaluated.
+    """
+    backend_name = getattr(backend, "name", "unknown")
+    scopes = scopes or [None] * len(chunks)
+    keys = [chunk_key(chunk, backend_name, categories=scope) for chunk, scope in zip(chunks, scopes)]
+    misses = {key: (chunk, scope) for key, chunk, scope in zip(keys, chunks, scopes) if key not in cache}
+    # Verdicts from uncached backends are used for this audit only
+    fresh = {} if backend_name in UNCACHED_BACKENDS else cache
+
+    def evaluate(request: Tuple[str, Optional[Tuple[str, ...]]]) -> str:
+        if cancel is not None and cancel.is_set():
+            raise AuditCancelled()
+        chunk, scope = request
+        return backend.generate(build_audit_prompt(chunk, scope), call_site="bias_checker").text.strip()
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(MAX_CHUNK_WORKERS, len(misses))) as pool:
+            for key, evaluation in zip(misses, pool.map(propagate(evaluate), misses.values())):
+                fresh[key] = evaluation
+
+    record_cache_hits("bias_checker", len(chunks) - len(misses), backend_name)
+    return [fresh[key] if key in fresh else cache[key] for key in keys], len(chunks) - len(misses)
+
+
+@traced()
+def audit_bias(filepath: str, prescreen: Optional[bool] = None, article_text: Optional[str] = None,
+               cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """
+    Structured verdict API: audits a generated artifact for narrative bias without any
+    interactive step.
+    
+    Flow:
+    1. Ingests the raw Markdown text and splits it into section/paragraph chunks.
+    2. Pre-screens chunks locally, then prompts the LLM with a strict editorial framework 
+       for every flagged chunk not already cached. The sections the lexicon clears are
+       combined into one chunk audited for `BALANCE_CATEGORIES` only, since no word list
+       can detect those.
+    3. Merges the per-chunk responses and counts the distinct categories violated.
+    
+    Args:
+        filepath (str): The relative or absolute path to the generated Markdown file.
+        prescreen (bool, optional): Run the lexicon pre-screen. Defaults to the 
+            BIAS_PRESCREEN environment variable (enabled unless set to '0').
+        article_text (str, optional): The post's contents, if the caller has already read it.
+        cancel (threading.Event, optional): Stops the audit before any further LLM calls.
+        
+    Returns:
+        Dict[str, Any]: Machine-readable verdict ('gate', 'post', 'status', 'categories',
+        'present_count', 'sections', 'sections_reviewed', 'balance_checked', 'cached', 'errors',
+        'elapsed_s'). 'sections_reviewed' counts sections audited for every category;
+        'balance_checked' is True when cleared sections were audited for the balance categories.
+        'status' is 'pass', 'minor' (one category), 'fail' (systemic bias), 'error' or 'cancelled'.
+    """
+    start = time.perf_counter()
+    if prescreen is None:
+        prescreen = os.getenv("BIAS_PRESCREEN", "1") != "0"
+    verdict = {"gate": "bias", "post": os.path.basename(filepath), "status": "error", "categories": {},
+               "present_count": 0, "sections": 0, "sections_reviewed": 0, "balance_checked": False,
+               "cached": 0, "errors": [], "elapsed_s": 0.0}
+
+    def finish(message: Optional[str] = None) -> Dict[str, Any]:
+        if message:
+            print(f"{TermColors.RED}❌ {message}{TermColors.ENDC}")
+            verdict["errors"].append(message)
+        verdict["elapsed_s"] = round(time.perf_counter() - start, 4)
+        return verdict
+
+    print(f"🔍 Auditing Narrative Balance: {filepath}")
+    
+    # --- PHASE 2: CONTENT INGESTION ---
+    if article_text is None:
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                article_text = f.read()
+        except FileNotFoundError:
+            return finish(f"Error: Target file not found at {filepath}")
+
+    # --- PHASE 3: CHUNKING ---
+    chunks = split_into_chunks(article_text)
+    verdict["sections"] = len(chunks)
+    if not chunks:
+        return finish(f"Error: No narrative content found in {filepath}")
+
+    # Lexicon pre-screen: only sections containing red-flag language need the full audit;
+    # the cleared ones are still checked together for the balance categories
+    scopes: List[Optional[Tuple[str, ...]]] = [None] * len(chunks)
+    if prescreen:
+        screened = screen_chunks(chunks)
+        cleared = [chunk for chunk, hits in zip(chunks, screened) if not hits]
+        chunks = [chunk for chunk, hits in zip(chunks, screened) if hits]
+        scopes = [None] * len(chunks)
+        flagged_terms = sorted({hit.term.lower() for hits in screened for hit in hits})
+        print(f"⚡ LEXICON PRE-SCREEN: {len(chunks)}/{len(screened)} section(s) flagged for review"
+              f"{': ' + ', '.join(flagged_terms) if flagged_terms else '.'}")
+        if cleared:
+            chunks.append("\n\n".join(cleared))
+            scopes.append(BALANCE_CATEGORIES)
+            verdict["balance_checked"] = True
+            print(f"⚖️  {len(cleared)} cleared section(s) combined for the {' & '.join(BALANCE_CATEGORIES)} review.")
+    verdict["sections_reviewed"] = sum(scope is None for scope in scopes)
+
+    # --- PHASE 4: INFERENCE EXECUTION (CACHED, CONCURRENT) ---
     try:
-        response = client.models.generate_content(
-            model="gemini-2.5-flash", 
-            contents=audit_prompt
-        )
-        evaluation = response.text.strip()
+        backend = shared_backend()
     except Exception as e:
-        print(f"{TermColors.RED}❌ LLM Inference Error: {e}{TermColors.ENDC}")
-        return False
+        return finish(f"Error: {e}")
+
+    cache = load_bias_cache()
+    try:
+        evaluations, cached = audit_chunks(backend, chunks, cache, cancel, scopes)
+    except AuditCancelled:
+        # Keep whatever verdicts completed so a re-run does not pay for them again
+        save_bias_cache(cache)
+        print("⏹️  Bias audit cancelled.")
+        verdict["status"] = "cancelled"
+        return finish()
+    except Exception as e:
+        return finish(f"LLM Inference Error: {e}")
+    save_bias_cache(cache)
+    verdict["cached"] = cached
+    print(f"♻️  {cached}/{len(chunks)} chunk verdicts served from cache; {len(chunks) - cached} sent for review.")
+
+    # --- PHASE 5: RESULT PARSING ---
+    # Quantify violations to determine pipeline routing (each category counts once)
+    findings = merge_findings(parse_evaluation(evaluation) for evaluation in evaluations)
+    verdict["categories"] = findings
+    verdict["present_count"] = len(findings)
+    verdict["status"] = "fail" if len(findings) >= 2 else "minor" if findings else "pass"
+    return finish()
 
-    # --- PHASE 5: RESULT PARSING & CLI RENDERING ---
+
+def render_bias_verdict(verdict: Dict[str, Any]) -> None:
+    """Prints the per-category audit table and the gate outcome for a bias verdict."""
     print("\n" + "=" * 50)
     print(f"🛡️  THE LOW B DISPATCH: BIAS & INTEGRITY AUDIT")
     print("=" * 50)
 
-    # Render structured output with visual indicators
-    lines = evaluation.split('\n')
-    for line in lines:
-        line = line.strip()
-        if not line: 
-            continue
-
-        if re.search(r':\s*Present', line, re.IGNORECASE) or re.search(r':\s*Fail', line, re.IGNORECASE):
-            print(f"{TermColors.YELLOW}{TermColors.BOLD}⚠️ {line}{TermColors.ENDC}")
-        elif re.search(r':\s*Absent', line, re.IGNORECASE) or re.search(r':\s*Pass', line, re.IGNORECASE):
-            print(f"{TermColors.GREEN}✅ {line}{TermColors.ENDC}")
-        elif line.startswith(">"):
-            print(f"   {line}")
+    # Render the merged verdict with visual indicators
+    findings = verdict["categories"]
+    for category in BIAS_CATEGORIES + [c for c in findings if c not in BIAS_CATEGORIES]:
+        if category in findings:
+            print(f"{TermColors.YELLOW}{TermColors.BOLD}⚠️ - {category}: Present{TermColors.ENDC}")
+            for snippet in findings[category]:
+                print(f"   > {snippet}")
         else:
-            print(f"   {line}")
+            print(f"{TermColors.GREEN}✅ - {category}: Absent{TermColors.ENDC}")
 
-    # --- PHASE 6: PIPELINE GATEKEEPING ---
-    # Quantify violations to determine pipeline routing
-    present_count = len(re.findall(r'\bPresent\b', evaluation, re.IGNORECASE))
-    
     print("-" * 50)
     
     # Gatekeeping Logic: Tolerate isolated warnings, but halt execution on systemic violations.
-    if present_count >= 2:
+    if verdict["status"] == "fail":
         print(f"{TermColors.RED}{TermColors.BOLD}🛑 AUDIT FAILED: Systemic bias detected.{TermColors.ENDC}")
-    elif present_count == 1:
+    elif verdict["status"] == "minor":
         print(f"{TermColors.YELLOW}{TermColors.BOLD}⚠️  MINOR SKEW DETECTED: Review the flag above.{TermColors.ENDC}")
+    else:
+        print(f"{TermColors.GREEN}{TermColors.BOLD}🎉 AUDIT PASSED: Content is objective and balanced.{TermColors.ENDC}")
+
+
+def evaluate_dispatch_bias(filepath: str, prescreen: Optional[bool] = None,
+                           policy: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Runs the bias audit and routes the outcome through an editor-in-chief decision.
+    
+    With a `policy` (see `gate_policy`), the decision is made non-interactively from the
+    policy file. Without one, any flagged category halts for a human override prompt.
     
+    Args:
+        filepath (str): The relative or absolute path to the generated Markdown file.
+        prescreen (bool, optional): Run the lexicon pre-screen (see `audit_bias`).
+        policy (Dict, optional): Output of `gate_policy.load_policy`.
+        
+    Returns:
+        bool: True if the audit passes or is overridden. Exits the system if rejected interactively.
+    """
+    verdict = audit_bias(filepath, prescreen)
+    if verdict["status"] == "error":
+        return False
+    render_bias_verdict(verdict)
+
+    # --- PHASE 6: PIPELINE GATEKEEPING ---
+    if policy is not None:
+        apply_policy(verdict, policy)
+        if verdict["override"]:
+            print(f"{TermColors.GREEN}✅ Override approved by {verdict['override']['approved_by']} "
+                  f"({verdict['override']['reason']}).{TermColors.ENDC}")
+        elif not verdict["publishable"]:
+            print(f"{TermColors.RED}🛑 PUBLICATION BLOCKED by editorial policy.{TermColors.ENDC}")
+        return verdict["publishable"]
+
     # Trigger Human-in-the-Loop override protocol if any bias is flagged
-    if present_count >= 1:
+    if verdict["present_count"] >= 1:
         choice = input("\n👨‍⚖️ EDITOR-IN-CHIEF OVERRIDE: Do you want to publish this report anyway? (y/n): ").strip().lower()
         if choice in ['y', 'yes']:
             print(f"{TermColors.GREEN}✅ Override accepted. Proceeding with publication...{TermColors.ENDC}")
@@ -150,20 +454,55 @@ def evaluate_dispatch_bias(filepath: str) -> bool:
             print(f"{TermColors.RED}🛑 PUBLICATION ABORTED.{TermColors.ENDC}")
             sys.exit(1) # Halt bash execution sequence
     
-    print(f"{TermColors.GREEN}{TermColors.BOLD}🎉 AUDIT PASSED: Content is objective and balanced.{TermColors.ENDC}")
     return True
 
 
+def latest_post() -> Optional[str]:
+    """Returns the most recently modified post, or None if there is none."""
+    if not os.path.exists(POSTS_DIR):
+        print(f"❌ Target directory not found: {POSTS_DIR}")
+        return None
+    all_files = [os.path.join(POSTS_DIR, f) for f in os.listdir(POSTS_DIR) if f.endswith(".md")]
+    if not all_files:
+        print(f"❌ No markdown posts found in {POSTS_DIR}.")
+        return None
+    # Sort files by modification time (newest first) and audit the latest
+    return max(all_files, key=os.path.getmtime)
+
+
 if __name__ == "__main__":
-    # Autonomously identify and evaluate the most recently generated artifact
-    if os.path.exists(POSTS_DIR):
-        all_files = [os.path.join(POSTS_DIR, f) for f in os.listdir(POSTS_DIR) if f.endswith(".md")]
-        
-        if all_files:
-            # Sort files by modification time (newest first) and audit the latest
-            all_files.sort(key=os.path.getmtime, reverse=True)
-            evaluate_dispatch_bias(all_files[0])
+    parser = argparse.ArgumentParser(description="Audit a dispatch for narrative bias.")
+    parser.add_argument("post", nargs="?", help="Post to audit (defaults to the most recently generated).")
+    parser.add_argument("--json", action="store_true", help="Print the verdict as JSON on stdout; logs go to stderr.")
+    parser.add_argument("--policy", default=None,
+                        help=f"Editorial policy file; enables non-interactive overrides (e.g. {POLICY_FILE}).")
+    args = parser.parse_args()
+
+    # Interactive prompt only for a plain human run; JSON and policy runs are unattended.
+    # Exit codes: 0 = publishable, 1 = blocked, 2 = the audit could not run
+    if not (args.json or args.policy):
+        target = args.post or latest_post()
+        if target and not evaluate_dispatch_bias(target):
+            sys.exit(EXIT_ERROR)
+        sys.exit(EXIT_PUBLISHABLE if target else EXIT_ERROR)
+
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        target = args.post or latest_post()
+        try:
+            policy = load_policy(args.policy)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(EXIT_ERROR)
+        if target:
+            verdict = apply_policy(audit_bias(target), policy)
+            if verdict["status"] != "error":
+                render_bias_verdict(verdict)
+            if verdict["override"]:
+                print(f"👨‍⚖️ OVERRIDE: Approved by {verdict['override']['approved_by']} ({verdict['override']['reason']}).")
         else:
-            print(f"❌ No markdown posts found in {POSTS_DIR}.")
-    else:
-        print(f"❌ Target directory not found: {POSTS_DIR}")
\ No newline at end of file
+            verdict = {"gate": "bias", "post": None, "status": "error", "publishable": False,
+                       "errors": ["No markdown posts found."]}
+
+    if args.json:
+        emit_verdict(verdict)
+    sys.exit(exit_code(verdict))
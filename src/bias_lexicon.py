@@ -0,0 +1,191 @@
+"""
+Bias Lexicon Pre-Screen
+
+A fast, dependency-free first pass for the bias auditor. A compiled lexicon of the
+red-flag terms named in the editorial audit criteria (character attacks, assumed intent,
+destiny narratives, dismissive language) plus a few causal-phrase patterns is run over
+each section of a post:
+
+* Sections with no hits skip the full five-category LLM audit.
+* Cleared sections are still reviewed together for Outcome Skew and Player Fixation, which
+  no word list can detect (see `bias_checker.BALANCE_CATEGORIES`), so a clean post costs
+  one combined LLM call instead of one per section.
+
+Precision and recall against the active division's archive and the `biased_post.md` demo
+(duplicate posts counted once) are reported with:
+
+    python3 src/bias_lexicon.py --measure
+"""
+
+import os
+import re
+import glob
+import hashlib
+import argparse
+from typing import Dict, List, NamedTuple, Tuple
+
+from leagues import active_division
+
+# --- CONFIGURATION & CONSTANTS ---
+POSTS_DIR = active_division().posts_dir
+BIASED_SAMPLE = "biased_post.md"
+
+# Red-flag vocabulary per audit category. Entries are regex fragments matched on word
+# boundaries, case-insensitively. Standard sports hyperbole ('dominance', 'relentless',
+# 'gritty', 'commanding') is deliberately absent: the style guide allows it.
+LEXICON: Dict[str, List[str]] = {
+    "Subjective Dismissal": [
+        r"pathetic", r"lazy", r"laz(?:ily|iness)", r"undeserving", r"outclassed", r"embarrass(?:ing|ed|ment)",
+        r"hapless", r"inept", r"woeful", r"listless", r"lifeless", r"clueless", r"pitiful", r"spineless",
+        # 'flat' as a put-down, never the Flat-Earthers
+        r"(?:looked|played|came out|were|was|went) flat(?![-\s]earth)",
+    ],
+    "Assumed Intent & Moral Judgment": [
+        r"gave up", r"giving up", r"quit(?:s|ting)?(?! the)", r"malicious(?:ly)?", r"dirty", r"cheap shots?",
+        r"lost (?:his|her|their) (?:temper|cool)", r"wanted it more", r"didn'?t care", r"no heart",
+        r"lack of (?:effort|heart|desire)", r"thugs?", r"goons?", r"intentionally",
+    ],
+    "Unjustified Causality": [
+        r"destiny", r"destined", r"fated?", r"cursed", r"meant to be", r"karma",
+        r"(?:cost|lost) them the (?:game|series|match)",
+    ],
+    "Player Fixation": [
+        r"single[- ]handedly", r"one[- ]man (?:show|army|team)", r"carried (?:the|his|her) team",
+    ],
+    "Outcome Skew": [
+        r"never stood a chance", r"no business", r"nothing to offer", r"didn'?t belong",
+    ],
+}
+
+# Causal claims that pin an outcome on a single cause ("lost because of one penalty")
+CAUSAL_PATTERNS: List[str] = [
+    r"\b(?:lost|fell|collapsed|won)\b[^.]{0,60}\b(?:because|all because|solely due to|thanks only to)\b",
+    r"\bthe (?:only|sole|lone) reason\b",
+]
+
+LEXICON_PATTERN = re.compile(
+    "|".join(
+        f"(?P<c{i}>\\b(?:{'|'.join(terms)})\\b)" for i, terms in enumerate(LEXICON.values())
+    ),
+    re.IGNORECASE,
+)
+CAUSAL_PATTERN = re.compile("|".join(CAUSAL_PATTERNS), re.IGNORECASE)
+_GROUP_CATEGORIES = {f"c{i}": category for i, category in enumerate(LEXICON)}
+
+
+class LexiconHit(NamedTuple):
+    """A single red-flag match."""
+    category: str
+    term: str
+    offset: int
+
+
+def screen_text(text: str) -> List[LexiconHit]:
+    """
+    Runs the compiled lexicon and causal patterns over a block of text.
+
+    Args:
+        text (str): A post section (or any prose).
+
+    Returns:
+        List[LexiconHit]: Every red-flag match, in order of appearance.
+    """
+    hits = [
+        LexiconHit(_GROUP_CATEGORIES[m.lastgroup], m.group(0), m.start())
+        for m in LEXICON_PATTERN.finditer(text)
+    ]
+    hits.extend(LexiconHit("Unjustified Causality", m.group(0), m.start()) for m in CAUSAL_PATTERN.finditer(text))
+    return sorted(hits, key=lambda hit: hit.offset)
+
+
+def screen_chunks(chunks: List[str]) -> List[List[LexiconHit]]:
+    """Screens each chunk independently; an empty hit list marks the chunk as clean."""
+    return [screen_text(chunk) for chunk in chunks]
+
+
+# --- MEASUREMENT ---
+
+def _label_posts() -> Tuple[List[Tuple[str, bool]], int]:
+    """
+    Labels the evaluation corpus at post level: `biased_post.md` is biased; every other
+    published post passed the editorial audit. Byte-identical posts (such as a published
+    copy of the demo) are counted once, so they cannot inflate precision or recall.
+
+    Returns:
+        Tuple containing:
+            - (path, is_biased) pairs for the distinct posts.
+            - Number of duplicate posts dropped.
+    """
+    paths = ([BIASED_SAMPLE] if os.path.exists(BIASED_SAMPLE) else []) + sorted(glob.glob(os.path.join(POSTS_DIR, "*.md")))
+    labeled, seen, duplicates = [], set(), 0
+    for path in paths:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if digest in seen:
+            duplicates += 1
+            continue
+        seen.add(digest)
+        labeled.append((path, path == BIASED_SAMPLE))
+    return labeled, duplicates
+
+
+def measure() -> Dict[str, float]:
+    """
+    Reports post-level precision/recall of the pre-screen over the distinct posts and the
+    share of sections that would still get the full LLM audit.
+
+    Returns:
+        Dict[str, float]: sample size, precision, recall, post clear rate and section review rate.
+    """
+    from bias_checker import split_into_chunks
+
+    tp = fp = fn = tn = 0
+    sections = flagged_sections = 0
+    corpus, duplicates = _label_posts()
+    print(f"{'POST':<34} {'LABEL':<7} {'FLAGGED':<8} HITS")
+    for path, is_biased in corpus:
+        with open(path, encoding="utf-8") as f:
+            chunks = split_into_chunks(f.read())
+        hits = screen_chunks(chunks)
+        sections += len(chunks)
+        flagged_sections += sum(1 for h in hits if h)
+        flagged = any(hits)
+
+        tp += flagged and is_biased
+        fp += flagged and not is_biased
+        fn += (not flagged) and is_biased
+        tn += (not flagged) and not is_biased
+        terms = ", ".join(sorted({hit.term.lower() for h in hits for hit in h}))
+        print(f"{os.path.basename(path):<34} {'biased' if is_biased else 'clean':<7} {'yes' if flagged else 'no':<8} {terms}")
+
+    total = tp + fp + fn + tn
+    results = {
+        "posts": total,
+        "duplicates": duplicates,
+        "precision": tp / (tp + fp) if tp + fp else 1.0,
+        "recall": tp / (tp + fn) if tp + fn else 1.0,
+        "post_clear_rate": (tn + fn) / total if total else 0.0,
+        "section_review_rate": flagged_sections / sections if sections else 0.0,
+    }
+    print("-" * 60)
+    print(f"📚 Sample: {total} distinct post(s) ({tp + fn} biased, {fp + tn} clean); "
+          f"{duplicates} duplicate(s) ignored.")
+    print(f"📏 Precision: {results['precision']:.2f} | Recall: {results['recall']:.2f} "
+          f"(TP={tp} FP={fp} FN={fn} TN={tn})")
+    print(f"⚡ Posts needing only the balance review: {results['post_clear_rate']:.0%} | "
+          f"Sections still given the full audit: {flagged_sections}/{sections} ({results['section_review_rate']:.0%})")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local bias lexicon pre-screen.")
+    parser.add_argument("post", nargs="?", help="Post to screen.")
+    parser.add_argument("--measure", action="store_true", help="Report precision/recall over the archive.")
+    args = parser.parse_args()
+
+    if args.measure or not args.post:
+        measure()
+    else:
+        with open(args.post, encoding="utf-8") as f:
+            for hit in screen_text(f.read()):
+                print(f"⚠️  [{hit.category}] '{hit.term}' at offset {hit.offset}")
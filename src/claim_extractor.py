@@ -0,0 +1,260 @@
+"""
+Deterministic Claim Extractor
+
+This module is the validator's fast path. The reporter's output format is highly regular
+(score lines, "**1st Star: Name (Team)** - xG, yA" patterns, Markdown headings), so most
+factual claims can be pulled out of a dispatch with precompiled patterns and a gazetteer of
+known team, player and official names built from the source data.
+
+Sentences that contain a claim the patterns cannot resolve unambiguously (e.g., a score
+with only one identifiable team) are returned separately so the validator can fall back to
+the LLM for just those snippets.
+"""
+
+import re
+import pandas as pd
+from typing import Any, Dict, List, Tuple
+
+from analyzer import parse_goal_participants
+
+# --- PRECOMPILED PATTERNS ---
+FRONT_MATTER_PATTERN = re.compile(r'\A---\n.*?\n---\n', re.DOTALL)
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+|\n+')
+
+# "**1st Star: Sean Murphy (Don Cherry's)** - 2G, 1A, 3Pts." (ordinal words also accepted)
+STAR_LINE_PATTERN = re.compile(
+    r"\*\*\s*(?P<rank>1st|2nd|3rd|First|Second|Third)\s+Star:\s*(?P<player>[^(*]+?)\s*\((?P<team>[^)]+)\)\s*\*\*"
+    r"\s*[-–—:]?\s*(?P<g>\d+)\s*G,\s*(?P<a>\d+)\s*A,\s*(?P<pts>\d+)\s*Pts?",
+    re.IGNORECASE,
+)
+# "**Michael Murphy (Don Cherry's) - 41 Pts**"
+HARDWARE_LINE_PATTERN = re.compile(
+    r"\*\*\s*(?P<player>[^(*\n]+?)\s*\((?P<team>[^)]+)\)\s*[-–—]\s*(?P<pts>\d+)\s*Pts?\s*\*\*",
+    re.IGNORECASE,
+)
+# "5-2" but not W-L-T records ("4-0-1"), dates or large numbers
+SCORE_PATTERN = re.compile(r'(?<![\d\-–])(\d{1,2})\s?[-–]\s?(\d{1,2})(?![\d\-–])')
+
+GOAL_KEYWORDS = re.compile(
+    r"\b(scor\w*|goals?|tall(?:y|ied|ies)|nett?(?:ed|s)?|markers?|hat[- ]trick|lit the lamp|potted|buried|snipe[sd]?|back of the net)\b",
+    re.IGNORECASE,
+)
+ASSIST_KEYWORDS = re.compile(r"\b(assist\w*|helpers?|set up|feeds?|apples?)\b", re.IGNORECASE)
+
+
+def normalize_name(text: str) -> str:
+    """Lowercases and strips apostrophes, '#' and redundant whitespace for matching."""
+    text = str(text).replace("#", "").replace("’", "").replace("'", "")
+    return " ".join(text.lower().split())
+
+
+def team_aliases(team: str) -> List[str]:
+    """
+    Lists the normalized spellings a team name is routinely written with in prose.
+
+    Args:
+        team (str): Canonical team name from the manifest.
+
+    Returns:
+        List[str]: Normalized aliases (seedings stripped, hyphen/article/possessive variants).
+    """
+    alias = normalize_name(re.sub(r'\(.*?\)', '', str(team)))
+    aliases = [alias, alias.replace("-", " ")]
+    if alias.startswith("the "):
+        aliases.append(alias[4:])
+    # Possessive team names are routinely shortened in prose ("Don Cherry's" -> "Cherry's")
+    if "'" in str(team) or "’" in str(team):
+        aliases.append(alias.split()[-1])
+    return list(dict.fromkeys(aliases))
+
+
+def _alternation(names: List[str]) -> re.Pattern:
+    """Compiles a longest-first word-bounded alternation over normalized names."""
+    ordered = sorted({n for n in names if n}, key=len, reverse=True)
+    if not ordered:
+        return re.compile(r'(?!x)x')
+    return re.compile(r'(?<![\w])(' + "|".join(re.escape(n) for n in ordered) + r')(?![\w])')
+
+
+class Gazetteer:
+    """
+    Known-entity dictionary built from the source-of-truth datasets.
+
+    Attributes:
+        teams (Dict[str, str]): Normalized alias -> canonical team name.
+        players (Dict[str, str]): Normalized full name -> canonical player name.
+        last_names (Dict[str, str]): Unique capitalized last name -> canonical player name.
+        officials (Dict[str, str]): Normalized official name -> canonical name.
+    """
+
+    def __init__(self, teams: Dict[str, str], players: Dict[str, str], officials: Dict[str, str]):
+        self.teams = teams
+        self.players = players
+        self.officials = officials
+
+        # Last-name aliases only when unambiguous; matched case-sensitively to avoid common words
+        by_last: Dict[str, List[str]] = {}
+        for canonical in set(players.values()):
+            parts = canonical.split()
+            if len(parts) > 1:
+                by_last.setdefault(parts[-1], []).append(canonical)
+        self.last_names = {last: names[0] for last, names in by_last.items() if len(names) == 1}
+
+        self.team_pattern = _alternation(list(teams))
+        self.player_pattern = _alternation(list(players))
+        self.official_pattern = _alternation(list(officials))
+        self.last_name_pattern = re.compile(
+            r'\b(' + "|".join(re.escape(n) for n in sorted(self.last_names, key=len, reverse=True)) + r')\b'
+        ) if self.last_names else re.compile(r'(?!x)x')
+
+    @classmethod
+    def from_data(cls, details: pd.DataFrame, manifest: pd.DataFrame) -> "Gazetteer":
+        """
+        Builds the gazetteer from the raw details and manifest datasets.
+
+        Args:
+            details (pd.DataFrame): Master play-by-play dataframe.
+            manifest (pd.DataFrame): The schedule manifest.
+
+        Returns:
+            Gazetteer: The populated entity dictionary.
+        """
+        teams: Dict[str, str] = {}
+        for team in pd.concat([manifest['Home'], manifest['Away']]).dropna().unique():
+            canonical = str(team).strip()
+            for alias in team_aliases(canonical):
+                teams[alias] = canonical
+
+        players: Dict[str, str] = {}
+        rosters = details.loc[details['EventType'] == 'RosterAppearance', 'Description'].dropna()
+        for name in rosters.astype(str).str.strip().unique():
+            players[normalize_name(name)] = name
+        for desc in details.loc[details['EventType'] == 'Goal', 'Description'].dropna():
+            scorer, assists = parse_goal_participants(desc)
+            for name in ([scorer] if scorer else []) + assists:
+                players.setdefault(normalize_name(name), name)
+
+        officials: Dict[str, str] = {}
+        for desc in details.loc[details['EventType'] == 'Official', 'Description'].dropna():
+            name = str(desc).split(":", 1)[-1].strip()
+            if name and "forfeit" not in name.lower():
+                officials[normalize_name(name)] = name
+
+        return cls(teams, players, officials)
+
+    def find_teams(self, sentence: str) -> List[str]:
+        """Returns the distinct canonical teams mentioned in a sentence, in order."""
+        found: List[str] = []
+        for match in self.team_pattern.finditer(normalize_name(sentence)):
+            team = self.teams[match.group(1)]
+            if team not in found:
+                found.append(team)
+        return found
+
+    def find_players(self, sentence: str) -> List[str]:
+        """Returns the distinct canonical players mentioned in a sentence (full or unique last name)."""
+        found: List[str] = []
+        for match in self.player_pattern.finditer(normalize_name(sentence)):
+            player = self.players[match.group(1)]
+            if player not in found:
+                found.append(player)
+        for match in self.last_name_pattern.finditer(sentence):
+            player = self.last_names[match.group(1)]
+            if player not in found:
+                found.append(player)
+        return found
+
+    def find_officials(self, text: str) -> List[str]:
+        """Returns the distinct officials named anywhere in the text."""
+        return list(dict.fromkeys(self.officials[m.group(1)] for m in self.official_pattern.finditer(normalize_name(text))))
+
+
+def extract_claims(report_text: str, gazetteer: Gazetteer) -> Tuple[Dict[str, List[Any]], List[str]]:
+    """
+    Extracts structured factual claims from a dispatch without calling an LLM.
+
+    Args:
+        report_text (str): The Markdown post (front-matter is ignored).
+        gazetteer (Gazetteer): Known entities from the source data.
+
+    Returns:
+        Tuple containing:
+            - Dict with 'matchups', 'events', 'officials', 'star_lines' and 'hardware_lines'
+              in the same shape as the LLM extraction payload.
+            - List of sentences containing claims that could not be resolved locally.
+    """
+    body = FRONT_MATTER_PATTERN.sub('', report_text)
+    claims: Dict[str, List[Any]] = {"matchups": [], "events": [], "officials": [], "star_lines": [], "hardware_lines": []}
+    unresolved: List[str] = []
+    seen_events = set()
+
+    def add_event(player: str, e_type: str) -> None:
+        if (player, e_type) not in seen_events:
+            seen_events.add((player, e_type))
+            claims["events"].append({"player": player, "type": e_type})
+
+    # --- PASS 1: Structured stat lines (Three Stars & Hardware) ---
+    for m in STAR_LINE_PATTERN.finditer(body):
+        line = {"player": m.group('player').strip(), "team": m.group('team').strip(),
+                "g": int(m.group('g')), "a": int(m.group('a')), "pts": int(m.group('pts'))}
+        claims["star_lines"].append(line)
+        if line["g"] > 0: add_event(line["player"], "goal")
+        if line["a"] > 0: add_event(line["player"], "assist")
+    for m in HARDWARE_LINE_PATTERN.finditer(body):
+        claims["hardware_lines"].append({"player": m.group('player').strip(), "team": m.group('team').strip(),
+                                         "pts": int(m.group('pts'))})
+
+    # Structured lines are fully consumed above; prose sentences are analyzed next
+    prose = HARDWARE_LINE_PATTERN.sub('', STAR_LINE_PATTERN.sub('', body))
+
+    # --- PASS 2: Prose sentences (scores and scoring events) ---
+    for sentence in SENTENCE_SPLIT_PATTERN.split(prose):
+        sentence = sentence.strip(" \t*#>-")
+        if not sentence:
+            continue
+
+        scores = SCORE_PATTERN.findall(sentence)
+        if scores:
+            teams = gazetteer.find_teams(sentence)
+            if len(teams) == 2 and len(scores) == 1:
+                claims["matchups"].append({"home": teams[0], "away": teams[1], "score": f"{scores[0][0]}-{scores[0][1]}"})
+            else:
+                # A score without two known teams (a misspelled or invented team) goes to the LLM
+                unresolved.append(sentence)
+                continue
+
+        has_goal, has_assist = bool(GOAL_KEYWORDS.search(sentence)), bool(ASSIST_KEYWORDS.search(sentence))
+        if not (has_goal or has_assist):
+            continue
+        players = gazetteer.find_players(sentence)
+        # No known player: the scorer may be misspelled or invented, so the LLM extracts it
+        if len(players) == 1 and has_goal != has_assist:
+            add_event(players[0], "goal" if has_goal else "assist")
+        else:
+            unresolved.append(sentence)
+
+    claims["officials"] = gazetteer.find_officials(prose)
+    return claims, unresolved
+
+
+def merge_claims(local: Dict[str, List[Any]], fallback: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """
+    Folds LLM-extracted claims for unresolved sentences into the local claim set.
+
+    Args:
+        local (Dict): Claims produced by `extract_claims`.
+        fallback (Dict): Claims returned by the LLM extraction prompt.
+
+    Returns:
+        Dict: The combined claim payload without duplicate events or officials.
+    """
+    merged = {k: list(v) for k, v in local.items()}
+    merged["matchups"].extend(fallback.get("matchups", []))
+    seen_events = {(e["player"], e["type"]) for e in merged["events"]}
+    for event in fallback.get("events", []):
+        key = (event.get("player"), event.get("type"))
+        if key not in seen_events:
+            seen_events.add(key)
+            merged["events"].append(event)
+    merged["officials"] = list(dict.fromkeys(merged["officials"] + list(fallback.get("officials", []))))
+    return merged
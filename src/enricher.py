@@ -8,13 +8,14 @@ more nuanced and human-like reporting.
 """
 
 import pandas as pd
-import os
-import shutil
 from datetime import datetime
 from typing import Any
+from leagues import active_division
+from league_db import open_db
 
 # --- CONFIGURATION & FILE PATHS ---
-MANIFEST_PATH = "data/games_manifest.csv"
+DIVISION = active_division()
+MANIFEST_PATH = DIVISION.data_path("games_manifest.csv")
 
 
 def parse_hockey_date(date_str: Any) -> pd.Timestamp:
@@ -50,22 +51,19 @@ def enrich_games() -> None:
     Executes the interactive enrichment loop.
     
     Flow:
-    1. Creates an atomic backup of the target dataset.
+    1. Loads the schedule from the league database.
     2. Validates schema integrity.
     3. Identifies records lacking qualitative metadata.
     4. Prompts the user sequentially for input.
     5. Executes a transactional commit upon user confirmation.
     """
-    if not os.path.exists(MANIFEST_PATH):
-        print("❌ Error: Manifest file not found. Ensure scraping pipeline has run.")
+    # --- PHASE 1: STATE LOADING ---
+    # Staged notes stay in memory; nothing is written until the final confirmation
+    with open_db() as db:
+        df = db.manifest()
+    if df.empty:
+        print("❌ Error: Manifest not found. Ensure scraping pipeline has run.")
         return
-
-    # --- PHASE 1: STATE PRESERVATION ---
-    # Create an atomic backup to prevent data corruption during human data entry
-    shutil.copy(MANIFEST_PATH, f"{MANIFEST_PATH}.bak")
-
-    # Load dataset
-    df = pd.read_csv(MANIFEST_PATH)
     
     # --- PHASE 2: SCHEMA VALIDATION & NORMALIZATION ---
     # Ensure the target column exists to prevent KeyError exceptions
@@ -93,7 +91,8 @@ def enrich_games() -> None:
     print(f"🏒 COMMISSIONER PORTAL: {len(pending)} games awaiting insights.")
     print("Commands: Enter text to save, press Enter to skip, type 'exit' to quit.\n")
 
-    for index, row in pending.iterrows():
+    staged = {}
+    for _, row in pending.iterrows():
         # Display contextual metadata to guide the user's input
         print(f"Matchup: {row['Home']} vs {row['Away']} ({row['Date']})")
         print(f"Details: {row['Score']} at {row['Facility']}")
@@ -107,7 +106,7 @@ def enrich_games() -> None:
         
         # Process input
         if note:
-            df.at[index, 'Notes'] = note
+            staged[row['GameID']] = note
             print("📝 Staged.")
         else:
             print("⏭️ Skipped.")
@@ -115,14 +114,17 @@ def enrich_games() -> None:
         print("-" * 30)
 
     # --- PHASE 5: TRANSACTIONAL COMMIT ---
-    # Cleanup the temporary sorting column to maintain strict schema compliance
-    df = df.drop(columns=['_ParsedDate'])
+    if not staged:
+        print("✅ No insights staged. Manifest unchanged.")
+        return
 
     # Require explicit confirmation before overwriting the source of truth
     confirm = input(f"\n💾 Save staged changes to manifest? (y/n): ").lower()
     
     if confirm == 'y':
-        df.to_csv(MANIFEST_PATH, index=False)
+        # Notes and the manifest CSV export commit together in one database transaction
+        with open_db() as db:
+            db.set_notes(staged)
         print("✅ Commit Successful: Manifest updated and saved.")
     else:
         print("🚫 Transaction Aborted: Save cancelled. Original data preserved.")
@@ -0,0 +1,278 @@
+"""
+Indexed Fact Store
+
+This module precomputes the lookups the factual validator needs, so that every extracted
+claim is verified with a hash-map probe instead of a scan over the raw CSV tables:
+
+* Team pair      -> final scores (both orientations) and GameIDs.
+* Player         -> (GameID, event type, role) postings for goals, assists and penalties.
+* Official       -> GameIDs they were assigned to.
+* Player-game    -> the analyzer's box-score lines, for numeric stat-line checks.
+
+The index is built once per audit over the full normalized dataset. Lookups accept an
+optional set of GameIDs so callers can restrict verification to a reporting window; those
+windows are resolved by binary search over a sorted game-date index.
+
+Verification lookups only accept exact names and known aliases (short team forms, unique
+surnames). A misspelled name is a discrepancy, not a match: the trigram index is consulted
+only by `suggest_team`/`suggest_player`, which name the closest known entity in error messages.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+from analyzer import compute_player_game_lines, parse_goal_participants, parse_manifest_dates
+from claim_extractor import normalize_name, team_aliases
+from name_index import NameIndex
+
+# --- CONFIGURATION & CONSTANTS ---
+OFFENDER_PATTERN = re.compile(r'#\d+\s+([^(:]+)')
+SCORE_FORMAT = re.compile(r'^\d+-\d+$')
+
+# Similarity floor for naming the closest known entity in a discrepancy message
+SUGGESTION_THRESHOLD = 0.6
+
+
+class EventPosting(NamedTuple):
+    """A single player's involvement in a recorded event."""
+    game_id: str
+    event_type: str  # 'goal' | 'penalty'
+    role: str        # 'scorer' | 'assist' | 'penalized'
+
+
+class FactIndex:
+    """
+    Hash-based lookup tables over the source-of-truth datasets.
+
+    Attributes:
+        team_aliases (Dict[str, str]): Normalized alias -> canonical normalized team name.
+        scores (Dict[FrozenSet[str], List[Tuple]]): Team pair -> [(GameID, "H-A"), ...].
+        player_events (Dict[str, List[EventPosting]]): Normalized player -> postings.
+        official_games (Dict[str, Set[str]]): Normalized official -> GameIDs.
+        team_names (NameIndex): Team aliases, plus fuzzy suggestions for unknown spellings.
+        player_names (NameIndex): Player aliases (unique surnames), plus fuzzy suggestions.
+        game_dates (pd.Series): Game dates indexed by string GameID.
+        date_keys (np.ndarray): Sorted game dates (datetime64) for range queries.
+        date_games (np.ndarray): GameIDs aligned with `date_keys`.
+        player_lines (pd.DataFrame): Per-player, per-game box scores with a normalized 'Key'.
+    """
+
+    def __init__(self):
+        self.team_aliases: Dict[str, str] = {}
+        self.scores: Dict[FrozenSet[str], List[tuple]] = {}
+        self.player_events: Dict[str, List[EventPosting]] = {}
+        self.official_games: Dict[str, Set[str]] = {}
+        self.team_names = NameIndex({})
+        self.player_names = NameIndex({})
+        self._display_names: Dict[str, str] = {}
+        self.game_dates = pd.Series(dtype='datetime64[ns]')
+        self.date_keys = np.array([], dtype='datetime64[ns]')
+        self.date_games = np.array([], dtype=object)
+        self.player_lines = pd.DataFrame(columns=['Key', 'Player', 'GameID', 'Date', 'G', 'A', 'Pts'])
+
+    @classmethod
+    def from_data(cls, details: pd.DataFrame, manifest: pd.DataFrame) -> "FactIndex":
+        """
+        Builds every lookup table in a single pass over each dataset.
+
+        Args:
+            details (pd.DataFrame): Master play-by-play dataframe.
+            manifest (pd.DataFrame): The schedule manifest.
+
+        Returns:
+            FactIndex: The populated index.
+        """
+        index = cls()
+
+        # --- TEAM PAIRS -> SCORES ---
+        for game_id, home, away, score in manifest[['GameID', 'Home', 'Away', 'Score']].itertuples(index=False):
+            if pd.isna(home) or pd.isna(away):
+                continue
+            home_key, away_key = index._register_team(home), index._register_team(away)
+            index.scores.setdefault(frozenset((home_key, away_key)), []).append(
+                (str(game_id), str(score).replace(" ", ""))
+            )
+
+        # --- PLAYERS -> EVENT POSTINGS ---
+        goals = details[details['EventType'] == 'Goal']
+        for game_id, desc in goals[['GameID', 'Description']].itertuples(index=False):
+            scorer, assists = parse_goal_participants(desc)
+            if scorer:
+                index._post(scorer, EventPosting(str(game_id), 'goal', 'scorer'))
+            for name in assists:
+                index._post(name, EventPosting(str(game_id), 'goal', 'assist'))
+
+        penalties = details[details['EventType'] == 'Penalty']
+        for game_id, desc in penalties[['GameID', 'Description']].itertuples(index=False):
+            offender = OFFENDER_PATTERN.search(str(desc))
+            if offender:
+                index._post(offender.group(1).strip(), EventPosting(str(game_id), 'penalty', 'penalized'))
+
+        # --- OFFICIALS -> GAMES ---
+        officials = details[details['EventType'] == 'Official']
+        for game_id, desc in officials[['GameID', 'Description']].itertuples(index=False):
+            name = str(desc).split(":", 1)[-1].strip()
+            if name and "forfeit" not in name.lower():
+                index.official_games.setdefault(normalize_name(name), set()).add(str(game_id))
+
+        # --- NAME INDEXES (known aliases; fuzzy suggestions for error messages) ---
+        index.team_names = NameIndex.for_teams(pd.concat([manifest['Home'], manifest['Away']]).dropna())
+        index.player_names = NameIndex.for_players(index._display_names.values())
+
+        # --- PLAYER-GAME BOX SCORES (numeric stat-line verification) ---
+        index.game_dates = parse_manifest_dates(manifest)
+        ordered = index.game_dates.dropna().sort_values(kind='stable')
+        index.date_keys = ordered.to_numpy(dtype='datetime64[ns]')
+        index.date_games = ordered.index.to_numpy()
+        lines = compute_player_game_lines(details.assign(GameID=details['GameID'].astype(str)), index.game_dates)
+        index.player_lines = lines.assign(Key=lines['Player'].map(normalize_name))
+
+        return index
+
+    def _register_team(self, team: str) -> str:
+        key = normalize_name(re.sub(r'\(.*?\)', '', str(team)))
+        for alias in team_aliases(team):
+            self.team_aliases.setdefault(alias, key)
+        return key
+
+    def _post(self, player: str, posting: EventPosting) -> None:
+        key = normalize_name(player)
+        self._display_names.setdefault(key, player)
+        self.player_events.setdefault(key, []).append(posting)
+
+    # --- LOOKUPS ---
+
+    def resolve_team(self, name: str) -> Optional[str]:
+        """
+        Maps a team name as written in a report to its canonical index key. Only exact
+        names and known aliases ("Cherry's", "Shockers") resolve; misspellings return None.
+        """
+        alias = normalize_name(re.sub(r'\(.*?\)', '', str(name)))
+        if not alias:
+            return None
+        if alias in self.team_aliases:
+            return self.team_aliases[alias]
+        canonical = self.team_names.exact(alias)
+        return self.team_aliases.get(normalize_name(re.sub(r'\(.*?\)', '', canonical))) if canonical else None
+
+    def suggest_team(self, name: str) -> Optional[str]:
+        """Closest known team for an unresolved spelling (for messages and search, never verification)."""
+        return self.team_names.best(re.sub(r'\(.*?\)', '', str(name)), threshold=SUGGESTION_THRESHOLD)
+
+    def lookup_scores(self, team_a: str, team_b: str, game_ids: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Returns every valid score string for a fixture, in both orientations ("3-2" and "2-3").
+
+        Args:
+            team_a (str): First team as written in the claim.
+            team_b (str): Second team as written in the claim.
+            game_ids (Iterable[str], optional): Restrict to these GameIDs.
+
+        Returns:
+            List[str]: Accepted score strings (empty if the fixture is unknown).
+        """
+        key_a, key_b = self.resolve_team(team_a), self.resolve_team(team_b)
+        if key_a is None or key_b is None:
+            return []
+        window = set(map(str, game_ids)) if game_ids is not None else None
+
+        valid = []
+        for game_id, score in self.scores.get(frozenset((key_a, key_b)), []):
+            if window is not None and game_id not in window:
+                continue
+            valid.append(score)
+            if SCORE_FORMAT.match(score):
+                home, away = score.split("-")
+                valid.append(f"{away}-{home}")
+        return valid
+
+    def resolve_player(self, player: str) -> Optional[str]:
+        """
+        Maps a player name as written in a report to its normalized index key. Only full
+        names and unique surnames resolve; a misspelling ("Jon Smyth") returns None.
+        """
+        key = normalize_name(player)
+        if not key:
+            return None
+        if key in self.player_events:
+            return key
+        canonical = self.player_names.exact(player)
+        return normalize_name(canonical) if canonical else None
+
+    def suggest_player(self, player: str) -> Optional[str]:
+        """Closest known player for an unresolved spelling (for messages and search, never verification)."""
+        return self.player_names.best(player, threshold=SUGGESTION_THRESHOLD)
+
+    def player_postings(self, player: str) -> List[EventPosting]:
+        """Returns all event postings for a player (empty if the name cannot be resolved)."""
+        key = self.resolve_player(player)
+        return self.player_events.get(key, []) if key else []
+
+    def has_player_event(self, player: str, event_type: str, game_ids: Optional[Iterable[str]] = None) -> bool:
+        """
+        Checks whether a player recorded a goal, assist or penalty.
+
+        Args:
+            player (str): Player name as written in the claim.
+            event_type (str): Claimed event ('goal', 'assist' or 'penalty').
+            game_ids (Iterable[str], optional): Restrict to these GameIDs.
+
+        Returns:
+            bool: True if a matching posting exists.
+        """
+        e_type = str(event_type).lower()
+        if "assist" in e_type:
+            role = 'assist'
+        elif "goal" in e_type:
+            role = 'scorer'
+        elif "penalty" in e_type:
+            role = 'penalized'
+        else:
+            return False
+
+        window = set(map(str, game_ids)) if game_ids is not None else None
+        return any(
+            p.role == role and (window is None or p.game_id in window)
+            for p in self.player_postings(player)
+        )
+
+    def games_for_official(self, name: str) -> Set[str]:
+        """Returns the GameIDs an official was assigned to (empty if unknown)."""
+        return self.official_games.get(normalize_name(name), set())
+
+    def games_between(self, start: pd.Timestamp, end: pd.Timestamp) -> Set[str]:
+        """
+        Selects the games played in the half-open date range (start, end] with two binary
+        searches over the sorted date index.
+
+        Args:
+            start (pd.Timestamp): Exclusive lower bound.
+            end (pd.Timestamp): Inclusive upper bound.
+
+        Returns:
+            Set[str]: GameIDs played inside the range.
+        """
+        lo = np.searchsorted(self.date_keys, np.datetime64(start, 'ns'), side='right')
+        hi = np.searchsorted(self.date_keys, np.datetime64(end, 'ns'), side='right')
+        return set(self.date_games[lo:hi])
+
+    def stat_totals(self, game_ids: Optional[Iterable[str]] = None,
+                    through: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        Aggregates goals, assists and points per player in one grouped pass.
+
+        Args:
+            game_ids (Iterable[str], optional): Restrict to these GameIDs.
+            through (pd.Timestamp, optional): Only count games played on or before this date.
+
+        Returns:
+            pd.DataFrame: G, A, Pts and GP indexed by normalized player key.
+        """
+        lines = self.player_lines
+        if game_ids is not None:
+            lines = lines[lines['GameID'].isin(set(map(str, game_ids)))]
+        if through is not None:
+            lines = lines[lines['Date'] <= through]
+        return lines.groupby('Key').agg(G=('G', 'sum'), A=('A', 'sum'), Pts=('Pts', 'sum'), GP=('GameID', 'nunique'))
@@ -0,0 +1,137 @@
+"""
+Combined Publication Gate
+
+Runs the factual validator and the bias audit as a single pre-publication stage. The post
+is read once and both audits start immediately on worker threads, so the gate's wall time
+is roughly the slower of the two LLM round trips instead of their sum:
+
+* A hard factual failure (discrepancies or an audit error not covered by the editorial
+  policy) cancels the bias audit: no further chunks are sent to the LLM.
+* Otherwise both verdicts are merged and routed through the editorial policy.
+
+Usage:
+    python3 src/gate.py [post] [--json] [--policy data/editorial_policy.json]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import threading
+import contextlib
+from typing import Any, Dict, Optional
+
+import validator
+import bias_checker
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_NEEDS_REVIEW, EXIT_PUBLISHABLE, apply_policy, emit_verdict, load_policy
+
+
+async def run_gate(post_path: str, policy: Optional[Dict[str, Any]] = None,
+                   context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Audits one post with both gates concurrently and merges their verdicts.
+
+    Args:
+        post_path (str): The Markdown post to audit.
+        policy (Dict, optional): Output of `gate_policy.load_policy`. Defaults to the policy file.
+        context (Dict, optional): Preloaded `validator.load_audit_context` output.
+
+    Returns:
+        Dict[str, Any]: Merged verdict ('gate', 'post', 'status', 'publishable', 'blocked_by',
+        'factual', 'bias', 'elapsed_s'). 'status' is 'pass', 'blocked' or 'error'.
+    """
+    start = time.perf_counter()
+    policy = policy if policy is not None else load_policy()
+    merged = {"gate": "publish", "post": os.path.basename(post_path), "status": "error", "publishable": False,
+              "blocked_by": [], "factual": None, "bias": None, "elapsed_s": 0.0}
+
+    # --- LOAD THE POST ONCE ---
+    try:
+        with open(post_path, "r", encoding="utf-8") as f:
+            post_text = f.read()
+    except OSError as e:
+        print(f"❌ FAIL: Could not read {post_path}: {e}")
+        merged["elapsed_s"] = round(time.perf_counter() - start, 4)
+        return merged
+
+    # --- LAUNCH BOTH AUDITS ---
+    cancel = threading.Event()
+    factual_task = asyncio.create_task(asyncio.to_thread(validator.verify_post, post_path, context, post_text))
+    bias_task = asyncio.create_task(asyncio.to_thread(bias_checker.audit_bias, post_path, None, post_text, cancel))
+
+    factual = apply_policy(await factual_task, policy)
+    if not factual["publishable"] and not bias_task.done():
+        # Short-circuit: the post cannot ship, so stop spending LLM calls on its tone.
+        # The audit stops before its next chunk request; requests already in flight finish.
+        print("⏹️  Factual gate failed; cancelling the bias audit.")
+        cancel.set()
+    bias = apply_policy(await bias_task, policy)
+
+    # --- MERGE ---
+    merged["factual"], merged["bias"] = factual, bias
+    merged["blocked_by"] = [v["gate"] for v in (factual, bias) if not v["publishable"] and v["status"] != "cancelled"]
+    merged["publishable"] = factual["publishable"] and bias["publishable"]
+    if factual["status"] == "error" or bias["status"] == "error":
+        merged["status"] = "error"
+    else:
+        merged["status"] = "pass" if merged["publishable"] else "blocked"
+    merged["elapsed_s"] = round(time.perf_counter() - start, 4)
+    return merged
+
+
+def gate_exit_code(merged: Dict[str, Any]) -> int:
+    """
+    Maps a merged verdict to an exit code. A post blocked only by the bias audit gets
+    `EXIT_NEEDS_REVIEW` so an attended run can still offer the editor-in-chief override.
+    """
+    if merged["status"] == "error":
+        return EXIT_ERROR
+    if merged["publishable"]:
+        return EXIT_PUBLISHABLE
+    return EXIT_NEEDS_REVIEW if merged["blocked_by"] == ["bias"] else EXIT_BLOCKED
+
+
+def render_gate_verdict(merged: Dict[str, Any]) -> None:
+    """Prints a one-line summary per gate and the merged outcome."""
+    print("\n" + "=" * 60)
+    print(f"🚦 PUBLICATION GATE: {merged['post']}")
+    for verdict in filter(None, (merged["factual"], merged["bias"])):
+        icon = "✅" if verdict["publishable"] else "⏹️ " if verdict["status"] == "cancelled" else "❌"
+        note = f" (override: {verdict['override']['approved_by']})" if verdict.get("override") else ""
+        print(f"{icon} {verdict['gate']:<10} {verdict['status']:<10} {verdict['elapsed_s']:.2f}s{note}")
+    print("-" * 60)
+    if merged["status"] == "error":
+        print("❌ GATE ERROR: An audit could not complete.")
+    elif merged["publishable"]:
+        print(f"🎉 GATE PASSED in {merged['elapsed_s']:.2f}s.")
+    else:
+        print(f"🛑 GATE BLOCKED by: {', '.join(merged['blocked_by'])} ({merged['elapsed_s']:.2f}s).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the factual and bias audits concurrently as one gate.")
+    parser.add_argument("post", nargs="?", help="Post to audit (defaults to the latest).")
+    parser.add_argument("--json", action="store_true", help="Print the merged verdict as JSON on stdout; logs go to stderr.")
+    parser.add_argument("--policy", default=None, help="Editorial policy file (see gate_policy).")
+    args = parser.parse_args()
+
+    # Exit codes: 0 = publishable, 1 = blocked, 2 = an audit could not run, 3 = bias review needed
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        try:
+            policy = load_policy(args.policy)
+        except ValueError as e:
+            print(f"❌ FAIL: {e}")
+            sys.exit(EXIT_ERROR)
+
+        posts = [args.post] if args.post else validator.list_posts()[-1:]
+        if not posts:
+            print("❌ FAIL: No markdown posts found in directory.")
+            sys.exit(EXIT_ERROR)
+
+        merged = asyncio.run(run_gate(posts[0], policy))
+        render_gate_verdict(merged)
+
+    if args.json:
+        emit_verdict(merged)
+    sys.exit(gate_exit_code(merged))
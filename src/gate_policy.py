@@ -0,0 +1,132 @@
+"""
+Publishing Gate Policy
+
+Shared verdict plumbing for the pre-publication gates (`validator.py` and `bias_checker.py`).
+Both gates return a JSON-serializable verdict dictionary; this module decides whether a
+verdict is publishable and maps it to a process exit code, so that the gates can run
+unattended, in batch or concurrently without grepping their console output.
+
+Editor-in-chief overrides are read from a policy file instead of an interactive prompt:
+
+    {
+      "bias": {"max_present_categories": 0, "allow_categories": []},
+      "overrides": {
+        "2026-02-28-dispatch.md": {"gates": ["bias"], "approved_by": "Editor", "reason": "Satire issue"}
+      }
+    }
+
+A missing policy file means the default policy (no tolerated categories, no overrides).
+"""
+
+import os
+import sys
+import json
+import copy
+from typing import Any, Dict, Optional
+
+# --- CONFIGURATION & CONSTANTS ---
+POLICY_FILE = "data/editorial_policy.json"
+
+# Exit codes shared by every gate CLI
+EXIT_PUBLISHABLE = 0
+EXIT_BLOCKED = 1
+EXIT_ERROR = 2
+EXIT_NEEDS_REVIEW = 3  # Combined gate only: blocked by the bias audit alone (editor may override)
+
+DEFAULT_POLICY: Dict[str, Any] = {
+    "bias": {
+        "max_present_categories": 0,  # Flagged categories tolerated without an override
+        "allow_categories": [],       # Categories the editor has opted out of entirely
+    },
+    "overrides": {},                  # Post filename -> {"gates", "approved_by", "reason"}
+}
+
+
+def load_policy(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Loads the editorial policy, filling any missing keys from `DEFAULT_POLICY`.
+
+    Args:
+        path (str, optional): Policy file. Defaults to `POLICY_FILE`.
+
+    Returns:
+        Dict[str, Any]: The effective policy.
+
+    Raises:
+        ValueError: If the file exists but is not a valid JSON object.
+    """
+    policy = copy.deepcopy(DEFAULT_POLICY)
+    path = path or POLICY_FILE
+    if not os.path.exists(path):
+        return policy
+
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            supplied = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid policy file {path}: {e}")
+    if not isinstance(supplied, dict):
+        raise ValueError(f"Invalid policy file {path}: expected a JSON object.")
+
+    policy["bias"].update(supplied.get("bias", {}))
+    policy["overrides"].update(supplied.get("overrides", {}))
+    return policy
+
+
+def find_override(policy: Dict[str, Any], post: str, gate: str) -> Optional[Dict[str, Any]]:
+    """Returns the policy override approving `post` for `gate`, if any."""
+    override = policy.get("overrides", {}).get(os.path.basename(post))
+    if not override or gate not in override.get("gates", [gate]):
+        return None
+    return override
+
+
+def apply_policy(verdict: Dict[str, Any], policy: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decides publishability for a gate verdict and records the decision on it.
+
+    Setup/extraction errors are never overridable: a gate that could not run (or was
+    cancelled) has nothing for an editor to approve.
+
+    Args:
+        verdict (Dict): A gate verdict with 'gate', 'post' and 'status' keys.
+        policy (Dict): Output of `load_policy`.
+
+    Returns:
+        Dict[str, Any]: The same verdict with 'publishable' and 'override' set.
+    """
+    verdict["override"] = None
+    if verdict["status"] in ("error", "cancelled"):
+        verdict["publishable"] = False
+        return verdict
+
+    if verdict["gate"] == "bias":
+        allowed = set(policy["bias"].get("allow_categories", []))
+        counted = [c for c in verdict.get("categories", {}) if c not in allowed]
+        publishable = len(counted) <= policy["bias"].get("max_present_categories", 0)
+    else:
+        publishable = verdict["status"] == "pass"
+
+    if not publishable:
+        override = find_override(policy, verdict["post"], verdict["gate"])
+        if override:
+            verdict["override"] = {"approved_by": override.get("approved_by"), "reason": override.get("reason")}
+            publishable = True
+
+    verdict["publishable"] = publishable
+    return verdict
+
+
+def exit_code(verdict: Dict[str, Any]) -> int:
+    """Maps a policy-applied verdict to the shared gate exit codes."""
+    if verdict["status"] == "error":
+        return EXIT_ERROR
+    return EXIT_PUBLISHABLE if verdict.get("publishable") else EXIT_BLOCKED
+
+
+def emit_verdict(verdict: Dict[str, Any], stream=None) -> None:
+    """Writes a verdict as a single JSON document (stdout by default)."""
+    stream = stream or sys.stdout
+    json.dump(verdict, stream, indent=2, ensure_ascii=False)
+    stream.write("\n")
+    stream.flush()
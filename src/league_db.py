@@ -0,0 +1,526 @@
+"""
+League Database (System of Record)
+
+An embedded SQLite database per division (`<data_dir>/league.db`) holding the schedule,
+the play-by-play telemetry and the analyzer's derived tables, with indexes on GameID,
+game date, team and player:
+
+* games      - One row per scheduled game (manifest order kept in `position`).
+* notes      - Commissioner notes by GameID, kept apart so schedule refreshes never drop them.
+* events     - Play-by-play events; a game's events are replaced as one unit, so a re-scrape
+               can never duplicate rows. Every row of one scrape carries the same batch id
+               in `scraped_at` (see `scrape_batch_id`).
+* rosters / officials - Views over `events`, served by the (event type, team/description)
+               indexes and an expression index on the parsed official name.
+* team_stats, playoff_standings, playoff_matchups, player_stats, player_game_lines
+             - Derived tables written by the analyzer (CSV column names preserved).
+
+Every write runs in one `BEGIN IMMEDIATE` transaction (WAL journal, so readers are never
+blocked). The CSVs remain as compatibility exports, refreshed inside the writing transaction,
+and a CSV changed by anything else (hand edits, `ingestor.py`, older tooling) is imported
+automatically the next time the database is opened. On import, every scrape batch of a game
+older than the latest one is dropped, and a batch appended more than once is trimmed back to
+one copy; identical rows inside one batch (two matching minors) are kept.
+
+Usage:
+    python3 src/league_db.py info              # Row counts and indexes
+    python3 src/league_db.py import [--force]  # (Re)load the CSVs into the database
+    python3 src/league_db.py export            # Rewrite the source CSVs from the database
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import contextlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+from atomic_io import append_csv_atomically, write_csv_atomically
+from leagues import active_division
+from tracing import traced
+
+# --- CONFIGURATION & CONSTANTS ---
+DIVISION = active_division()
+DB_FILE = DIVISION.data_path("league.db")
+DETAILS_FILE = DIVISION.data_path("game_details.csv")
+MANIFEST_FILE = DIVISION.data_path("games_manifest.csv")
+BUSY_TIMEOUT_S = 30
+
+# CSV column -> games/events column
+MANIFEST_COLUMNS = {
+    "GameID": "game_id", "Home": "home", "Away": "away", "Division": "division", "GameType": "game_type",
+    "Score": "score", "Date": "date", "Time": "time", "Status": "status", "Facility": "facility",
+}
+DETAILS_COLUMNS = {
+    "GameID": "game_id", "EventType": "event_type", "Team": "team", "Description": "description",
+    "Strength": "strength", "ScrapedAt": "scraped_at", "Period": "period", "Time": "time",
+}
+
+# Derived table -> (CSV export, indexed column groups)
+DERIVED_TABLES = {
+    "team_stats": (DIVISION.data_path("team_stats.csv"), [("Team",)]),
+    "playoff_standings": (DIVISION.data_path("playoff_standings.csv"), [("Team",)]),
+    "playoff_matchups": (DIVISION.data_path("playoff_matchups.csv"), []),
+    "player_stats": (DIVISION.data_path("player_stats.csv"), [("Player",), ("Team",)]),
+    "player_game_lines": (DIVISION.data_path("player_game_lines.csv"), [("Player", "Date"), ("GameID",), ("Date",)]),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY, position INTEGER NOT NULL, home TEXT, away TEXT, division TEXT,
+    game_type TEXT, score TEXT, date TEXT, game_date TEXT, time TEXT, status TEXT, facility TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_games_date ON games (game_date);
+CREATE INDEX IF NOT EXISTS idx_games_home ON games (home);
+CREATE INDEX IF NOT EXISTS idx_games_away ON games (away);
+
+CREATE TABLE IF NOT EXISTS notes (
+    game_id TEXT PRIMARY KEY, note TEXT NOT NULL, updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY, game_id TEXT NOT NULL, event_type TEXT, team TEXT, description TEXT,
+    strength TEXT, scraped_at TEXT, period TEXT, time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_game ON events (game_id);
+CREATE INDEX IF NOT EXISTS idx_events_type_team ON events (event_type, team);
+CREATE INDEX IF NOT EXISTS idx_events_type_player ON events (event_type, description);
+CREATE INDEX IF NOT EXISTS idx_events_official ON events (TRIM(SUBSTR(description, INSTR(description, ':') + 1)))
+    WHERE event_type = 'Official';
+
+CREATE VIEW IF NOT EXISTS rosters AS
+    SELECT game_id, team, description AS player FROM events WHERE event_type = 'RosterAppearance';
+CREATE VIEW IF NOT EXISTS officials AS
+    SELECT game_id,
+           TRIM(SUBSTR(description, 1, INSTR(description, ':') - 1)) AS role,
+           TRIM(SUBSTR(description, INSTR(description, ':') + 1)) AS official
+    FROM events WHERE event_type = 'Official';
+
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _stamp(path: str) -> Optional[str]:
+    """Modification time and size of a file, used to detect CSVs changed outside the database."""
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _sql_value(value: Any) -> Any:
+    """Converts pandas/numpy scalars to SQLite values (NaN and NaT become NULL)."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d') if value == value.normalize() else value.isoformat()
+    return value
+
+
+def _sql_type(dtype: Any) -> str:
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _game_dates(manifest: pd.DataFrame) -> pd.Series:
+    """ISO game dates indexed by string GameID (the analyzer's season-year imputation)."""
+    from analyzer import parse_manifest_dates
+
+    dates = parse_manifest_dates(manifest)
+    return dates.dt.strftime('%Y-%m-%d').where(dates.notna(), None)
+
+
+def scrape_batch_id() -> str:
+    """
+    A new scrape batch id, stamped on every event of one game's scrape. Ids sort in scrape
+    order, after the date-only stamps of older telemetry.
+    """
+    return datetime.now().isoformat(timespec="microseconds")
+
+
+def _single_copy_length(batch: pd.DataFrame) -> int:
+    """Length of one copy of a batch whose rows may be the same block repeated end to end."""
+    rows = list(batch.astype(str).itertuples(index=False, name=None))
+    for size in range(1, len(rows) // 2 + 1):
+        if len(rows) % size == 0 and rows == rows[:size] * (len(rows) // size):
+            return size
+    return len(rows)
+
+
+def dedupe_events(details: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drops duplicate telemetry rows: per game, every scrape batch older than the latest one (a
+    game re-scraped later), and repeated copies of one batch (a batch appended twice).
+    Identical rows within a single copy of a batch are legitimate and kept.
+    """
+    if details.empty:
+        return details
+    keys = [details['GameID'].astype(str)]
+    if 'ScrapedAt' in details.columns:
+        scraped = details['ScrapedAt'].astype(str)
+        details = details[scraped == scraped.groupby(keys[0]).transform('max')]
+        keys = [details['GameID'].astype(str), details['ScrapedAt'].astype(str)]
+
+    keep = np.ones(len(details), dtype=bool)
+    for positions in details.groupby(keys, sort=False).indices.values():
+        keep[positions[_single_copy_length(details.iloc[positions]):]] = False
+    return details[keep]
+
+
+class LeagueDB:
+    """
+    One connection to a division's league database.
+
+    Args:
+        path (str, optional): Database file. Defaults to the active division's `DB_FILE`.
+        sync (bool): Import CSVs changed outside the database before returning.
+    """
+
+    def __init__(self, path: Optional[str] = None, sync: bool = True):
+        self.path = path or DB_FILE
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly by `transaction()`. Long-lived
+        # readers (stats_service.py) share one connection across threads under their own lock.
+        self.conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if sync:
+            self.sync_from_csv()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "LeagueDB":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Runs the enclosed writes atomically (rolled back on any exception)."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    @contextlib.contextmanager
+    def read_snapshot(self):
+        """Runs the enclosed queries against one consistent view (writers are not blocked)."""
+        self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+        finally:
+            self.conn.execute("COMMIT")
+
+    def data_version(self) -> int:
+        """A counter that changes whenever another connection commits (cheap change detection)."""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    # --- META ---
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _record_csv(self, path: str) -> None:
+        """Marks a CSV as in sync with the database (call inside the writing transaction)."""
+        self._set_meta(f"csv:{path}", _stamp(path))
+
+    # --- WRITES ---
+
+    def _write_schedule(self, manifest: pd.DataFrame) -> None:
+        dates = _game_dates(manifest)
+        rows = []
+        for position, record in enumerate(manifest.to_dict(orient='records')):
+            game_id = str(record['GameID'])
+            values = [_sql_value(record.get(column)) for column in MANIFEST_COLUMNS if column != 'GameID']
+            rows.append((game_id, position, *values, dates.get(game_id)))
+        columns = ["game_id", "position"] + [c for k, c in MANIFEST_COLUMNS.items() if k != 'GameID'] + ["game_date"]
+        self.conn.execute("DELETE FROM games")
+        self.conn.executemany(f"INSERT INTO games ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+
+    def _write_events(self, details: pd.DataFrame) -> None:
+        columns = list(DETAILS_COLUMNS.values())
+        rows = [tuple(str(r['GameID']) if k == 'GameID' else _sql_value(r.get(k)) for k in DETAILS_COLUMNS)
+                for r in details.to_dict(orient='records')]
+        self.conn.executemany(f"INSERT INTO events ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+
+    def _write_table(self, name: str, df: pd.DataFrame) -> None:
+        _, indexes = DERIVED_TABLES[name]
+        columns = ", ".join(f"{_quote(str(c))} {_sql_type(df[c].dtype)}" for c in df.columns)
+        self.conn.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+        self.conn.execute(f"CREATE TABLE {_quote(name)} ({columns})")
+        for group in indexes:
+            if all(column in df.columns for column in group):
+                index_name = f"idx_{name}_{'_'.join(group).lower()}"
+                self.conn.execute(f"CREATE INDEX {_quote(index_name)} ON {_quote(name)} "
+                                  f"({', '.join(_quote(c) for c in group)})")
+        rows = [tuple(_sql_value(v) for v in row) for row in df.itertuples(index=False, name=None)]
+        self.conn.executemany(f"INSERT INTO {_quote(name)} VALUES ({', '.join('?' * len(df.columns))})", rows)
+
+    @traced()
+    def replace_schedule(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the schedule with a freshly scraped manifest. Notes live in their own table,
+        so commissioner insights survive the refresh. Re-exports the manifest CSV.
+        """
+        with self.transaction():
+            self._write_schedule(pd.DataFrame(records, columns=[c for c in MANIFEST_COLUMNS]))
+            self._export_manifest()
+
+    @traced()
+    def replace_game_events(self, game_id: Any, events: List[Dict[str, Any]]) -> None:
+        """
+        Stores a game's events, replacing any earlier scrape of the same game. A new game is
+        appended to the telemetry CSV; a replaced one re-exports it.
+        """
+        frame = pd.DataFrame(events, columns=list(DETAILS_COLUMNS))
+        with self.transaction():
+            replaced = self.conn.execute("DELETE FROM events WHERE game_id = ?", (str(game_id),)).rowcount
+            self._write_events(frame)
+            in_sync = os.path.exists(DETAILS_FILE) and self._get_meta(f"csv:{DETAILS_FILE}") == _stamp(DETAILS_FILE)
+            if replaced or not in_sync:
+                self._export_details()
+            else:
+                append_csv_atomically(frame, DETAILS_FILE, index=False)
+                self._record_csv(DETAILS_FILE)
+
+    def set_notes(self, notes: Dict[Any, str]) -> None:
+        """Saves commissioner notes by GameID in one transaction and re-exports the manifest CSV."""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.transaction():
+            self.conn.executemany("INSERT OR REPLACE INTO notes (game_id, note, updated_at) VALUES (?, ?, ?)",
+                                  [(str(gid), note, now) for gid, note in notes.items()])
+            self._export_manifest()
+
+    def replace_table(self, name: str, df: pd.DataFrame) -> None:
+        """
+        Replaces a derived table. Its CSV export is written by the caller first (the analyzer
+        keeps its atomic CSV writes), and is marked as in sync here.
+        """
+        with self.transaction():
+            self._write_table(name, df)
+            self._record_csv(DERIVED_TABLES[name][0])
+
+    # --- CSV IMPORT / EXPORT ---
+
+    def _import_manifest(self, path: str) -> None:
+        manifest = pd.read_csv(path)
+        self._write_schedule(manifest)
+        self.conn.execute("DELETE FROM notes")
+        if 'Notes' in manifest.columns:
+            notes = manifest[manifest['Notes'].notna() & (manifest['Notes'].astype(str).str.strip() != "")]
+            self.conn.executemany("INSERT OR REPLACE INTO notes (game_id, note) VALUES (?, ?)",
+                                  [(str(gid), str(note)) for gid, note in zip(notes['GameID'], notes['Notes'])])
+
+    def _import_details(self, path: str) -> int:
+        details = pd.read_csv(path)
+        deduped = dedupe_events(details)
+        self.conn.execute("DELETE FROM events")
+        self._write_events(deduped)
+        return len(details) - len(deduped)
+
+    @traced()
+    def sync_from_csv(self, force: bool = False) -> List[str]:
+        """
+        Imports every CSV that changed since the database last wrote or imported it (all of
+        them for a new database).
+
+        Args:
+            force (bool): Import every existing CSV regardless of its recorded state.
+
+        Returns:
+            List[str]: The imported CSV paths.
+        """
+        sources = [(MANIFEST_FILE, self._import_manifest), (DETAILS_FILE, self._import_details)]
+        sources += [(path, lambda p, name=name: self._write_table(name, pd.read_csv(p)))
+                    for name, (path, _) in DERIVED_TABLES.items()]
+        stale = [(path, load) for path, load in sources
+                 if os.path.exists(path) and (force or self._get_meta(f"csv:{path}") != _stamp(path))]
+        if not stale:
+            return []
+
+        with self.transaction():
+            for path, load in stale:
+                dropped = load(path)
+                if dropped:
+                    print(f"🧹 Dropped {dropped} duplicate telemetry row(s) from {path}.")
+                self._record_csv(path)
+        print(f"🗄️  League DB: imported {', '.join(os.path.basename(p) for p, _ in stale)}.")
+        return [path for path, _ in stale]
+
+    def _export_manifest(self) -> None:
+        write_csv_atomically(self.manifest(), MANIFEST_FILE, index=False)
+        self._record_csv(MANIFEST_FILE)
+
+    def _export_details(self) -> None:
+        write_csv_atomically(self.events(), DETAILS_FILE, index=False)
+        self._record_csv(DETAILS_FILE)
+
+    def export_csv(self) -> None:
+        """Rewrites the source CSVs (manifest and telemetry) from the database."""
+        with self.transaction():
+            self._export_manifest()
+            self._export_details()
+
+    # --- QUERIES ---
+
+    def _frame(self, sql: str, params: Sequence[Any] = ()) -> pd.DataFrame:
+        df = pd.read_sql_query(sql, self.conn, params=list(params))
+        # Read back exactly as pd.read_csv would: NULLs as NaN, all-digit GameIDs as integers
+        for column in df.select_dtypes(include='object').columns:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+        if 'GameID' in df.columns and not df.empty and df['GameID'].astype(str).str.fullmatch(r'\d+').all():
+            df['GameID'] = df['GameID'].astype('int64')
+        return df
+
+    @staticmethod
+    def _in_clause(column: str, values: Iterable[Any]) -> Tuple[str, List[str]]:
+        values = [str(v) for v in values]
+        return f"{column} IN ({', '.join('?' * len(values))})", values
+
+    def manifest(self, since: Optional[str] = None, until: Optional[str] = None,
+                 game_ids: Optional[Iterable[Any]] = None, team: Optional[str] = None) -> pd.DataFrame:
+        """
+        Schedule rows with the manifest CSV's columns (Notes included), in manifest order.
+
+        Args:
+            since, until (str, optional): Inclusive 'YYYY-MM-DD' game-date bounds. Games whose
+                date cannot be resolved are excluded whenever a bound is given.
+            game_ids (Iterable, optional): Restrict to these GameIDs.
+            team (str, optional): Games with this team at home or away (exact name).
+        """
+        clauses, params = [], []
+        if since:
+            clauses.append("g.game_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("g.game_date <= ?")
+            params.append(until)
+        if game_ids is not None:
+            clause, values = self._in_clause("g.game_id", game_ids)
+            clauses.append(clause)
+            params.extend(values)
+        if team:
+            clauses.append("(g.home = ? OR g.away = ?)")
+            params.extend([team, team])
+        columns = ", ".join(f"g.{column} AS {name}" for name, column in MANIFEST_COLUMNS.items())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._frame(f"SELECT {columns}, n.note AS Notes FROM games g LEFT JOIN notes n USING (game_id) "
+                           f"{where} ORDER BY g.position", params)
+
+    def events(self, game_ids: Optional[Iterable[Any]] = None, event_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Play-by-play rows with the telemetry CSV's columns, in ingestion order.
+
+        Args:
+            game_ids (Iterable, optional): Restrict to these GameIDs (index lookups).
+            event_type (str, optional): Restrict to one event type ('Goal', 'Penalty', ...).
+        """
+        clauses, params = [], []
+        if game_ids is not None:
+            clause, values = self._in_clause("game_id", game_ids)
+            clauses.append(clause)
+            params.extend(values)
+        if event_type:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        columns = ", ".join(f"{column} AS {name}" for name, column in DETAILS_COLUMNS.items())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._frame(f"SELECT {columns} FROM events {where} ORDER BY id", params)
+
+    def table(self, name: str, game_ids: Optional[Iterable[Any]] = None, **equals: Any) -> pd.DataFrame:
+        """
+        Reads a derived table, optionally filtered by column equality (e.g., `Team='Muffin Men'`).
+
+        Args:
+            name (str): One of `DERIVED_TABLES`.
+            game_ids (Iterable, optional): Restrict to these GameIDs (tables with a GameID column).
+            **equals: Column -> required value.
+
+        Returns:
+            pd.DataFrame: The rows (empty if the analyzer has not produced the table).
+        """
+        if name not in DERIVED_TABLES:
+            raise ValueError(f"Unknown derived table {name!r}.")
+        if not self.has_table(name):
+            return pd.DataFrame()
+        clauses = [f"{_quote(column)} = ?" for column in equals]
+        params = [_sql_value(v) for v in equals.values()]
+        if game_ids is not None:
+            clause, values = self._in_clause('"GameID"', game_ids)
+            clauses.append(clause)
+            params.extend(values)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._frame(f"SELECT * FROM {_quote(name)}{where}", params)
+
+    def has_table(self, name: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                 (name,)).fetchone() is not None
+
+    def scraped_game_ids(self) -> Set[str]:
+        """GameIDs with telemetry on file."""
+        return {row[0] for row in self.conn.execute("SELECT DISTINCT game_id FROM events")}
+
+    def latest_game_date(self) -> Optional[str]:
+        """The most recent resolvable game date ('YYYY-MM-DD'), if any."""
+        return self.conn.execute("SELECT MAX(game_date) FROM games").fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        """Row counts per table and view."""
+        names = ["games", "notes", "events", "rosters", "officials"]
+        names += [name for name in DERIVED_TABLES if self.has_table(name)]
+        return {name: self.conn.execute(f"SELECT COUNT(*) FROM {_quote(name)}").fetchone()[0] for name in names}
+
+
+def open_db(path: Optional[str] = None, sync: bool = True) -> LeagueDB:
+    """Opens the active division's league database (usable as a context manager)."""
+    return LeagueDB(path, sync)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the division's SQLite league database.")
+    parser.add_argument("command", choices=["info", "import", "export"])
+    parser.add_argument("--force", action="store_true", help="Import every CSV, changed or not.")
+    args = parser.parse_args()
+
+    try:
+        with open_db(sync=args.command != "import") as db:
+            if args.command == "import":
+                imported = db.sync_from_csv(force=args.force)
+                print(f"✅ {len(imported)} CSV file(s) imported into {db.path}." if imported
+                      else "✅ Database already matches the CSVs.")
+            elif args.command == "export":
+                db.export_csv()
+                print(f"✅ Exported {MANIFEST_FILE} and {DETAILS_FILE}.")
+            else:
+                print(f"🗄️  {db.path} ({DIVISION.name})")
+                for name, count in db.counts().items():
+                    print(f"   {name:<20} {count:>8} row(s)")
+                indexes = [row[0] for row in db.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%' ORDER BY name")]
+                print(f"   indexes: {', '.join(indexes)}")
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"❌ League DB error: {e}")
+        sys.exit(1)
@@ -0,0 +1,308 @@
+"""
+League & Division Registry
+
+Every division the newsroom covers is described by one `Division` entry: its schedule hub
+and boxscore URLs, the publication identity used in the reporter's prompt, team logos,
+teams excluded from the parity chart, and where its data, posts and chart live.
+
+The active division is chosen with the `LEAGUE_DIVISION` environment variable and resolved
+once, when a module is imported, so the scraper, analyzer, reporter and viz keep their plain
+module-level path constants. The built-in default division (Monday/Wednesday Low B) keeps the
+historical layout (`data/`, `docs/_posts/`, `docs/assets/images/`); every other division is
+partitioned under `data/divisions/<key>/`, `docs/_posts/<key>/` and `docs/assets/images/<key>/`.
+
+Additional divisions are registered in `data/leagues.json` (a missing file means only the
+default division). Only `key`, `name` and `hub_url` are required:
+
+    {"divisions": [
+        {"key": "high-a", "name": "Sunday High A", "short_name": "High A",
+         "hub_url": "https://www.dmhl.ca/stats#/533/scores?division_id=41980",
+         "logo_map": {"Puck Buddies": "/assets/images/high-a/puckbuddies.png"},
+         "excluded_teams": []}
+    ]}
+
+`run_divisions` runs the full publishing pipeline for many divisions at once, one worker
+process per division, so scraping (one browser per worker), analysis, reporting and the
+chart proceed in parallel and each division keeps its own incremental stage state. The LLM quota is split
+evenly between concurrent workers, since every worker has its own scheduler.
+
+Usage:
+    python3 src/leagues.py                        # List registered divisions
+    python3 src/pipeline.py --division all        # Publish every division in parallel
+    LEAGUE_DIVISION=high-a python3 src/watcher.py # Any entry point, for one division
+"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_NEEDS_REVIEW, EXIT_PUBLISHABLE
+
+# --- CONFIGURATION & CONSTANTS ---
+DIVISION_ENV = "LEAGUE_DIVISION"
+REGISTRY_FILE = os.getenv("LEAGUE_REGISTRY", "data/leagues.json")
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIVISION = "low-b"
+ALL_DIVISIONS = "all"
+
+DIVISIONS_DATA_DIR = "data/divisions"
+POSTS_ROOT = "docs/_posts"
+ASSETS_ROOT = "docs/assets/images"
+WORKER_LOG = "pipeline.log"
+
+# LLM quota shared by all concurrent workers (defaults mirror llm_scheduler)
+QUOTA_ENVS = ("LLM_RPM", "LLM_TPM")
+
+# Least to most severe, for reporting one exit code for a multi-division run
+EXIT_SEVERITY = (EXIT_PUBLISHABLE, EXIT_NEEDS_REVIEW, EXIT_BLOCKED, EXIT_ERROR)
+
+
+class Division(NamedTuple):
+    """
+    One covered division.
+
+    Attributes:
+        key (str): Short identifier used on the command line and in partition paths.
+        name (str): Full division name ('Monday/Wednesday Low B').
+        short_name (str): Name used in headlines and the championship hook ('Low B').
+        league (str): League abbreviation ('DMHL').
+        city (str): Where the league plays.
+        publication (str): Newsletter title ('The Low B Dispatch').
+        hub_url (str): Schedule/scores page scraped for the manifest.
+        boxscore_url (str): Boxscore URL template with a `{game_id}` placeholder.
+        data_dir (str): Directory holding the division's CSVs and pipeline state.
+        posts_dir (str): Jekyll posts directory for the division's dispatches.
+        assets_dir (str): Directory for the division's generated charts.
+        logo_map (Dict[str, str]): Team name -> teaser logo asset path.
+        excluded_teams (List[str]): Teams left out of the parity chart.
+    """
+    key: str
+    name: str
+    short_name: str
+    league: str
+    city: str
+    publication: str
+    hub_url: str
+    boxscore_url: str
+    data_dir: str
+    posts_dir: str
+    assets_dir: str
+    logo_map: Dict[str, str]
+    excluded_teams: List[str]
+
+    @property
+    def is_default(self) -> bool:
+        return self.key == DEFAULT_DIVISION
+
+    def data_path(self, filename: str) -> str:
+        """Path of a data file inside the division's partition."""
+        return os.path.join(self.data_dir, filename)
+
+
+# --- BUILT-IN DEFAULT ---
+DEFAULT = Division(
+    key=DEFAULT_DIVISION,
+    name="Monday/Wednesday Low B",
+    short_name="Low B",
+    league="DMHL",
+    city="Toronto",
+    publication="The Low B Dispatch",
+    hub_url="https://www.dmhl.ca/stats#/533/scores?division_id=41979",
+    boxscore_url="https://www.dmhl.ca/stats#/533/game/{game_id}/boxscore",
+    data_dir="data",
+    posts_dir=POSTS_ROOT,
+    assets_dir=ASSETS_ROOT,
+    logo_map={
+        "The Shockers": "/assets/images/theshockers.png",
+        "The Sahara": "/assets/images/thesahara.png",
+        "Don Cherry's": "/assets/images/doncherrys.png",
+        "Flat-Earthers": "/assets/images/flatearthers.png",
+        "Muffin Men": "/assets/images/muffinmen.png",
+        "4 Lines": "/assets/images/4lines.png",
+    },
+    excluded_teams=["Arctic Dolphins", "Pdiym"],
+)
+
+
+def division_from_entry(entry: Dict[str, Any]) -> Division:
+    """
+    Builds a Division from a registry entry, filling partitioned defaults for missing fields.
+    An entry using the default key overrides the built-in division but keeps its paths.
+
+    Raises:
+        ValueError: If 'key', 'name' or 'hub_url' is missing.
+    """
+    missing = [field for field in ("key", "name", "hub_url") if not entry.get(field)]
+    if missing and entry.get("key") != DEFAULT_DIVISION:
+        raise ValueError(f"Division entry {entry.get('key', '?')!r} is missing: {', '.join(missing)}")
+
+    key = entry["key"]
+    if key == DEFAULT_DIVISION:
+        return DEFAULT._replace(**{k: v for k, v in entry.items() if k in Division._fields and k not in
+                                   ("key", "data_dir", "posts_dir", "assets_dir")})
+
+    short_name = entry.get("short_name", entry["name"])
+    return Division(
+        key=key,
+        name=entry["name"],
+        short_name=short_name,
+        league=entry.get("league", DEFAULT.league),
+        city=entry.get("city", DEFAULT.city),
+        publication=entry.get("publication", f"The {short_name} Dispatch"),
+        hub_url=entry["hub_url"],
+        boxscore_url=entry.get("boxscore_url", DEFAULT.boxscore_url),
+        data_dir=entry.get("data_dir", os.path.join(DIVISIONS_DATA_DIR, key)),
+        posts_dir=entry.get("posts_dir", os.path.join(POSTS_ROOT, key)),
+        assets_dir=entry.get("assets_dir", os.path.join(ASSETS_ROOT, key)),
+        logo_map=dict(entry.get("logo_map", {})),
+        excluded_teams=list(entry.get("excluded_teams", [])),
+    )
+
+
+def load_registry(path: Optional[str] = None) -> Dict[str, Division]:
+    """
+    Loads every registered division, default first.
+
+    Args:
+        path (str, optional): Registry file. Defaults to `REGISTRY_FILE`.
+
+    Returns:
+        Dict[str, Division]: Division key -> Division.
+
+    Raises:
+        ValueError: If the registry file is malformed or repeats a key.
+    """
+    path = path or REGISTRY_FILE
+    registry = {DEFAULT_DIVISION: DEFAULT}
+    if not os.path.exists(path):
+        return registry
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f).get("divisions", [])
+    except (OSError, ValueError, AttributeError) as e:
+        raise ValueError(f"Could not read division registry {path}: {e}") from e
+
+    seen = set()
+    for entry in entries:
+        division = division_from_entry(entry)
+        if division.key in seen:
+            raise ValueError(f"Division {division.key!r} is registered twice in {path}.")
+        seen.add(division.key)
+        registry[division.key] = division
+    return registry
+
+
+def get_division(key: str, registry: Optional[Dict[str, Division]] = None) -> Division:
+    """
+    Looks up one division.
+
+    Raises:
+        ValueError: If the key is not registered.
+    """
+    registry = registry or load_registry()
+    if key not in registry:
+        raise ValueError(f"Unknown division {key!r}. Registered: {', '.join(registry)}")
+    return registry[key]
+
+
+def active_division() -> Division:
+    """Returns the division selected by `LEAGUE_DIVISION` (the default division if unset)."""
+    return get_division(os.getenv(DIVISION_ENV, "").strip() or DEFAULT_DIVISION)
+
+
+def resolve_divisions(keys: Sequence[str]) -> List[Division]:
+    """
+    Expands a command-line selection ('all' or explicit keys) into divisions.
+
+    Raises:
+        ValueError: If a key is not registered.
+    """
+    registry = load_registry()
+    if ALL_DIVISIONS in keys:
+        return list(registry.values())
+    return [get_division(key, registry) for key in dict.fromkeys(keys)]
+
+
+# --- PARALLEL EXECUTION ---
+
+def _split_quota(concurrency: int) -> Dict[str, str]:
+    """Per-worker LLM_RPM/LLM_TPM so concurrent schedulers stay within the shared API quota."""
+    from llm_scheduler import DEFAULT_RPM, DEFAULT_TPM
+
+    totals = {"LLM_RPM": int(os.getenv("LLM_RPM", DEFAULT_RPM)), "LLM_TPM": int(os.getenv("LLM_TPM", DEFAULT_TPM))}
+    return {name: str(max(1, totals[name] // max(1, concurrency))) for name in QUOTA_ENVS}
+
+
+def run_division(division: Division, argv: List[str], env: Dict[str, str]) -> Tuple[int, float, str]:
+    """
+    Runs the pipeline for one division in a fresh interpreter, with its console output
+    captured in the division's log. The division is bound through the environment before
+    any module resolves its paths.
+
+    Returns:
+        Tuple[int, float, str]: Exit code, elapsed seconds and log path.
+    """
+    os.makedirs(division.data_dir, exist_ok=True)
+    log_path = division.data_path(WORKER_LOG)
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run([sys.executable, os.path.join(SRC_DIR, "pipeline.py"), *argv],
+                              env={**os.environ, **env, DIVISION_ENV: division.key},
+                              stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT)
+    return proc.returncode, time.perf_counter() - start, log_path
+
+
+def run_divisions(divisions: List[Division], argv: List[str], workers: Optional[int] = None) -> int:
+    """
+    Runs the pipeline once per division, each in its own worker process.
+
+    Args:
+        divisions (List[Division]): Divisions to publish.
+        argv (List[str]): Pipeline arguments forwarded to every worker (without --division).
+        workers (int, optional): Concurrent workers. Defaults to one per division, capped at the CPU count.
+
+    Returns:
+        int: The most severe exit code across divisions (see `gate_policy`).
+    """
+    concurrency = max(1, min(len(divisions), workers or os.cpu_count() or 1))
+    env = _split_quota(concurrency)
+    print(f"🗂️  Publishing {len(divisions)} division(s) with {concurrency} worker(s) "
+          f"(LLM quota per worker: {env['LLM_RPM']} RPM, {env['LLM_TPM']} TPM)...")
+
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(run_division, division, argv, env): division for division in divisions}
+        for future in as_completed(futures):
+            division = futures[future]
+            try:
+                code, elapsed, log_path = future.result()
+            except OSError as e:
+                print(f"❌ {division.key:<16} could not start: {e}")
+                results.append(EXIT_ERROR)
+                continue
+            status = "✅" if code == EXIT_PUBLISHABLE else "❌"
+            print(f"{status} {division.key:<16} exit {code} in {elapsed:6.1f}s  (log: {log_path})")
+            results.append(code if code in EXIT_SEVERITY else EXIT_ERROR)
+
+    print(f"🏁 {len(divisions)} division(s) finished in {time.perf_counter() - start:.1f}s.")
+    return max(results, key=EXIT_SEVERITY.index, default=EXIT_PUBLISHABLE)
+
+
+if __name__ == "__main__":
+    try:
+        registry = load_registry()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    active = os.getenv(DIVISION_ENV, "").strip() or DEFAULT_DIVISION
+    print(f"{'KEY':<16} {'DIVISION':<28} {'DATA':<28} POSTS")
+    print("-" * 96)
+    for division in registry.values():
+        marker = "*" if division.key == active else " "
+        print(f"{marker}{division.key:<15} {division.name[:28]:<28} {division.data_dir:<28} {division.posts_dir}")
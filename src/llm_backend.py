@@ -0,0 +1,413 @@
+"""
+Pluggable LLM Backend Layer
+
+This module decouples the pipeline from a single hosted model. Every generative step
+(reporting, validation, bias auditing, scouting, backfills) talks to an `LLMBackend`
+instead of constructing its own Gemini client, which allows the same code paths to run
+against:
+
+* `GeminiBackend`   - The production Google GenAI client.
+* `FakeBackend`     - A deterministic, configurable-latency stand-in that returns
+                      schema-valid outputs for each call site (offline runs & load tests).
+* `CassetteBackend` - A record/replay layer that captures real responses to a JSON
+                      cassette and serves them back byte-for-byte without network access.
+
+The active backend is selected with the `LLM_BACKEND` environment variable
+(`gemini` | `fake` | `record` | `replay`). Backends that reach the provider are routed through
+the shared rate-limiting scheduler (see `llm_scheduler`).
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import tracing
+import llm_metrics
+from llm_scheduler import ScheduledBackend
+
+# --- CONFIGURATION & CONSTANTS ---
+DEFAULT_MODEL = "gemini-2.5-flash"
+CASSETTE_FILE = "data/llm_cassette.json"
+REQUEST_TIMEOUT_S = float(os.getenv("LLM_REQUEST_TIMEOUT_S", "120"))
+
+# Backends that spend provider quota (and therefore go through the scheduler)
+NETWORK_BACKENDS = ("gemini", "record")
+
+# Recognized call sites. Fake outputs are shaped per call site so downstream parsers succeed.
+CALL_SITES = ("reporter", "validator", "bias_checker", "scout", "backfill")
+
+BIAS_CATEGORIES = [
+    "Outcome Skew",
+    "Player Fixation",
+    "Unjustified Causality",
+    "Assumed Intent & Moral Judgment",
+    "Subjective Dismissal",
+]
+
+Contents = Union[str, List[str]]
+
+
+def flatten_contents(contents: Contents) -> str:
+    """
+    Collapses a prompt (single string or list of prompt segments) into one string.
+
+    Args:
+        contents (str | List[str]): The prompt as passed to the backend.
+
+    Returns:
+        str: The prompt segments joined by blank lines.
+    """
+    if isinstance(contents, str):
+        return contents
+    return "\n\n".join(str(part) for part in contents)
+
+
+class LLMResponse:
+    """Normalized generation result shared by every backend."""
+
+    def __init__(self, text: str, prompt_tokens: int = 0, response_tokens: int = 0,
+                 cached_tokens: int = 0, from_cache: bool = False):
+        self.text = text
+        self.prompt_tokens = prompt_tokens
+        self.response_tokens = response_tokens
+        self.cached_tokens = cached_tokens  # Prompt tokens served from the provider's context cache
+        self.from_cache = from_cache        # Served locally (cassette replay) without a provider call
+        self.retries = 0                    # Set by the scheduler
+
+
+class LLMBackend:
+    """
+    Interface implemented by every model provider.
+
+    Subclasses must implement `generate`. Streaming falls back to yielding the full
+    response as a single chunk unless the provider supports token streaming.
+    """
+    name = "base"
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        raise NotImplementedError
+
+    def generate_stream(self, contents: Contents, call_site: str = "generic",
+                        model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> Iterator[str]:
+        yield self.generate(contents, call_site=call_site, model=model, temperature=temperature).text
+
+
+# --- PRODUCTION BACKEND ---
+
+class GeminiBackend(LLMBackend):
+    """Google GenAI implementation used for live publishing."""
+    name = "gemini"
+
+    def __init__(self, api_key: Optional[str] = None):
+        from google import genai
+        from google.genai import types
+
+        api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise RuntimeError("No API Key found in environment variables.")
+        self._types = types
+        # Per-attempt HTTP timeout; retries and overall deadlines are handled by the scheduler
+        self.client = genai.Client(api_key=api_key, http_options=types.HttpOptions(timeout=int(REQUEST_TIMEOUT_S * 1000)))
+
+    def _config(self, temperature: Optional[float]):
+        if temperature is None:
+            return None
+        return self._types.GenerateContentConfig(temperature=temperature)
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        response = self.client.models.generate_content(
+            model=model, contents=contents, config=self._config(temperature)
+        )
+        usage = getattr(response, "usage_metadata", None)
+        return LLMResponse(
+            text=response.text or "",
+            prompt_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            response_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+            cached_tokens=getattr(usage, "cached_content_token_count", 0) or 0,
+        )
+
+    def generate_stream(self, contents: Contents, call_site: str = "generic",
+                        model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> Iterator[str]:
+        for chunk in self.client.models.generate_content_stream(
+            model=model, contents=contents, config=self._config(temperature)
+        ):
+            if chunk.text:
+                yield chunk.text
+
+
+# --- OFFLINE STAND-INS ---
+
+class FakeBackend(LLMBackend):
+    """
+    Deterministic stand-in that never touches the network.
+
+    Responses are derived from the prompt itself (team names and scores in the data
+    brief, report lines in audit prompts) so the full pipeline - generation, factual
+    audit and bias audit - passes end-to-end. Latency is configurable to emulate
+    realistic round trips during throughput and concurrency benchmarks.
+    """
+    name = "fake"
+
+    def __init__(self, latency: Optional[float] = None, stream_chunks: int = 8):
+        if latency is None:
+            latency = float(os.getenv("LLM_FAKE_LATENCY", "0"))
+        self.latency = latency
+        self.stream_chunks = max(1, stream_chunks)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return max(1, len(text) // 4)
+
+    @staticmethod
+    def _brief_games(prompt: str) -> List[Dict[str, Any]]:
+        """Pulls the scheduled games out of a serialized data brief, if present."""
+        start = prompt.find("DATA BRIEF:")
+        if start == -1:
+            return []
+        try:
+            brief, _ = json.JSONDecoder().raw_decode(prompt[start + len("DATA BRIEF:"):].lstrip())
+        except ValueError:
+            return []
+        return brief.get("data_sources", {}).get("schedule_and_arenas", []) or []
+
+    def _fake_report(self, prompt: str, digest: str) -> str:
+        lines = [
+            f"# The Offline Dispatch ({digest[:6]})",
+            "A deterministic stand-in report generated without a live model.",
+            "",
+            "## The Recaps",
+        ]
+        for game in self._brief_games(prompt):
+            score = str(game.get("Score", "")).replace(" ", "")
+            if re.match(r'^\d+-\d+$', score):
+                lines.append(f"- {game.get('Home')} {score} {game.get('Away')}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _fake_extraction(prompt: str) -> str:
+        matchups = []
+        for home, s1, s2, away in re.findall(r'^\s*- ([^.,!?]+) (\d+)-(\d+) ([^.,!?]+)$', prompt, re.MULTILINE):
+            matchups.append({"home": home.strip(), "away": away.strip(), "score": f"{s1}-{s2}"})
+        return json.dumps({"matchups": matchups, "events": [], "officials": []})
+
+    def _respond(self, call_site: str, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        if call_site in ("reporter", "backfill"):
+            return self._fake_report(prompt, digest)
+        if call_site == "validator":
+            return self._fake_extraction(prompt)
+        if call_site == "bias_checker":
+            return "\n".join(f"- {category}: Absent" for category in BIAS_CATEGORIES)
+        if call_site == "scout":
+            return "STANDINGS\nOffline scouting briefing. No live model was consulted."
+        return f"Offline response {digest[:12]}."
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        prompt = flatten_contents(contents)
+        if self.latency:
+            time.sleep(self.latency)
+        text = self._respond(call_site, prompt)
+        return LLMResponse(text, self._estimate_tokens(prompt), self._estimate_tokens(text))
+
+    def generate_stream(self, contents: Contents, call_site: str = "generic",
+                        model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> Iterator[str]:
+        prompt = flatten_contents(contents)
+        text = self._respond(call_site, prompt)
+        step = max(1, len(text) // self.stream_chunks)
+        for i in range(0, len(text), step):
+            if self.latency:
+                time.sleep(self.latency / self.stream_chunks)
+            yield text[i:i + step]
+
+
+class CassetteBackend(LLMBackend):
+    """
+    Record/replay layer keyed by a hash of (model, prompt, temperature).
+
+    In 'record' mode every call is forwarded to the wrapped backend and the response is
+    persisted. In 'replay' mode responses are served from the cassette and a miss raises
+    a KeyError, so offline runs fail loudly instead of silently diverging.
+    """
+    name = "cassette"
+
+    def __init__(self, mode: str = "replay", path: Optional[str] = None,
+                 inner: Optional[LLMBackend] = None, latency: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode requires an inner backend.")
+        self.mode = mode
+        self.path = path or os.getenv("LLM_CASSETTE", CASSETTE_FILE)
+        self.inner = inner
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def cassette_key(contents: Contents, model: str, temperature: Optional[float]) -> str:
+        payload = json.dumps([model, flatten_contents(contents), temperature], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        key = self.cassette_key(contents, model, temperature)
+
+        if self.mode == "replay":
+            entry = self.entries.get(key)
+            if entry is None:
+                raise KeyError(f"Cassette miss for {call_site} call ({key[:12]}). Re-record with LLM_BACKEND=record.")
+            if self.latency:
+                time.sleep(self.latency)
+            return LLMResponse(entry["text"], entry.get("prompt_tokens", 0), entry.get("response_tokens", 0),
+                               from_cache=True)
+
+        response = self.inner.generate(contents, call_site=call_site, model=model, temperature=temperature)
+        with self._lock:
+            self.entries[key] = {
+                "call_site": call_site,
+                "model": model,
+                "text": response.text,
+                "prompt_tokens": response.prompt_tokens,
+                "response_tokens": response.response_tokens,
+            }
+            self._save()
+        return response
+
+
+# --- FACTORY ---
+
+def get_backend(kind: Optional[str] = None) -> LLMBackend:
+    """
+    Builds the backend selected by `kind` or the `LLM_BACKEND` environment variable.
+
+    Args:
+        kind (str, optional): One of 'gemini', 'fake', 'record' or 'replay'.
+
+    Returns:
+        LLMBackend: The configured backend instance.
+    """
+    kind = (kind or os.getenv("LLM_BACKEND", "gemini")).strip().lower()
+    if kind == "gemini":
+        return GeminiBackend()
+    if kind == "fake":
+        return FakeBackend()
+    if kind == "record":
+        return CassetteBackend(mode="record", inner=GeminiBackend())
+    if kind == "replay":
+        return CassetteBackend(mode="replay", latency=float(os.getenv("LLM_FAKE_LATENCY", "0")))
+    raise ValueError(f"Unknown LLM_BACKEND '{kind}'. Expected gemini, fake, record or replay.")
+
+
+# --- INSTRUMENTATION ---
+
+class TracedBackend(LLMBackend):
+    """
+    Wraps a backend so every call is recorded as an 'llm' span carrying its token usage
+    (see `tracing`) and appended to the usage metrics log (see `llm_metrics`).
+    """
+
+    def __init__(self, inner: LLMBackend):
+        self.inner = inner
+        self.name = inner.name
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        start = time.perf_counter()
+        with tracing.span(f"llm.{call_site}", "llm", model=model, backend=self.name):
+            try:
+                response = self.inner.generate(contents, call_site=call_site, model=model, temperature=temperature)
+            except Exception as e:
+                llm_metrics.record_call(call_site, self.name, model, time.perf_counter() - start, error=type(e).__name__)
+                raise
+            tracing.record_tokens(response.prompt_tokens, response.response_tokens)
+        llm_metrics.record_call(call_site, self.name, model, time.perf_counter() - start, response.prompt_tokens,
+                                response.response_tokens, response.cached_tokens, response.retries,
+                                cache="hit" if response.from_cache else "miss")
+        return response
+
+    def generate_stream(self, contents: Contents, call_site: str = "generic",
+                        model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> Iterator[str]:
+        # Streams do not report usage; the span records the streamed length instead
+        start = time.perf_counter()
+        with tracing.span(f"llm.{call_site}", "llm", model=model, backend=self.name, streamed=True) as span:
+            streamed_chars = 0
+            try:
+                for piece in self.inner.generate_stream(contents, call_site=call_site, model=model,
+                                                        temperature=temperature):
+                    streamed_chars += len(piece)
+                    yield piece
+            except Exception as e:
+                llm_metrics.record_call(call_site, self.name, model, time.perf_counter() - start,
+                                        streamed=True, error=type(e).__name__)
+                raise
+            if span is not None:
+                span.annotate(response_chars=streamed_chars)
+        llm_metrics.record_call(call_site, self.name, model, time.perf_counter() - start, streamed=True)
+
+
+# --- LAZY, SHARED INSTANCES ---
+
+_shared_backends: Dict[str, LLMBackend] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_backend(kind: Optional[str] = None) -> LLMBackend:
+    """
+    Returns one process-wide backend per kind, building it on first request. Provider-backed
+    kinds are wrapped in the shared scheduler so every module draws on the same quota.
+
+    Args:
+        kind (str, optional): As for `get_backend`; defaults to `LLM_BACKEND`.
+
+    Returns:
+        LLMBackend: The cached backend instance, wrapped in a `TracedBackend`.
+    """
+    kind = (kind or os.getenv("LLM_BACKEND", "gemini")).strip().lower()
+    with _shared_lock:
+        if kind not in _shared_backends:
+            backend = get_backend(kind)
+            if kind in NETWORK_BACKENDS:
+                backend = ScheduledBackend(backend)
+            _shared_backends[kind] = TracedBackend(backend)
+        return _shared_backends[kind]
+
+
+class LazyBackend(LLMBackend):
+    """
+    Module-level stand-in for a backend. The provider SDK import and client construction
+    are deferred to the first generation call, so importing a module (or running one of
+    its LLM-free code paths) never pays for them.
+    """
+    name = "lazy"
+
+    def __init__(self, kind: Optional[str] = None):
+        self._kind = kind
+
+    @property
+    def backend(self) -> LLMBackend:
+        return shared_backend(self._kind)
+
+    def generate(self, contents: Contents, call_site: str = "generic",
+                 model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> LLMResponse:
+        return self.backend.generate(contents, call_site=call_site, model=model, temperature=temperature)
+
+    def generate_stream(self, contents: Contents, call_site: str = "generic",
+                        model: str = DEFAULT_MODEL, temperature: Optional[float] = None) -> Iterator[str]:
+        return self.backend.generate_stream(contents, call_site=call_site, model=model, temperature=temperature)
@@ -0,0 +1,252 @@
+"""
+LLM Usage Telemetry
+
+Every LLM call made through the shared backend (reporter, validator, bias_checker, scout,
+backfill) is appended to `data/llm_metrics.jsonl` with its call site, model, prompt and
+response token counts (from the provider's usage metadata), end-to-end latency (including
+time queued for quota), retry count, cache status and estimated cost. Bias-audit chunks
+served from the verdict cache and cassette replays are recorded as cache hits.
+
+The CLI reports latency/token percentiles per call site and week-over-week trends, flagging
+call sites whose prompts are growing quickly (brief bloat as the season accumulates):
+
+    python3 src/llm_metrics.py [--since 2026-01-01] [--site reporter] [--weeks 8]
+
+Recording is disabled with `LLM_METRICS=0`; `LLM_METRICS_FILE` relocates the log. The offline
+fake backend is never recorded, so load tests do not pollute the history.
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+# --- CONFIGURATION & CONSTANTS ---
+METRICS_FILE = os.getenv("LLM_METRICS_FILE", "data/llm_metrics.jsonl")
+UNRECORDED_BACKENDS = {"fake"}
+
+# USD per million tokens: (input, output, cached input). List prices; update when they change.
+PRICING = {
+    "gemini-2.5-flash": (0.30, 2.50, 0.075),
+}
+
+PERCENTILES = (50, 90, 99)
+PROMPT_BLOAT_THRESHOLD = 0.20  # Week-over-week growth in mean prompt tokens worth flagging
+
+_write_lock = threading.Lock()
+
+
+def metrics_enabled() -> bool:
+    return os.getenv("LLM_METRICS", "1") != "0"
+
+
+def estimate_cost(model: str, prompt_tokens: int, response_tokens: int, cached_tokens: int = 0) -> Optional[float]:
+    """
+    Estimates the USD cost of one call from list prices.
+
+    Returns:
+        float | None: Cost in USD, or None for models without a price entry.
+    """
+    prices = PRICING.get(model)
+    if prices is None:
+        return None
+    input_price, output_price, cached_price = prices
+    billed_prompt = max(0, prompt_tokens - cached_tokens)
+    return (billed_prompt * input_price + cached_tokens * cached_price + response_tokens * output_price) / 1e6
+
+
+def append_records(records: List[Dict[str, Any]], path: Optional[str] = None) -> None:
+    """Appends records as JSON lines (one write per batch, serialized across threads)."""
+    if not records or not metrics_enabled():
+        return
+    path = path or METRICS_FILE
+    payload = "".join(json.dumps(record) + "\n" for record in records)
+    with _write_lock:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+
+def record_call(call_site: str, backend: str, model: str, latency_s: float, prompt_tokens: int = 0,
+                response_tokens: int = 0, cached_tokens: int = 0, retries: int = 0, cache: str = "miss",
+                streamed: bool = False, error: Optional[str] = None) -> None:
+    """
+    Records one LLM call.
+
+    Args:
+        call_site (str): The module issuing the call ('reporter', 'validator', ...).
+        backend (str): Backend name ('gemini', 'cassette', ...). Fake calls are not recorded.
+        model (str): Model identifier.
+        latency_s (float): End-to-end latency, including time queued for quota and retries.
+        prompt_tokens (int): Prompt tokens from usage metadata.
+        response_tokens (int): Response tokens from usage metadata.
+        cached_tokens (int): Prompt tokens served from the provider's context cache.
+        retries (int): Retries performed by the scheduler.
+        cache (str): 'hit' when served from a local cache or cassette, else 'miss'.
+        streamed (bool): Streamed generations report no usage metadata.
+        error (str, optional): Exception type if the call failed.
+    """
+    if backend in UNRECORDED_BACKENDS:
+        return
+    append_records([{
+        "ts": datetime.now().isoformat(timespec="seconds"), "call_site": call_site, "backend": backend,
+        "model": model, "latency_ms": round(latency_s * 1000, 1), "prompt_tokens": prompt_tokens,
+        "response_tokens": response_tokens, "cached_tokens": cached_tokens, "retries": retries, "cache": cache,
+        "streamed": streamed, "error": error,
+        "cost_usd": None if cache == "hit" or error else estimate_cost(model, prompt_tokens, response_tokens, cached_tokens),
+    }])
+
+
+def record_cache_hits(call_site: str, count: int, backend: str, model: str = "") -> None:
+    """Records `count` LLM calls avoided by a local verdict cache (for the given backend)."""
+    if count <= 0 or backend in UNRECORDED_BACKENDS:
+        return
+    now = datetime.now().isoformat(timespec="seconds")
+    append_records([{
+        "ts": now, "call_site": call_site, "backend": backend, "model": model, "latency_ms": 0.0,
+        "prompt_tokens": 0, "response_tokens": 0, "cached_tokens": 0, "retries": 0, "cache": "hit",
+        "streamed": False, "error": None, "cost_usd": 0.0,
+    } for _ in range(count)])
+
+
+# --- REPORTING ---
+
+def load_records(path: Optional[str] = None, since: Optional[str] = None,
+                 site: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Reads the metrics log, skipping malformed lines and applying the filters."""
+    path = path or METRICS_FILE
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if since and record.get("ts", "") < since:
+                continue
+            if site and record.get("call_site") != site:
+                continue
+            records.append(record)
+    return records
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for an empty list)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize_by_site(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregates records per call site.
+
+    Returns:
+        Dict[str, Dict]: calls, cache hit rate, error/retry counts, latency and prompt-token
+        percentiles (over live calls only), mean response tokens and total estimated cost.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        groups.setdefault(record.get("call_site", "generic"), []).append(record)
+
+    summary = {}
+    for site, rows in sorted(groups.items()):
+        live = [r for r in rows if r.get("cache") != "hit" and not r.get("error")]
+        latencies = [r["latency_ms"] for r in live]
+        prompts = [r["prompt_tokens"] for r in live if not r.get("streamed")]
+        summary[site] = {
+            "calls": len(rows),
+            "cache_hit_rate": sum(r.get("cache") == "hit" for r in rows) / len(rows),
+            "errors": sum(bool(r.get("error")) for r in rows),
+            "retries": sum(r.get("retries", 0) for r in rows),
+            "latency_ms": {p: percentile(latencies, p) for p in PERCENTILES},
+            "prompt_tokens": {p: percentile(prompts, p) for p in PERCENTILES},
+            "mean_response_tokens": sum(r["response_tokens"] for r in live) / len(live) if live else 0.0,
+            "cost_usd": sum(r.get("cost_usd") or 0.0 for r in rows),
+        }
+    return summary
+
+
+def iso_week(ts: str) -> str:
+    year, week, _ = datetime.fromisoformat(ts).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def weekly_trends(records: Iterable[Dict[str, Any]], weeks: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Per call site, one row per ISO week (most recent `weeks`): live calls, mean prompt tokens,
+    median latency, cost and prompt growth versus the previous week.
+    """
+    cutoff = iso_week((datetime.now() - timedelta(weeks=weeks)).isoformat())
+    buckets: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for record in records:
+        if record.get("cache") == "hit" or record.get("error"):
+            continue
+        week = iso_week(record["ts"])
+        if week > cutoff:
+            buckets.setdefault(record.get("call_site", "generic"), {}).setdefault(week, []).append(record)
+
+    trends = {}
+    for site, by_week in sorted(buckets.items()):
+        rows, previous_prompt = [], None
+        for week, rows_in_week in sorted(by_week.items()):
+            prompts = [r["prompt_tokens"] for r in rows_in_week if not r.get("streamed")]
+            mean_prompt = sum(prompts) / len(prompts) if prompts else None
+            growth = (mean_prompt / previous_prompt - 1) if mean_prompt and previous_prompt else None
+            rows.append({
+                "week": week, "calls": len(rows_in_week), "mean_prompt_tokens": mean_prompt,
+                "p50_latency_ms": percentile([r["latency_ms"] for r in rows_in_week], 50),
+                "cost_usd": sum(r.get("cost_usd") or 0.0 for r in rows_in_week), "prompt_growth": growth,
+            })
+            previous_prompt = mean_prompt or previous_prompt
+        trends[site] = rows
+    return trends
+
+
+def _fmt(value: Optional[float], suffix: str = "") -> str:
+    return "—" if value is None else f"{value:,.0f}{suffix}"
+
+
+def print_report(records: List[Dict[str, Any]], weeks: int = 8) -> None:
+    """Prints the per-site percentile table followed by the weekly trends."""
+    print(f"📈 LLM USAGE: {len(records)} call(s) from {records[0]['ts'][:10]} to {records[-1]['ts'][:10]}\n")
+    print(f"{'CALL SITE':<14} {'CALLS':>6} {'CACHE':>6} {'RETRY':>6} {'ERR':>4} "
+          f"{'LAT p50/p90/p99 (ms)':>24} {'PROMPT TOK p50/p90/p99':>24} {'RESP':>6} {'COST':>9}")
+    print("-" * 108)
+    for site, s in summarize_by_site(records).items():
+        latency = "/".join(_fmt(s["latency_ms"][p]) for p in PERCENTILES)
+        prompt = "/".join(_fmt(s["prompt_tokens"][p]) for p in PERCENTILES)
+        print(f"{site:<14} {s['calls']:>6} {s['cache_hit_rate']:>6.0%} {s['retries']:>6} {s['errors']:>4} "
+              f"{latency:>24} {prompt:>24} {s['mean_response_tokens']:>6.0f} ${s['cost_usd']:>8.4f}")
+
+    print(f"\n🗓️  WEEKLY TRENDS (last {weeks} weeks)")
+    for site, rows in weekly_trends(records, weeks).items():
+        print(f"\n{site}")
+        for row in rows:
+            growth = row["prompt_growth"]
+            flag = " ⚠️ prompt growth" if growth is not None and growth > PROMPT_BLOAT_THRESHOLD else ""
+            delta = f"{growth:+.0%}" if growth is not None else ""
+            print(f"  {row['week']}  {row['calls']:>4} calls  prompt {_fmt(row['mean_prompt_tokens']):>7} tok {delta:>6}"
+                  f"  p50 {_fmt(row['p50_latency_ms'], 'ms'):>8}  ${row['cost_usd']:.4f}{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report LLM latency, token and cost percentiles per call site.")
+    parser.add_argument("--file", default=None, help=f"Metrics log (default: {METRICS_FILE}).")
+    parser.add_argument("--since", default=None, help="Only include calls on or after this date (YYYY-MM-DD).")
+    parser.add_argument("--site", default=None, help="Only include one call site.")
+    parser.add_argument("--weeks", type=int, default=8, help="Weeks of trend history to show.")
+    args = parser.parse_args()
+
+    records = load_records(args.file, args.since, args.site)
+    if not records:
+        print(f"❌ No LLM metrics recorded in {args.file or METRICS_FILE}.")
+        sys.exit(1)
+    print_report(records, args.weeks)
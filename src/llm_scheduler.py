@@ -0,0 +1,388 @@
+"""
+Shared LLM Call Scheduler
+
+Every model request in the process (report drafting, fact extraction, bias audits,
+backfills, scouting) is admitted through one scheduler, so concurrent work shares the
+provider quota instead of tripping it:
+
+* Rate limiting: a request bucket (RPM) and a token bucket (TPM). Token costs are estimated
+  from the prompt on admission and reconciled with the reported usage afterwards.
+* Priorities: the publish gate and report (`PRIORITY_PUBLISH`) are admitted before
+  backfills (`PRIORITY_BACKFILL`), which are admitted before scouting (`PRIORITY_SCOUTING`).
+* Retries: rate-limit, overload and transient network errors are retried with full-jitter
+  exponential backoff (honoring a server-provided retry delay). A 429 also drains the
+  request bucket, so every queued caller slows down together.
+* Deadlines: each request has an overall deadline covering queueing and retries, after
+  which `DeadlineExceeded` is raised instead of waiting indefinitely.
+* Ledger: requests, retries, failures, tokens and time spent queued or backing off are
+  accounted per call site for the run (`ledger_snapshot`, `print_ledger`).
+
+Limits default to the Gemini Flash free tier and are configured with `LLM_RPM` / `LLM_TPM`
+(0 disables a bucket) and `LLM_MAX_IN_FLIGHT`.
+"""
+
+import os
+import re
+import sys
+import time
+import heapq
+import random
+import itertools
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# --- CONFIGURATION & CONSTANTS ---
+DEFAULT_RPM = 10
+DEFAULT_TPM = 250_000
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# Share of each per-minute limit available as an instant burst. The refill rate covers the
+# rest, so no 60-second window can exceed the limit (burst + refill = limit).
+BURST_FRACTION = 0.2
+
+PRIORITY_PUBLISH = 0
+PRIORITY_BACKFILL = 1
+PRIORITY_SCOUTING = 2
+
+CALL_SITE_PRIORITY = {
+    "reporter": PRIORITY_PUBLISH,
+    "validator": PRIORITY_PUBLISH,
+    "bias_checker": PRIORITY_PUBLISH,
+    "backfill": PRIORITY_BACKFILL,
+    "scout": PRIORITY_SCOUTING,
+}
+
+# Overall deadline (queueing + retries) per priority class, in seconds
+PRIORITY_DEADLINE_S = {
+    PRIORITY_PUBLISH: 10 * 60,
+    PRIORITY_BACKFILL: 30 * 60,
+    PRIORITY_SCOUTING: 15 * 60,
+}
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_S = 2.0
+BACKOFF_CAP_S = 60.0
+RESPONSE_TOKEN_ESTIMATE = 1024  # Reserved per request until the real usage is known
+CHARS_PER_TOKEN = 4
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_MARKERS = ("RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "overloaded", "rate limit",
+                     "timed out", "connection reset")
+RETRY_DELAY_PATTERN = re.compile(r"retry[_ ]?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request could not complete (including retries) before its deadline."""
+
+
+class TokenBucket:
+    """
+    Continuously refilling bucket. `amount` may exceed the capacity (a very long prompt);
+    such requests wait for a full bucket and then drive the level negative, so later
+    requests pay the debt back before being admitted.
+    """
+
+    def __init__(self, per_minute: float, burst_fraction: float = BURST_FRACTION):
+        self.capacity = max(1.0, per_minute * burst_fraction)
+        self.rate = per_minute * (1 - burst_fraction) / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` (capped at the capacity) is available."""
+        self._refill(now)
+        shortfall = min(amount, self.capacity) - self.level
+        return 0.0 if shortfall <= 0 else shortfall / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= amount
+
+    def drain(self, now: float) -> None:
+        """Empties the bucket (used when the provider reports a rate limit)."""
+        self._refill(now)
+        self.level = min(self.level, 0.0)
+
+
+def estimate_tokens(contents: Any) -> int:
+    """Rough token cost of a prompt plus the reserved response allowance."""
+    text = contents if isinstance(contents, str) else "\n\n".join(str(part) for part in contents)
+    return len(text) // CHARS_PER_TOKEN + RESPONSE_TOKEN_ESTIMATE
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate limits, overloads, timeouts and dropped connections are worth retrying."""
+    if isinstance(error, (TimeoutError, ConnectionError)) and not isinstance(error, DeadlineExceeded):
+        return True
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if code in RETRYABLE_STATUS_CODES:
+        return True
+    message = str(error)
+    return any(marker.lower() in message.lower() for marker in RETRYABLE_MARKERS) or " 429" in message
+
+
+def is_rate_limit(error: BaseException) -> bool:
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    return code == 429 or "RESOURCE_EXHAUSTED" in str(error)
+
+
+def server_retry_delay(error: BaseException) -> Optional[float]:
+    """Extracts the provider's suggested retry delay (e.g., `retryDelay: '34s'`), if any."""
+    match = RETRY_DELAY_PATTERN.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+class LLMScheduler:
+    """
+    Admits LLM requests in priority order within the configured rate limits.
+
+    Args:
+        rpm (int): Requests per minute (0 disables the request bucket).
+        tpm (int): Tokens per minute (0 disables the token bucket).
+        max_in_flight (int): Maximum concurrent requests.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        self.requests = TokenBucket(rpm) if rpm > 0 else None
+        self.tokens = TokenBucket(tpm) if tpm > 0 else None
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._waiting: list = []
+        self._sequence = itertools.count()
+        self._ledger: Dict[str, Dict[str, float]] = {}
+
+    # --- ADMISSION ---
+
+    def _admission_wait(self, cost: int, now: float) -> Optional[float]:
+        """Seconds until a request of `cost` tokens may start (None: blocked on concurrency)."""
+        if self.in_flight >= self.max_in_flight:
+            return None
+        waits = [0.0]
+        if self.requests:
+            waits.append(self.requests.wait_time(1, now))
+        if self.tokens:
+            waits.append(self.tokens.wait_time(cost, now))
+        return max(waits)
+
+    def _admit(self, priority: int, cost: int, deadline: float) -> None:
+        ticket = (priority, next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    if now >= deadline:
+                        raise DeadlineExceeded("LLM request deadline passed while queued for quota.")
+                    wait = None
+                    if self._waiting[0] == ticket:
+                        wait = self._admission_wait(cost, now)
+                        if wait == 0.0:
+                            if self.requests:
+                                self.requests.take(1, now)
+                            if self.tokens:
+                                self.tokens.take(cost, now)
+                            self.in_flight += 1
+                            return
+                    timeout = deadline - now if wait is None else min(wait, deadline - now)
+                    self._cond.wait(timeout)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def _release(self, reserved: int, used: Optional[int], rate_limited: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if self.tokens and used is not None:
+                # Reconcile the estimate with the provider-reported usage
+                self.tokens.take(used - reserved, now)
+            if rate_limited and self.requests:
+                self.requests.drain(now)
+            self._cond.notify_all()
+
+    # --- LEDGER ---
+
+    def _account(self, call_site: str, **deltas: float) -> None:
+        with self._cond:
+            entry = self._ledger.setdefault(call_site, {
+                "requests": 0, "attempts": 0, "retries": 0, "failures": 0, "deadline_exceeded": 0,
+                "prompt_tokens": 0, "response_tokens": 0, "queued_s": 0.0, "backoff_s": 0.0,
+            })
+            for key, value in deltas.items():
+                entry[key] += value
+
+    def ledger_snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-call-site usage for this run."""
+        with self._cond:
+            return {site: dict(entry) for site, entry in self._ledger.items()}
+
+    # --- EXECUTION ---
+
+    def call(self, fn: Callable[[], Any], call_site: str = "generic", contents: Any = "",
+             priority: Optional[int] = None, deadline_s: Optional[float] = None,
+             usage: Optional[Callable[[Any], Optional[int]]] = None) -> Any:
+        """
+        Runs `fn` once admitted, retrying transient failures until the deadline.
+
+        Args:
+            fn (Callable): The provider call (no arguments).
+            call_site (str): Ledger key and default priority source.
+            contents: The prompt, used to estimate the token cost.
+            priority (int, optional): Overrides the call site's priority class.
+            deadline_s (float, optional): Overall deadline; defaults to the priority's.
+            usage (Callable, optional): Extracts the actual token usage from `fn`'s result.
+
+        Returns:
+            Any: `fn`'s result.
+
+        Raises:
+            DeadlineExceeded: If the request did not complete before its deadline.
+            Exception: The last error, when it is not retryable or attempts run out.
+        """
+        result, cost = self._acquire(fn, call_site, contents, priority, deadline_s)
+        used = usage(result) if usage else None
+        self._release(cost, used or None, False)
+        return result
+
+    def _acquire(self, fn: Callable[[], Any], call_site: str, contents: Any, priority: Optional[int],
+                 deadline_s: Optional[float]) -> Tuple[Any, int]:
+        """
+        Runs `fn` once admitted, retrying like `call`, and leaves its in-flight slot held.
+
+        Returns:
+            Tuple[Any, int]: `fn`'s result and the reserved token cost (pass it to `_release`).
+        """
+        priority = CALL_SITE_PRIORITY.get(call_site, PRIORITY_SCOUTING) if priority is None else priority
+        deadline = time.monotonic() + (deadline_s or PRIORITY_DEADLINE_S.get(priority, PRIORITY_DEADLINE_S[PRIORITY_SCOUTING]))
+        cost = estimate_tokens(contents)
+        self._account(call_site, requests=1)
+
+        attempt = 0
+        while True:
+            queued_at = time.monotonic()
+            try:
+                self._admit(priority, cost, deadline)
+            except DeadlineExceeded:
+                self._account(call_site, deadline_exceeded=1, failures=1)
+                raise
+            self._account(call_site, attempts=1, queued_s=time.monotonic() - queued_at)
+
+            try:
+                return fn(), cost
+            except Exception as e:
+                rate_limited = is_rate_limit(e)
+                self._release(cost, None, rate_limited)
+                attempt += 1
+                if not is_retryable(e) or attempt == MAX_ATTEMPTS:
+                    self._account(call_site, failures=1)
+                    raise
+                delay = random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2 ** (attempt - 1)))
+                delay = max(delay, server_retry_delay(e) or 0.0)
+                if delay >= deadline - time.monotonic():
+                    self._account(call_site, deadline_exceeded=1, failures=1)
+                    raise DeadlineExceeded(f"LLM request deadline reached while retrying: {e}") from e
+                print(f"⏳ {call_site}: {type(e).__name__} ({'rate limited' if rate_limited else 'transient'}); "
+                      f"retry {attempt}/{MAX_ATTEMPTS - 1} in {delay:.1f}s", file=sys.stderr)
+                self._account(call_site, retries=1, backoff_s=delay)
+                time.sleep(delay)
+
+    def stream(self, open_stream: Callable[[], Iterator[str]], call_site: str = "generic",
+               contents: Any = "", priority: Optional[int] = None) -> Iterator[str]:
+        """
+        Admits a streamed generation. Opening the stream and receiving its first chunk are
+        retried like `call`; once text has been yielded, errors propagate to the consumer.
+        The in-flight slot is held until the stream is exhausted, fails or is closed.
+        """
+        first, cost = self._acquire(lambda: _first_chunk(open_stream), call_site, contents, priority, None)
+        rate_limited = False
+        try:
+            if first is not None:
+                iterator, chunk = first
+                yield chunk
+                yield from iterator
+        except Exception as e:
+            rate_limited = is_rate_limit(e)
+            raise
+        finally:
+            self._release(cost, None, rate_limited)
+
+
+def _first_chunk(open_stream: Callable[[], Iterator[str]]):
+    iterator = iter(open_stream())
+    for chunk in iterator:
+        return iterator, chunk
+    return None
+
+
+class ScheduledBackend:
+    """Routes a backend's calls through the shared scheduler (same interface as `LLMBackend`)."""
+
+    def __init__(self, inner, scheduler: Optional[LLMScheduler] = None):
+        self.inner = inner
+        self.name = inner.name
+        self.scheduler = scheduler or get_scheduler()
+
+    def generate(self, contents, call_site: str = "generic", model: Optional[str] = None,
+                 temperature: Optional[float] = None):
+        kwargs = {"call_site": call_site, "temperature": temperature, **({"model": model} if model else {})}
+        attempts = 0
+
+        def attempt():
+            nonlocal attempts
+            attempts += 1
+            return self.inner.generate(contents, **kwargs)
+
+        response = self.scheduler.call(attempt, call_site, contents,
+                                       usage=lambda r: (r.prompt_tokens + r.response_tokens) or None)
+        response.retries = attempts - 1
+        self.scheduler._account(call_site, prompt_tokens=response.prompt_tokens, response_tokens=response.response_tokens)
+        return response
+
+    def generate_stream(self, contents, call_site: str = "generic", model: Optional[str] = None,
+                        temperature: Optional[float] = None) -> Iterator[str]:
+        kwargs = {"call_site": call_site, "temperature": temperature, **({"model": model} if model else {})}
+        return self.scheduler.stream(lambda: self.inner.generate_stream(contents, **kwargs), call_site, contents)
+
+
+# --- PROCESS-WIDE INSTANCE ---
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Returns the process-wide scheduler, configured from LLM_RPM / LLM_TPM / LLM_MAX_IN_FLIGHT."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler(
+                rpm=int(os.getenv("LLM_RPM", DEFAULT_RPM)),
+                tpm=int(os.getenv("LLM_TPM", DEFAULT_TPM)),
+                max_in_flight=int(os.getenv("LLM_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)),
+            )
+        return _scheduler
+
+
+def ledger_snapshot() -> Dict[str, Dict[str, float]]:
+    """The process-wide scheduler's per-call-site ledger (empty if no LLM call was made)."""
+    return _scheduler.ledger_snapshot() if _scheduler is not None else {}
+
+
+def print_ledger(stream=None) -> None:
+    """Prints the run's quota ledger, if any request went through the scheduler."""
+    ledger = ledger_snapshot()
+    if not ledger:
+        return
+    stream = stream or sys.stdout
+    print(f"\n{'CALL SITE':<14} {'REQ':>5} {'RETRY':>6} {'FAIL':>5} {'PROMPT TOK':>11} {'RESP TOK':>9} {'QUEUED':>8} {'BACKOFF':>8}", file=stream)
+    print("-" * 74, file=stream)
+    for site, entry in sorted(ledger.items()):
+        print(f"{site:<14} {entry['requests']:>5} {entry['retries']:>6} {entry['failures']:>5} "
+              f"{entry['prompt_tokens']:>11} {entry['response_tokens']:>9} {entry['queued_s']:>7.1f}s {entry['backoff_s']:>7.1f}s",
+              file=stream)
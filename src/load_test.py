@@ -0,0 +1,102 @@
+"""
+Offline Pipeline Load Test
+
+Benchmarks end-to-end throughput (generation -> factual audit -> bias audit) against the
+local `FakeBackend` or a recorded cassette, so pipeline concurrency can be measured on a
+machine with no network access or API key.
+
+Each worker process publishes into its own scratch posts directory, mirroring how the
+stages run as independent processes in `publish.sh`.
+
+Usage:
+    python3 src/load_test.py --runs 20 --concurrency 4 --latency 0.8
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+
+def _init_worker(scratch_root: str) -> None:
+    """Silences stage logging and points the reporter at a per-process posts directory."""
+    sys.stdout = open(os.devnull, "w")
+    import reporter
+
+    reporter.POSTS_DIR = os.path.join(scratch_root, str(os.getpid()))
+    os.makedirs(reporter.POSTS_DIR, exist_ok=True)
+
+
+def _run_once(target_date: Optional[str]) -> Dict[str, float]:
+    """Executes a single generate -> validate -> bias-audit cycle and times each stage."""
+    import reporter
+    import validator
+    import bias_checker
+
+    timings = {}
+    start = time.perf_counter()
+    post_path = reporter.generate_weekly_digest_report(target_date)
+    timings["reporter"] = time.perf_counter() - start
+    if not post_path:
+        return {**timings, "ok": 0.0}
+
+    start = time.perf_counter()
+    factual_ok = validator.verify_post(post_path)["passed"]
+    timings["validator"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bias_ok = bias_checker.audit_bias(post_path)["status"] == "pass"
+    timings["bias_checker"] = time.perf_counter() - start
+
+    timings["ok"] = float(bool(factual_ok and bias_ok))
+    return timings
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_load_test(runs: int, concurrency: int, latency: float, dates: List[Optional[str]]) -> None:
+    """
+    Fans out pipeline cycles across worker processes and reports throughput.
+
+    Args:
+        runs (int): Total number of end-to-end cycles.
+        concurrency (int): Number of worker processes.
+        latency (float): Simulated seconds per LLM call for the fake backend.
+        dates (List[str | None]): Target report dates, cycled across runs.
+    """
+    os.environ.setdefault("LLM_BACKEND", "fake")
+    os.environ["LLM_FAKE_LATENCY"] = str(latency)
+    targets = [dates[i % len(dates)] for i in range(runs)]
+
+    print(f"🏋️ Load test: {runs} runs x {concurrency} workers | backend={os.environ['LLM_BACKEND']} latency={latency}s")
+    with tempfile.TemporaryDirectory() as scratch_root:
+        wall_start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=concurrency, initializer=_init_worker, initargs=(scratch_root,)) as pool:
+            results = list(pool.map(_run_once, targets))
+        wall = time.perf_counter() - wall_start
+
+    passed = sum(int(r.get("ok", 0)) for r in results)
+    print(f"\n⏱️  Wall time: {wall:.2f}s | Throughput: {runs / wall:.2f} runs/s | Passed: {passed}/{runs}")
+    for stage in ("reporter", "validator", "bias_checker"):
+        samples = [r[stage] for r in results if stage in r]
+        if samples:
+            print(f"   {stage:<13} p50={_percentile(samples, 50):.3f}s  "
+                  f"p95={_percentile(samples, 95):.3f}s  mean={statistics.mean(samples):.3f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline end-to-end pipeline load test.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated seconds per LLM call.")
+    parser.add_argument("--dates", nargs="*", default=[None], help="Target report dates (YYYY-MM-DD).")
+    args = parser.parse_args()
+    run_load_test(args.runs, args.concurrency, args.latency, args.dates)
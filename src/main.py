@@ -0,0 +1,16 @@
+"""
+Application Entry Point
+
+Runs the weekly publishing pipeline. Orchestration (stage DAG, content-hash skipping,
+atomic outputs) lives in `pipeline.py`; this module only delegates to it.
+
+Usage:
+    python3 src/main.py [--date YYYY-MM-DD] [--skip scrape] [--force] [--unattended]
+"""
+
+import sys
+
+from pipeline import main
+
+if __name__ == "__main__":
+    sys.exit(main())
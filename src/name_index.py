@@ -0,0 +1,220 @@
+"""
+Fuzzy Name Index
+
+A trigram inverted index with edit-distance re-ranking over every known player and team
+name. It resolves the spellings that appear in generated prose and ad-hoc inputs
+("Don Cherrys", "Cherry's", "Flat Earthers", a misspelled surname) to canonical source
+names without scanning the underlying tables:
+
+1. Exact normalized aliases resolve with a single dictionary probe.
+2. Otherwise, candidates sharing trigrams with the query are gathered from the postings
+   lists, and only the strongest few are re-scored with Levenshtein similarity.
+
+The module is dependency-free so it can be shared by the validator, scout and reporter.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# --- CONFIGURATION & CONSTANTS ---
+DEFAULT_THRESHOLD = 0.75   # Minimum blended similarity for `best` to accept a candidate
+AMBIGUITY_MARGIN = 0.05    # Required lead of the top candidate over the runner-up
+RERANK_POOL = 5            # Best trigram candidates re-scored with edit distance
+MENTION_MAX_WORDS = 3      # Longest word n-gram considered by `find_mentions`
+
+WORD_PATTERN = re.compile(r"[A-Za-z0-9][\w'’\-]*")
+
+
+def normalize(text: str) -> str:
+    """Lowercases, strips apostrophes/'#', folds hyphens to spaces and collapses whitespace."""
+    text = str(text).replace("#", "").replace("’", "").replace("'", "").replace("-", " ")
+    return " ".join(text.lower().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Returns the padded character trigrams of an already-normalized string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Classic two-row dynamic-programming edit distance."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class NameIndex:
+    """
+    Trigram/edit-distance index mapping name variants to canonical names.
+
+    Attributes:
+        aliases (Dict[str, str]): Normalized alias -> canonical name.
+        postings (Dict[str, Set[str]]): Trigram -> normalized aliases containing it.
+    """
+
+    def __init__(self, aliases: Dict[str, str]):
+        self.aliases: Dict[str, str] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        for alias, canonical in aliases.items():
+            self.add(alias, canonical)
+
+    def add(self, alias: str, canonical: str) -> None:
+        """Registers one spelling of a canonical name (first registration wins)."""
+        key = normalize(alias)
+        if not key or key in self.aliases:
+            return
+        self.aliases[key] = canonical
+        grams = trigrams(key)
+        self._grams[key] = grams
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(key)
+
+    # --- FACTORIES ---
+
+    @classmethod
+    def for_teams(cls, teams: Iterable[str]) -> "NameIndex":
+        """
+        Indexes team names with their seeding-free, article-free and possessive short forms.
+
+        Args:
+            teams (Iterable[str]): Canonical team names (e.g., manifest Home/Away values).
+
+        Returns:
+            NameIndex: The populated index.
+        """
+        index = cls({})
+        for team in dict.fromkeys(str(t).strip() for t in teams if isinstance(t, str) and t.strip()):
+            base = normalize(re.sub(r'\(.*?\)', '', team))
+            variants = [team, base]
+            if base.startswith("the "):
+                variants.append(base[4:])
+            # Possessive team names are routinely shortened in prose ("Don Cherry's" -> "Cherry's")
+            if "'" in team or "’" in team:
+                variants.append(base.split()[-1])
+            for variant in variants:
+                index.add(variant, team)
+        return index
+
+    @classmethod
+    def for_players(cls, players: Iterable[str]) -> "NameIndex":
+        """
+        Indexes full player names plus surnames that belong to exactly one player.
+
+        Args:
+            players (Iterable[str]): Canonical player names (rosters and scoring summaries).
+
+        Returns:
+            NameIndex: The populated index.
+        """
+        names = list(dict.fromkeys(str(p).strip() for p in players if isinstance(p, str) and p.strip()))
+        index = cls({name: name for name in names})
+        surnames = Counter(normalize(n).split()[-1] for n in names if len(n.split()) > 1)
+        for name in names:
+            parts = name.split()
+            if len(parts) > 1 and surnames[normalize(parts[-1])] == 1:
+                index.add(parts[-1], name)
+        return index
+
+    # --- LOOKUPS ---
+
+    def candidates(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Returns ranked canonical candidates for a query.
+
+        The score blends trigram Dice overlap with normalized Levenshtein similarity; an
+        exact alias always scores 1.0.
+
+        Args:
+            query (str): Name as written in the source text.
+            limit (int): Maximum number of candidates.
+
+        Returns:
+            List[Tuple[str, float]]: (canonical name, score) pairs, best first.
+        """
+        key = normalize(query)
+        if not key:
+            return []
+        if key in self.aliases:
+            return [(self.aliases[key], 1.0)]
+
+        query_grams = trigrams(key)
+        shared = Counter()
+        for gram in query_grams:
+            for alias in self.postings.get(gram, ()):
+                shared[alias] += 1
+
+        # Rank by trigram Dice overlap first; only the strongest few pay for edit distance
+        dice_scores = sorted(
+            ((2 * overlap / (len(query_grams) + len(self._grams[alias])), alias) for alias, overlap in shared.items()),
+            reverse=True,
+        )[:RERANK_POOL]
+
+        best: Dict[str, float] = {}
+        for dice, alias in dice_scores:
+            edit = 1 - levenshtein(key, alias) / max(len(key), len(alias))
+            score = round(0.5 * dice + 0.5 * edit, 4)
+            canonical = self.aliases[alias]
+            if score > best.get(canonical, 0.0):
+                best[canonical] = score
+        return sorted(best.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def exact(self, query: str) -> Optional[str]:
+        """Resolves a query only if it is a registered alias (no similarity matching)."""
+        return self.aliases.get(normalize(query))
+
+    def best(self, query: str, threshold: float = DEFAULT_THRESHOLD) -> Optional[str]:
+        """
+        Resolves a query to a single canonical name, or None if no candidate is strong
+        and unambiguous enough.
+        """
+        ranked = self.candidates(query, limit=2)
+        if not ranked or ranked[0][1] < threshold:
+            return None
+        if len(ranked) > 1 and ranked[0][1] < 1.0 and ranked[0][1] - ranked[1][1] < AMBIGUITY_MARGIN:
+            return None
+        return ranked[0][0]
+
+    def find_mentions(self, text: str, fuzzy: bool = True,
+                      threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[int, str]]:
+        """
+        Scans prose for mentions of indexed names, in order of appearance.
+
+        Every word n-gram (up to `MENTION_MAX_WORDS`) is probed as an exact alias first;
+        when `fuzzy` is set, n-grams starting with a capitalized word are then fuzzy-matched.
+
+        Args:
+            text (str): The prose to scan.
+            fuzzy (bool): Whether to fall back to trigram matching for unknown spellings.
+            threshold (float): Minimum similarity for fuzzy matches.
+
+        Returns:
+            List[Tuple[int, str]]: (character offset, canonical name) pairs.
+        """
+        words = list(WORD_PATTERN.finditer(text))
+        mentions: List[Tuple[int, str]] = []
+        i = 0
+        while i < len(words):
+            sizes = range(min(MENTION_MAX_WORDS, len(words) - i), 0, -1)
+            phrases = [(size, text[words[i].start():words[i + size - 1].end()]) for size in sizes]
+            matched = next(((size, self.aliases[normalize(p)]) for size, p in phrases if normalize(p) in self.aliases), None)
+            if matched is None and fuzzy:
+                for size, phrase in phrases:
+                    canonical = self.best(phrase, threshold) if phrase[:1].isupper() and len(phrase) > 3 else None
+                    if canonical:
+                        matched = (size, canonical)
+                        break
+            if matched:
+                mentions.append((words[i].start(), matched[1]))
+                i += matched[0]
+            else:
+                i += 1
+        return mentions
@@ -0,0 +1,382 @@
+"""
+Publishing Pipeline Orchestrator
+
+Models the weekly publishing run as a DAG of stages with declared inputs and outputs:
+
+    scrape -> enrich -> analyze -> report -> gate
+                          \\-> viz
+
+Before running a stage, the orchestrator fingerprints its inputs (file contents, the
+outputs of its upstream stages, its own source code and its parameters) with SHA-256 and
+compares them to the fingerprint recorded in `data/.pipeline_state.json` by the last
+successful run. Stages whose inputs did not change are skipped and their recorded outputs
+(and, for the gate, the recorded verdict) are reused, so a no-op weekly run only pays
+for hashing a handful of files. All stage outputs and the state file are written atomically.
+
+`main.py` and `publish.sh` delegate to this module:
+
+    python3 src/pipeline.py [--date YYYY-MM-DD] [--skip scrape] [--force] [--unattended] [--dry-run] [--trace]
+
+Every path belongs to the active division (`LEAGUE_DIVISION`, see `leagues.py`). With
+`--division KEY` (repeatable, or `all`) one unattended pipeline runs per division, each in
+its own worker process, and the most severe exit code is returned.
+
+With `--trace` (or `PIPELINE_TRACE=1`) every stage, data pass and LLM call is recorded as a
+span and exported as a Chrome trace when the run ends (see `tracing.py`).
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from datetime import datetime
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import tracing
+import leagues
+import llm_scheduler
+from atomic_io import write_text_atomically
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_PUBLISHABLE, POLICY_FILE
+
+# --- CONFIGURATION & CONSTANTS ---
+DIVISION = leagues.active_division()
+STATE_FILE = DIVISION.data_path(".pipeline_state.json")
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+HASH_BLOCK_SIZE = 1 << 20
+
+DETAILS_FILE = DIVISION.data_path("game_details.csv")
+MANIFEST_FILE = DIVISION.data_path("games_manifest.csv")
+TEAM_STATS_FILE = DIVISION.data_path("team_stats.csv")
+PLAYER_STATS_FILE = DIVISION.data_path("player_stats.csv")
+PLAYER_GAME_LINES_FILE = DIVISION.data_path("player_game_lines.csv")
+PLAYOFF_STATS_FILE = DIVISION.data_path("playoff_standings.csv")
+PLAYOFF_MATCHUP_FILE = DIVISION.data_path("playoff_matchups.csv")
+PARITY_CHART_FILE = os.path.join(DIVISION.assets_dir, "league_parity.png")
+
+
+class StageOutcome(NamedTuple):
+    """What a stage produced: an exit code (see `gate_policy`) and the files it wrote."""
+    code: int
+    outputs: List[str]
+
+
+class Stage(NamedTuple):
+    """
+    A node of the pipeline DAG.
+
+    Attributes:
+        name (str): Unique stage name.
+        run (Callable): Receives upstream outputs ({stage: [paths]}) and returns a StageOutcome.
+        inputs (List[str]): Files read by the stage (missing files hash as absent).
+        outputs (List[str]): Files the stage is expected to write (optional ones may be absent).
+        after (Sequence[str]): Upstream stages; their outputs are also fingerprinted as inputs.
+        sources (Sequence[str]): Modules under src/ whose code changes invalidate the stage.
+        params (Dict[str, Any]): Run parameters that change the stage's result.
+        volatile (bool): Always run (the stage reads an external source).
+        interactive (bool): Needs a human at the terminal; skipped by unattended runs.
+        optional (bool): A failure is reported but does not abort the pipeline.
+    """
+    name: str
+    run: Callable[[Dict[str, List[str]]], StageOutcome]
+    inputs: List[str] = []
+    outputs: List[str] = []
+    after: Sequence[str] = ()
+    sources: Sequence[str] = ()
+    params: Dict[str, Any] = {}
+    volatile: bool = False
+    interactive: bool = False
+    optional: bool = False
+
+
+# --- FINGERPRINTING & STATE ---
+
+def file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file's contents, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(stage: Stage, upstream: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Fingerprints everything a stage's result depends on.
+
+    Args:
+        stage (Stage): The stage to fingerprint.
+        upstream (Dict[str, List[str]]): Output paths of every completed stage.
+
+    Returns:
+        Dict[str, Any]: Input path -> digest, plus the stage's source digests and parameters.
+    """
+    paths = list(stage.inputs) + [p for dep in stage.after for p in upstream.get(dep, [])]
+    return {
+        "files": {path: file_digest(path) for path in dict.fromkeys(paths)},
+        "sources": {name: file_digest(os.path.join(SRC_DIR, name)) for name in stage.sources},
+        "params": stage.params,
+    }
+
+
+def load_state(path: str = STATE_FILE) -> Dict[str, Any]:
+    """Loads the recorded stage fingerprints (an unreadable state file means a full run)."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: Dict[str, Any], path: str = STATE_FILE) -> None:
+    """Persists stage fingerprints atomically."""
+    write_text_atomically(path, json.dumps(state, indent=2, sort_keys=True))
+
+
+# --- STAGE RUNNERS (heavy modules are imported only when a stage actually runs) ---
+
+def _existing(paths: List[str]) -> List[str]:
+    return [path for path in paths if os.path.exists(path)]
+
+
+def _run_scrape(upstream: Dict[str, List[str]]) -> StageOutcome:
+    import scraper
+
+    scraper.run_scraping_pipeline()
+    return StageOutcome(EXIT_PUBLISHABLE, _existing([DETAILS_FILE, MANIFEST_FILE]))
+
+
+def _run_enrich(upstream: Dict[str, List[str]]) -> StageOutcome:
+    import enricher
+
+    print("📝 ENTERING EXECUTIVE EDITOR MODE...")
+    enricher.enrich_games()
+    return StageOutcome(EXIT_PUBLISHABLE, _existing([MANIFEST_FILE]))
+
+
+def _run_analyze(upstream: Dict[str, List[str]]) -> StageOutcome:
+    import analyzer
+
+    analyzer.run_analysis_pipeline()
+    outputs = _existing([TEAM_STATS_FILE, PLAYER_STATS_FILE, PLAYER_GAME_LINES_FILE,
+                         PLAYOFF_STATS_FILE, PLAYOFF_MATCHUP_FILE])
+    return StageOutcome(EXIT_PUBLISHABLE if PLAYER_STATS_FILE in outputs else EXIT_ERROR, outputs)
+
+
+def _run_viz(upstream: Dict[str, List[str]]) -> StageOutcome:
+    import viz_generator
+
+    viz_generator.generate_parity_chart()
+    return StageOutcome(EXIT_PUBLISHABLE, _existing([PARITY_CHART_FILE]))
+
+
+def _make_report_runner(target_date: Optional[str], stream: bool,
+                        drafts: int = 1) -> Callable[[Dict[str, List[str]]], StageOutcome]:
+    def run(upstream: Dict[str, List[str]]) -> StageOutcome:
+        import reporter
+
+        try:
+            post_path = reporter.generate_weekly_digest_report(target_date, stream=stream, drafts=drafts)
+        except reporter.NoPassingDraft as e:
+            for rejection in e.rejections:
+                print(f"   - {rejection}")
+            return StageOutcome(EXIT_BLOCKED, [])
+        return StageOutcome(EXIT_PUBLISHABLE, [post_path]) if post_path else StageOutcome(EXIT_ERROR, [])
+    return run
+
+
+def _make_gate_runner(policy_path: Optional[str]) -> Callable[[Dict[str, List[str]]], StageOutcome]:
+    def run(upstream: Dict[str, List[str]]) -> StageOutcome:
+        import asyncio
+        import gate
+        from gate_policy import load_policy
+
+        posts = upstream.get("report", [])
+        if not posts:
+            print("❌ FAIL: The report stage produced no post to audit.")
+            return StageOutcome(EXIT_ERROR, [])
+        merged = asyncio.run(gate.run_gate(posts[0], load_policy(policy_path)))
+        gate.render_gate_verdict(merged)
+        return StageOutcome(gate.gate_exit_code(merged), [])
+    return run
+
+
+def build_stages(target_date: Optional[str] = None, policy_path: Optional[str] = None,
+                 stream: bool = False, drafts: int = 1) -> List[Stage]:
+    """
+    Declares the weekly publishing DAG.
+
+    Args:
+        target_date (str, optional): Report date ('YYYY-MM-DD'); defaults to the latest games.
+        policy_path (str, optional): Editorial policy file for the gate.
+        stream (bool): Stream the report generation to the terminal.
+        drafts (int): Concurrent report drafts (best-of-N, see `reporter.draft_best_of_n`).
+
+    Returns:
+        List[Stage]: The stages, in declaration order.
+    """
+    source_data = [DETAILS_FILE, MANIFEST_FILE]
+    return [
+        Stage("scrape", _run_scrape, outputs=source_data, sources=("scraper.py",), volatile=True),
+        Stage("enrich", _run_enrich, inputs=[MANIFEST_FILE], outputs=[MANIFEST_FILE], after=("scrape",),
+              sources=("enricher.py",), interactive=True),
+        Stage("analyze", _run_analyze, inputs=source_data,
+              outputs=[TEAM_STATS_FILE, PLAYER_STATS_FILE, PLAYER_GAME_LINES_FILE], after=("scrape", "enrich"),
+              sources=("analyzer.py", "atomic_io.py")),
+        Stage("viz", _run_viz, inputs=[TEAM_STATS_FILE], outputs=[PARITY_CHART_FILE], after=("analyze",),
+              sources=("viz_generator.py",), optional=True),
+        Stage("report", _make_report_runner(target_date, stream, drafts), inputs=source_data, after=("analyze",),
+              sources=("reporter.py", "stat_renderer.py", "analyzer.py"), params={"date": target_date, "drafts": drafts}),
+        Stage("gate", _make_gate_runner(policy_path), inputs=source_data + [policy_path or POLICY_FILE],
+              after=("report",), sources=("gate.py", "validator.py", "bias_checker.py", "gate_policy.py"),
+              params={"policy": policy_path or POLICY_FILE}),
+    ]
+
+
+# --- EXECUTION ---
+
+def run_pipeline(stages: List[Stage], skip: Sequence[str] = (), force: bool = False,
+                 unattended: bool = False, dry_run: bool = False, state_path: str = STATE_FILE) -> int:
+    """
+    Executes the DAG in dependency order, skipping stages whose inputs are unchanged.
+
+    Args:
+        stages (List[Stage]): Output of `build_stages`.
+        skip (Sequence[str]): Stage names to treat as already satisfied (e.g., 'scrape' offline).
+        force (bool): Ignore recorded fingerprints and run every stage.
+        unattended (bool): Skip interactive stages.
+        dry_run (bool): Report what would run without running anything.
+        state_path (str): Location of the recorded fingerprints.
+
+    Returns:
+        int: The gate verdict's exit code, `EXIT_ERROR` if a required stage failed, or
+        `EXIT_BLOCKED` if a stage blocked the run without producing outputs for its dependents.
+    """
+    wall_start = time.perf_counter()
+    by_name = {stage.name: stage for stage in stages}
+    order = list(TopologicalSorter({s.name: set(s.after) for s in stages}).static_order())
+    recorded = load_state(state_path)
+    state = {} if force else dict(recorded)
+    upstream: Dict[str, List[str]] = {}
+    code = EXIT_PUBLISHABLE
+
+    print(f"🧩 PIPELINE: {' -> '.join(order)}")
+    for name in order:
+        stage = by_name[name]
+        if name in skip or (stage.interactive and unattended):
+            upstream[name] = recorded.get(name, {}).get("outputs", _existing(stage.outputs))
+            print(f"⏭️  {name:<8} skipped ({'requested' if name in skip else 'unattended run'})")
+            continue
+
+        current = fingerprint(stage, upstream)
+        previous = state.get(name)
+        if (not stage.volatile and previous and previous["fingerprint"] == current
+                and all(os.path.exists(p) for p in previous["outputs"])):
+            upstream[name] = previous["outputs"]
+            code = previous["code"] if previous["code"] != EXIT_PUBLISHABLE else code
+            print(f"⏭️  {name:<8} inputs unchanged (reusing {len(previous['outputs'])} output(s), exit {previous['code']})")
+            continue
+
+        if dry_run:
+            upstream[name] = recorded.get(name, {}).get("outputs", _existing(stage.outputs))
+            print(f"▶️  {name:<8} would run")
+            continue
+
+        print(f"\n▶️  {name:<8} running...")
+        stage_start = time.perf_counter()
+        try:
+            with tracing.span(f"stage.{name}", "stage"):
+                outcome = stage.run(upstream)
+        except Exception as e:
+            print(f"❌ Stage '{name}' failed: {e}")
+            outcome = StageOutcome(EXIT_ERROR, [])
+
+        elapsed = time.perf_counter() - stage_start
+        if outcome.code == EXIT_ERROR:
+            if stage.optional:
+                print(f"⚠️  {name:<8} failed after {elapsed:.2f}s (optional stage, continuing)")
+                upstream[name] = []
+                continue
+            print(f"🛑 PIPELINE ABORTED at '{name}' after {elapsed:.2f}s.")
+            return EXIT_ERROR
+        if outcome.code == EXIT_BLOCKED and not outcome.outputs and any(name in s.after for s in stages):
+            # Blocked with nothing to hand downstream (no passing draft); not recorded, so it reruns
+            print(f"🛑 PIPELINE BLOCKED at '{name}' after {elapsed:.2f}s.")
+            return EXIT_BLOCKED
+
+        # Fingerprint after the run, so stages that rewrite their own inputs (enrich) stay skippable
+        upstream[name] = outcome.outputs
+        code = outcome.code if outcome.code != EXIT_PUBLISHABLE else code
+        recorded[name] = {"fingerprint": fingerprint(stage, upstream), "outputs": outcome.outputs,
+                          "code": outcome.code, "ran_at": datetime.now().isoformat(timespec="seconds")}
+        save_state(recorded, state_path)
+        print(f"✅ {name:<8} done in {elapsed:.2f}s")
+
+    print(f"\n🏁 Pipeline finished in {time.perf_counter() - wall_start:.2f}s (exit {code}).")
+    return code
+
+
+def _strip_division_args(argv: List[str]) -> List[str]:
+    """Removes --division/--workers (and their values) so workers run a single-division pipeline."""
+    forwarded, skip_next = [], False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg in ("--division", "--workers"):
+            skip_next = True
+        elif not arg.startswith(("--division=", "--workers=")):
+            forwarded.append(arg)
+    return forwarded
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point shared by `pipeline.py` and `main.py`."""
+    parser = argparse.ArgumentParser(description="Run the publishing pipeline, skipping unchanged stages.")
+    parser.add_argument("--date", default=None, help="Report date (YYYY-MM-DD). Defaults to the latest games.")
+    parser.add_argument("--skip", action="append", default=[], help="Stage to skip (repeatable), e.g. --skip scrape.")
+    parser.add_argument("--force", action="store_true", help="Run every stage regardless of recorded hashes.")
+    parser.add_argument("--unattended", action="store_true", help="Skip interactive stages (enrichment).")
+    parser.add_argument("--dry-run", action="store_true", help="Show which stages would run.")
+    parser.add_argument("--stream", action="store_true", help="Stream the report as it is generated.")
+    parser.add_argument("--policy", default=None, help="Editorial policy file for the gate.")
+    parser.add_argument("--drafts", type=int, default=1, help="Concurrent report drafts; the first to pass the factual audit is published.")
+    parser.add_argument("--trace", nargs="?", const="", default=None, metavar="PATH",
+                        help="Record a Chrome trace of the run (default: data/traces/trace-<timestamp>.json).")
+    parser.add_argument("--division", action="append", default=[], metavar="KEY",
+                        help="Run for a registered division (repeatable, or 'all'), one worker process each.")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent division workers (default: CPU count).")
+    args = parser.parse_args(argv)
+
+    if args.division:
+        try:
+            divisions = leagues.resolve_divisions(args.division)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return EXIT_ERROR
+        # Workers cannot prompt (enrichment is interactive)
+        forwarded = _strip_division_args(sys.argv[1:] if argv is None else argv)
+        if "--unattended" not in forwarded:
+            forwarded.append("--unattended")
+        return leagues.run_divisions(divisions, forwarded, args.workers)
+
+    if args.trace is not None:
+        tracing.enable(args.trace or None)
+
+    stages = build_stages(args.date, args.policy, args.stream, args.drafts)
+    unknown = set(args.skip) - {stage.name for stage in stages}
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(sorted(unknown))}")
+        return EXIT_ERROR
+    code = run_pipeline(stages, args.skip, args.force, args.unattended, args.dry_run)
+    llm_scheduler.print_ledger()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
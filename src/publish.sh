@@ -36,44 +36,35 @@ fi
 # ---------------------------------------------------------
 echo "🏒 Running Full Pipeline..."
 
-# 1. Data Ingestion
-python3 src/scraper.py
+# Editorial overrides for the gates (a missing file means the default policy).
+# Set UNATTENDED=1 to never prompt: blocked posts then require a policy override.
+# Set REPORT_DRAFTS=N to draft N reports concurrently and keep the first that passes the audit.
+# Set DIVISION=all (or a key from data/leagues.json) to publish divisions in parallel, unattended.
+POLICY_FILE="${EDITORIAL_POLICY:-data/editorial_policy.json}"
 
-# 2. Human-in-the-Loop Enrichment
-echo "📝 ENTERING EXECUTIVE EDITOR MODE..."
-python3 src/enricher.py
+# 1-4. Ingestion -> Enrichment -> Analysis -> Generation -> Factual & Bias Gate
+# The Python orchestrator skips every stage whose inputs are unchanged since the last run.
+# Exit codes: 0 = publishable, 1 = blocked, 2 = a stage could not run, 3 = bias review needed
+python3 src/pipeline.py --policy "$POLICY_FILE" ${UNATTENDED:+--unattended} ${REPORT_DRAFTS:+--drafts "$REPORT_DRAFTS"} ${DIVISION:+--division "$DIVISION"}
+GATE_STATUS=$?
 
-# 3. Processing & Generation
-echo ""
-python3 src/analyzer.py
-echo ""
-echo "✍️ Writing this weeks Dispatch..."
-echo ""
-python3 src/reporter.py
-
-# 4. Factual Integrity
-echo ""
-echo "🧮 Running Factual Validator..."
-VALIDATOR_OUTPUT=$(python3 src/validator.py)
-echo "$VALIDATOR_OUTPUT"
-
-if [[ "$VALIDATOR_OUTPUT" == *"🛑 AUDIT FAILED"* ]]; then
+if [[ $GATE_STATUS -eq 1 ]]; then
    echo ""
    echo "🚨 FACTUAL ERROR DETECTED: The AI hallucinated or misreported data."
    echo "🛑 DEPLOYMENT ABORTED: Fix docs/_posts/ and run again."
    exit 1
-fi
-
-# 5. Bias Audit & Human-in-the-Loop
-echo ""
-echo "🛡️ Running Trust & Safety Audit..."
-BIAS_OUTPUT=$(python3 src/bias_checker.py)
-echo "$BIAS_OUTPUT"
-
-# FIXED: Now strictly matches the actual output from bias_checker.py
-if [[ "$BIAS_OUTPUT" == *"🛑 AUDIT FAILED: Systemic bias detected"* ]]; then
+elif [[ $GATE_STATUS -eq 2 ]]; then
+    echo ""
+    echo "❌ PIPELINE ERROR: A stage could not complete."
+    echo "🛑 DEPLOYMENT ABORTED."
+    exit 1
+elif [[ $GATE_STATUS -eq 3 ]]; then
     echo ""
     echo "⚠️ BIAS DETECTED: The AI flagged potential framing issues."
+    if [[ -n "$UNATTENDED" ]]; then
+        echo "🛑 DEPLOYMENT ABORTED: Add an override to $POLICY_FILE to publish unattended."
+        exit 1
+    fi
     read -p "👨‍⚖️ EDITOR-IN-CHIEF OVERRIDE: Do you want to publish this report anyway? (y/n): " choice
     
     case "$choice" in 
@@ -8,48 +8,304 @@ Markdown-formatted newsletter complete with Jekyll front-matter.
 """
 
 import os
-import sys
 import json
-import warnings
+import argparse
+import threading
 import pandas as pd
 import re
-from typing import Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple, Optional
 from datetime import datetime, timedelta
-from google import genai
 from dotenv import load_dotenv
+from llm_backend import LazyBackend
+from stat_renderer import render_stat_sections
+from analyzer import build_game_summaries, impute_season_year
+from name_index import NameIndex
+from atomic_io import write_text_atomically
+from tracing import propagate, span, traced
+from leagues import active_division
+from league_db import open_db
+from stats_service import get_service
 
 # Load environment variables
 load_dotenv()
 
 # --- CONFIGURATION & CONSTANTS ---
-TEAM_STATS_FILE = "data/team_stats.csv"
-PLAYER_STATS_FILE = "data/player_stats.csv"
-DETAILS_FILE = "data/game_details.csv"
-MANIFEST_FILE = "data/games_manifest.csv"
-PLAYOFF_STATS_FILE = "data/playoff_standings.csv" 
-PLAYOFF_MATCHUP_FILE = "data/playoff_matchups.csv" 
+# Data (its league database), posts, logos and the publication identity come from the active division
+DIVISION = active_division()
+POSTS_DIR = DIVISION.posts_dir
 
-DOCS_DIR = "docs"
-POSTS_DIR = os.path.join(DOCS_DIR, "_posts")
+# Season leaders sent to the LLM for narrative color (stat sections are rendered locally)
+BRIEF_LEADER_LIMIT = 15
+
+# Suffix for in-progress streamed drafts (kept on crash so long reports can resume)
+DRAFT_SUFFIX = ".part"
+
+# Best-of-N drafting: concurrent drafts cycle through these sampling temperatures
+DRAFT_TEMPERATURES = (1.0, 0.7, 1.2, 0.85, 1.1)
 
 # Asset mapping for dynamically injecting team logos into the Jekyll front-matter
-LOGO_MAP = {
-    "The Shockers": "/assets/images/theshockers.png",
-    "The Sahara": "/assets/images/thesahara.png",
-    "Don Cherry's": "/assets/images/doncherrys.png",
-    "Flat-Earthers": "/assets/images/flatearthers.png",
-    "Muffin Men": "/assets/images/muffinmen.png",
-    "4 Lines": "/assets/images/4lines.png"
-}
+LOGO_MAP = DIVISION.logo_map
+DEFAULT_TEASER = "/assets/images/rink-header.jpg"
+
+# Resolves prose spellings ("Cherry's", "Flat Earthers", "Shockers") to LOGO_MAP keys
+LOGO_NAME_INDEX = NameIndex.for_teams(LOGO_MAP)
+
+# LLM Backend (Gemini by default, see llm_backend.get_backend). Construction is deferred
+# to the first call so LLM-free code paths never import the provider SDK.
+backend = LazyBackend()
+
+
+# --- POST ASSEMBLY HELPERS ---
+
+def resolve_teaser_logo(report_text: str) -> str:
+    """
+    Evaluates generated text for team mentions to dynamically assign header artwork.
+    The earliest mention wins, so the headline's team takes precedence.
+    
+    Args:
+        report_text (str): The generated Markdown body.
+        
+    Returns:
+        str: The asset path of the first mentioned team's logo, or the default rink header.
+    """
+    # Exact aliases cover well-formed prose; the fuzzy pass only runs when none are found
+    mentions = LOGO_NAME_INDEX.find_mentions(report_text, fuzzy=False) or LOGO_NAME_INDEX.find_mentions(report_text)
+    if mentions:
+        return LOGO_MAP[mentions[0][1]]
+    return DEFAULT_TEASER
+
+
+def parse_headline_and_subline(report_text: str) -> Tuple[str, str]:
+    """
+    Isolates the headline and subline from the first two lines of the generated text 
+    for use in the Jekyll metadata.
+    
+    Args:
+        report_text (str): The generated Markdown body (complete or partial).
+        
+    Returns:
+        Tuple[str, str]: The cleaned headline and subline.
+    """
+    lines = report_text.strip().split('\n')
+    generated_headline = lines[0].replace('#', '').strip()
+    generated_subline = lines[1].strip() if len(lines) > 1 else "The Season Wraps Up."
+    return generated_headline, generated_subline
+
+
+def resolve_post_filepath(target_date_str: Optional[str], json_brief: str) -> str:
+    """
+    Determines the Jekyll post path via the target date or the resolved brief date.
+    
+    Args:
+        target_date_str (str, optional): Target reporting date in 'YYYY-MM-DD' format.
+        json_brief (str): The serialized data brief containing the resolved report date.
+        
+    Returns:
+        str: The destination path inside the posts directory.
+    """
+    # Ensure output directory structure exists
+    os.makedirs(POSTS_DIR, exist_ok=True)
+    
+    if target_date_str:
+        file_date = datetime.strptime(target_date_str, "%Y-%m-%d") 
+    else:
+        file_date_str = json.loads(json_brief)['report_metadata']['current_date']
+        file_date = datetime.strptime(file_date_str, '%B %d, %Y')
+        
+    return os.path.join(POSTS_DIR, f"{file_date.strftime('%Y-%m-%d')}-dispatch.md")
+
+
+@traced()
+def commit_post_atomically(filepath: str, content: str) -> None:
+    """
+    Writes the finished post to a sibling temp file and swaps it into place, so Jekyll 
+    (or a concurrent auditor) never observes a half-written dispatch.
+    
+    Args:
+        filepath (str): The final destination of the post.
+        content (str): The full file content, including front-matter.
+    """
+    write_text_atomically(filepath, content)
+
+
+def render_post(prose: str, stat_sections: str) -> Tuple[str, str]:
+    """
+    Attaches the stat sections to generated prose and builds the Jekyll post.
+    
+    Args:
+        prose (str): The model's Markdown output (headline and subline first).
+        stat_sections (str): The deterministically rendered stat sections.
+        
+    Returns:
+        Tuple containing:
+            - The report body (prose followed by the stat sections).
+            - The complete post content, including front-matter.
+    """
+    # Attach the deterministic stat sections beneath the generated prose
+    report_text = f"{prose.rstrip()}\n\n{stat_sections}\n"
+    
+    # --- POST-PROCESSING & FORMATTING ---
+    teaser_logo = resolve_teaser_logo(report_text)
+    generated_headline, generated_subline = parse_headline_and_subline(report_text)
+
+    # Construct Jekyll configuration block (other divisions' posts are tagged for the site's archives)
+    category = "" if DIVISION.is_default else f"categories: [{DIVISION.key}]\n"
+    front_matter = f"""---
+layout: single
+title: "{generated_headline}"
+excerpt: "{generated_subline}"
+{category}header:
+  teaser: "{teaser_logo}"
+author_profile: true
+---
+
+"""
+    return report_text, front_matter + report_text
+
+
+class NoPassingDraft(RuntimeError):
+    """
+    Raised by `draft_best_of_n` when every generated draft failed the factual audit. Nothing
+    is published; the pipeline reports the run as blocked, like a failed publication gate.
+
+    Args:
+        rejections (List[str]): One line per rejected draft (its first discrepancy).
+    """
 
-# Initialize LLM Client
-api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-client = genai.Client(api_key=api_key)
+    def __init__(self, rejections: List[str]):
+        self.rejections = rejections
+        super().__init__(f"No passing draft: all {len(rejections)} draft(s) failed the factual audit.")
 
 
+@traced()
+def draft_best_of_n(contents: List[str], stat_sections: str, filepath: str, drafts: int) -> Tuple[str, str]:
+    """
+    Generates `drafts` candidate reports concurrently (one sampling temperature each) and
+    screens every draft the moment it completes with the deterministic factual audit (no
+    LLM extraction; the publication gate runs the full audit). The first draft that passes
+    is returned. The others are cancelled: queued drafts never start and streaming drafts
+    stop at their next chunk, releasing their request slots.
+    
+    Args:
+        contents (List[str]): The prompt segments sent to the model.
+        stat_sections (str): The deterministically rendered stat sections.
+        filepath (str): The post's destination (its date bounds the audit window).
+        drafts (int): Number of concurrent drafts.
+        
+    Returns:
+        Tuple[str, str]: `render_post` output for the selected draft.
+        
+    Raises:
+        NoPassingDraft: If drafts were generated but none passed the audit.
+        RuntimeError: If every draft failed to generate.
+    """
+    import validator
+
+    context = validator.load_audit_context()
+    cancelled = threading.Event()
+    rejections = []
+
+    def generate_draft(temperature: float) -> Optional[str]:
+        chunks = []
+        for chunk in backend.generate_stream(contents, call_site="reporter", temperature=temperature):
+            if cancelled.is_set():
+                return None
+            chunks.append(chunk)
+        return None if cancelled.is_set() else "".join(chunks)
+
+    print(f"🎲 Drafting {drafts} candidates concurrently; publishing the first to pass the factual audit...")
+    pool = ThreadPoolExecutor(max_workers=drafts)
+    temperatures = {}
+    for i in range(drafts):
+        temperature = DRAFT_TEMPERATURES[i % len(DRAFT_TEMPERATURES)]
+        temperatures[pool.submit(propagate(generate_draft), temperature)] = (i + 1, temperature)
+
+    try:
+        for future in as_completed(temperatures):
+            number, temperature = temperatures[future]
+            try:
+                prose = future.result()
+            except Exception as e:
+                print(f"⚠️ Draft {number}/{drafts} (temperature {temperature}) failed: {e}")
+                continue
+            if prose is None:
+                continue
+
+            report_text, post = render_post(prose, stat_sections)
+            verdict = validator.audit_post(filepath, context, report_text=post, deterministic=True, quiet=True)
+            if verdict["passed"]:
+                cancelled.set()
+                print(f"✅ Draft {number}/{drafts} (temperature {temperature}) passed "
+                      f"{verdict['claims_checked']} claim check(s).")
+                return report_text, post
+
+            reason = verdict['errors'][0] if verdict['errors'] else verdict['status']
+            print(f"❌ Draft {number}/{drafts} (temperature {temperature}) rejected: {reason}")
+            rejections.append(f"Draft {number} (temperature {temperature}): {reason}")
+    finally:
+        cancelled.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if not rejections:
+        raise RuntimeError(f"All {drafts} drafts failed to generate.")
+    raise NoPassingDraft(rejections)
+
+
+@traced()
+def stream_report_to_draft(contents: List[str], draft_path: str) -> str:
+    """
+    Consumes the model's token stream, echoing each chunk to the terminal and appending 
+    it to a draft file as it arrives.
+    
+    If a draft from an interrupted run already exists, its text is kept and the model is 
+    asked to continue from where it stopped instead of starting over.
+    
+    Args:
+        contents (List[str]): The prompt segments sent to the model.
+        draft_path (str): Location of the incremental draft file.
+        
+    Returns:
+        str: The complete generated report text.
+    """
+    report_text = ""
+    if os.path.exists(draft_path):
+        with open(draft_path, "r") as f:
+            report_text = f.read()
+
+    if report_text.strip():
+        print(f"♻️  Resuming interrupted draft: {draft_path} ({len(report_text)} chars)")
+        contents = contents + [
+            "RESUME: The draft below was interrupted. Continue it exactly where it stops. "
+            "Do not repeat any of the existing text.\n\n" + report_text
+        ]
+
+    headline_announced = report_text.count('\n') >= 2
+    print("-" * 30)
+    print(report_text, end="", flush=True)
+
+    with open(draft_path, "a") as draft:
+        for text in backend.generate_stream(contents, call_site="reporter"):
+            report_text += text
+            draft.write(text)
+            draft.flush()
+            print(text, end="", flush=True)
+
+            # Surface the metadata as soon as the first two lines have landed
+            if not headline_announced and report_text.count('\n') >= 2:
+                headline, subline = parse_headline_and_subline(report_text)
+                print(f"\n📰 Headline: {headline}\n📰 Subline: {subline}\n", flush=True)
+                headline_announced = True
+
+    print()
+    return report_text
+
+
+@traced()
 def compile_weekly_data_package(target_date_str: Optional[str] = None) -> Tuple[Optional[str], bool, bool]:
     """
-    Ingests and structures the raw CSV data into a comprehensive JSON context payload for the LLM.
+    Queries the league database and structures the results into a comprehensive JSON context 
+    payload for the LLM.
     
     This function utilizes dynamic temporal resolution. If a target date is provided, it retrieves 
     data specifically for the 7 days leading up to that date. If no date is provided, it defaults 
@@ -66,76 +322,51 @@ def compile_weekly_data_package(target_date_str: Optional[str] = None) -> Tuple[
     """
     try:
         # --- PHASE 1: INGEST STATIC CONTEXT ---
-        standings = pd.read_csv(TEAM_STATS_FILE).to_dict(orient='records')
-        player_stats = pd.read_csv(PLAYER_STATS_FILE).to_dict(orient='records')
-        
-        playoff_standings = []
-        if os.path.exists(PLAYOFF_STATS_FILE):
-            playoff_standings = pd.read_csv(PLAYOFF_STATS_FILE).to_dict(orient='records')
-            
-        playoff_series = []
-        if os.path.exists(PLAYOFF_MATCHUP_FILE):
-            playoff_series = pd.read_csv(PLAYOFF_MATCHUP_FILE).to_dict(orient='records')
-        
-        details_df = pd.read_csv(DETAILS_FILE)
-        manifest_df = pd.read_csv(MANIFEST_FILE)
-        
-        # Ensure schema safety for narrative metadata
-        if 'Notes' not in manifest_df.columns:
-            manifest_df['Notes'] = ""
-            
-        # --- PHASE 2: DATA NORMALIZATION ---
-        # The raw manifest lacks year declarations. Impute the correct year based on 
-        # standard winter sports seasonality (Fall = Year 1, Winter/Spring = Year 2).
-        def append_year(date_str: str) -> str:
-            if pd.isna(date_str): 
-                return date_str
-            if any(m in str(date_str) for m in ['Jan', 'Feb', 'Mar', 'Apr']):
-                return f"{date_str} 2026"
-            return f"{date_str} 2025"
-            
-        manifest_df['Date'] = manifest_df['Date'].apply(append_year)
-        
-        # Suppress Pandas parsing warnings for mixed formats to maintain clean terminal output
-        warnings.filterwarnings('ignore', category=UserWarning, module='pandas')
-        manifest_df['ParsedDate'] = pd.to_datetime(manifest_df['Date'], format='mixed', errors='coerce')
-            
-        # --- PHASE 3: TEMPORAL RESOLUTION ---
-        if target_date_str:
-            # Set bounding box to the absolute end of the target day
-            target_date = pd.to_datetime(target_date_str).replace(hour=23, minute=59, second=59)
-        else:
-            # Auto-resolve to the most recent game played in the entire dataset
-            latest_game_date = manifest_df['ParsedDate'].max()
-            if pd.notna(latest_game_date):
-                target_date = latest_game_date.replace(hour=23, minute=59, second=59)
+        # Served from the warm stats snapshot (rebuilt automatically after an analyzer run)
+        stats = get_service()
+        if not (stats.has_table("team_stats") and stats.has_table("player_stats")):
+            raise ValueError("Standings and player stats not found. Run the analyzer first.")
+        standings = stats.standings()
+        leaders = stats.leaders(limit=BRIEF_LEADER_LIMIT)
+        playoff_standings = stats.standings(playoffs=True)
+        playoff_series = stats.series()
+
+        with open_db() as db:
+            # --- PHASE 2: TEMPORAL RESOLUTION ---
+            # Game dates are resolved (season year imputed) when the schedule is stored
+            if target_date_str:
+                # Set bounding box to the absolute end of the target day
+                target_date = pd.to_datetime(target_date_str).replace(hour=23, minute=59, second=59)
             else:
-                target_date = datetime.now().replace(hour=23, minute=59, second=59)
-            
-        # Establish the 7-day historical lookback window
-        seven_days_ago = target_date - timedelta(days=7)
-        
-        # Filter dataset to prevent future data leakage into historical reports
-        past_manifest = manifest_df[manifest_df['ParsedDate'] <= target_date]
-        
-        # Isolate the specific games played within our active 7-day reporting window
-        this_week_manifest = past_manifest[past_manifest['ParsedDate'] > seven_days_ago]
-        recent_game_ids = this_week_manifest['GameID'].astype(str).unique()
-        
-        # Filter granular play-by-play details to match the active window
-        details_df['GameID'] = details_df['GameID'].astype(str)
-        this_week_details = details_df[details_df['GameID'].isin(recent_game_ids)].copy()
-        
-        # Map referee and official assignments for the active games
-        officials = this_week_details[this_week_details['EventType'] == 'Official']
-        ref_map = officials.groupby('GameID')['Description'].apply(list).to_dict()
+                # Auto-resolve to the most recent game played in the entire dataset
+                latest_game_date = db.latest_game_date()
+                if latest_game_date:
+                    target_date = pd.to_datetime(latest_game_date).replace(hour=23, minute=59, second=59)
+                else:
+                    target_date = datetime.now().replace(hour=23, minute=59, second=59)
+
+            # --- PHASE 3: WINDOW QUERIES ---
+            # Games up to the target date only, preventing future data leakage into historical
+            # reports; the 7-day reporting window is its trailing week (date-indexed range scans)
+            until = target_date.strftime('%Y-%m-%d')
+            past_manifest = db.manifest(until=until)
+            this_week_manifest = db.manifest(since=(target_date - timedelta(days=6)).strftime('%Y-%m-%d'), until=until)
+            recent_game_ids = this_week_manifest['GameID'].astype(str).unique()
+
+            # Granular play-by-play details for the active window only (GameID index lookups)
+            this_week_details = db.events(game_ids=recent_game_ids)
 
+        # --- PHASE 4: DATA NORMALIZATION ---
+        # The raw manifest lacks year declarations; the analyzer's seasonality rule supplies them
+        past_manifest['Date'] = past_manifest['Date'].apply(impute_season_year)
+        this_week_manifest['Date'] = this_week_manifest['Date'].apply(impute_season_year)
+        
         # Simplify manifest for LLM consumption
         recent_manifest = this_week_manifest[
             ['GameID', 'Home', 'Away', 'Date', 'Score', 'Facility', 'Notes', 'GameType']
         ]
 
-        # --- PHASE 4: SEASONAL HEURISTICS ---
+        # --- PHASE 5: SEASONAL HEURISTICS ---
         # Determine operational mode (Regular Season vs. Playoffs vs. Finals)
         game_types = recent_manifest['GameType'].fillna("")
         is_playoffs = game_types.str.contains('Playoff|Semi-Final|Final', case=False, regex=True).any()
@@ -147,7 +378,7 @@ def compile_weekly_data_package(target_date_str: Optional[str] = None) -> Tuple[
         # Extract historical records of matchups that occurred prior to the target date
         historical_scores = past_manifest[['Date', 'Home', 'Away', 'Score', 'GameType']].to_dict(orient='records')
 
-        # --- PHASE 5: PAYLOAD CONSTRUCTION ---
+        # --- PHASE 6: PAYLOAD CONSTRUCTION ---
         brief = {
             "is_playoff_mode": bool(is_playoffs),
             "is_finals_mode": is_finals,
@@ -156,14 +387,13 @@ def compile_weekly_data_package(target_date_str: Optional[str] = None) -> Tuple[
                 "playoff_rankings_table": playoff_standings,
                 "regular_season_standings": standings,
                 "historical_matchup_scores": historical_scores,
-                "individual_leaders": player_stats,
-                "weekly_play_by_play": this_week_details.to_dict(orient='records'),
-                "schedule_and_arenas": recent_manifest.to_dict(orient='records'),
-                "official_assignments": ref_map
+                "individual_leaders": leaders,
+                "weekly_game_summaries": build_game_summaries(this_week_details, recent_manifest),
+                "schedule_and_arenas": recent_manifest.to_dict(orient='records')
             },
             "report_metadata": {
                 "current_date": target_date.strftime('%B %d, %Y'),
-                "target_audience": "Toronto-based adult hockey players (25-35)"
+                "target_audience": f"{DIVISION.city}-based adult hockey players (25-35)"
             }
         }
         
@@ -174,7 +404,9 @@ def compile_weekly_data_package(target_date_str: Optional[str] = None) -> Tuple[
         return None, False, False
 
 
-def generate_weekly_digest_report(target_date_str: Optional[str] = None):
+@traced()
+def generate_weekly_digest_report(target_date_str: Optional[str] = None, stream: bool = False,
+                                  drafts: int = 1) -> Optional[str]:
     """
     Executes the LLM generation pipeline.
     
@@ -184,13 +416,26 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
     
     Args:
         target_date_str (str, optional): Target reporting date in 'YYYY-MM-DD' format.
+        stream (bool): Consume the model's token stream and write the draft incrementally.
+        drafts (int): Generate this many drafts concurrently and publish the first that passes
+            the factual audit (see `draft_best_of_n`). Streaming applies to single drafts only.
+        
+    Returns:
+        str | None: The path of the published post, or None if generation failed.
+        
+    Raises:
+        NoPassingDraft: If best-of-N drafting produced no draft that passes the factual audit.
     """
     package = compile_weekly_data_package(target_date_str) 
     if not package[0]: 
-        return
+        return None
     
     json_brief, is_playoffs, is_finals = package
 
+    # Stars, Hardware and Series Tracker are computed deterministically; the LLM only writes prose
+    with span("reporter.render_stat_sections"):
+        stat_sections = render_stat_sections(json.loads(json_brief), is_playoffs, is_finals)
+
     # Console logging for pipeline visibility
     if is_finals:
         print("🎙️ Generating Mode: CHAMPIONSHIP FINALE")
@@ -200,9 +445,9 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
         print("🎙️ Generating Mode: REGULAR SEASON")
     
     # --- PROMPT ARCHITECTURE: Core Identity ---
-    base_instructions = """
+    base_instructions = f"""
     <identity>
-    You are the Senior Columnist for 'The Low B Dispatch,' a data-driven hockey newsletter covering the DMHL Monday/Wednesday Low B division in Toronto. Your writing style sits at the intersection of 'The Athletic' (analytical, deep-dive journalism) and 'The Players' Tribune' (authentic, player-focused storytelling), delivered with the sharp wit of a respected community peer.
+    You are the Senior Columnist for '{DIVISION.publication},' a data-driven hockey newsletter covering the {DIVISION.league} {DIVISION.name} division in {DIVISION.city}. Your writing style sits at the intersection of 'The Athletic' (analytical, deep-dive journalism) and 'The Players' Tribune' (authentic, player-focused storytelling), delivered with the sharp wit of a respected community peer.
     </identity>
 
     <style_guide>
@@ -221,18 +466,18 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
 
     # --- PROMPT ARCHITECTURE: Dynamic Sub-Routines ---
     if is_finals:
-        mode_instructions = """
+        mode_instructions = f"""
         <narrative_strategy>
-        1. THE CHAMPIONSHIP HOOK: This is the absolute final report of the season. Open with the crowning of the DMHL Low B Champion. Describe how they won the final matchup based strictly on the recap data.
+        1. THE CHAMPIONSHIP HOOK: This is the absolute final report of the season. Open with the crowning of the {DIVISION.league} {DIVISION.short_name} Champion. Describe how they won the final matchup based strictly on the recap data.
         2. SEASON RETROSPECTIVE: Step back and provide a compelling, overarching summary of the season. Did a juggernaut go wire-to-wire? Did a 'Lucky Loser' make a Cinderella run? Use the regular season and playoff standings data to paint the picture.
-        3. HARDWARE HANDOUT (TOP POINT GETTERS): Scan the 'individual_leaders' data to identify the absolute top 3 scoring leaders of the season. Dedicate a section to honoring their statistical dominance.
+        3. HARDWARE HANDOUT (TOP POINT GETTERS): The Hardware leaderboard is rendered for you. You may weave the leaders into the season narrative, but do not list their totals.
         4. PROSE FLOW: Make it feel like a grand finale. It should be celebratory, definitive, and sharp.
         5. COMMISSIONER INSIGHTS: Use 'Notes' for atmosphere.
         </narrative_strategy>
 
         <data_guardrails>
-        1. THE SOURCE OF TRUTH: Crown the champion based on the 'weekly_play_by_play' and 'schedule_and_arenas' data. Do not hallucinate a winner.
-        2. DATA AGGREGATION: Pull the top scorers strictly from 'individual_leaders'.
+        1. THE SOURCE OF TRUTH: Crown the champion based on the 'weekly_game_summaries' and 'schedule_and_arenas' data. Do not hallucinate a winner.
+        2. DATA AGGREGATION: Refer to individual statistics only as they appear in 'individual_leaders' or the pre-rendered stat sections.
         </data_guardrails>
 
         <format_requirements>
@@ -240,13 +485,8 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
         - Subline: [One punchy sentence summarizing the final victory and putting a bow on the season.]
         - The Lede: [Crown the champion. Recap the final game(s) that sealed the deal in a flowing, dramatic paragraph.]
         - Season in Review: [1-2 paragraphs summarizing the overarching storylines of the entire season. Reference regular season dominance vs playoff reality.]
-        - The Hardware (League Leaders): [List the top 3 overall point getters from the data. Format: **[Name] ([Team]) - [Total Points] Pts**. Add a brief sentence honoring their dominance.]
-        - The Final Dispatch Three Stars: [Exactly THREE stars for the championship game heroes.]
-          * Format: **[1st/2nd/3rd] Star: [Player Name] ([Team])** - [G]G, [A]A, [Pts]Pts. - [Reasoning]. 
-          * 1st Star: "The Championship MVP" (The ultimate clutch performer of the final game)
-          * 2nd Star: "The Stat Sheet Stuffer" 
-          * 3rd Star: "The Unsung Hero" (Defense, special teams, or crucial momentum shifts)
-        - Length: Target 450-550 words.
+        - Stat Sections: The Hardware (League Leaders) and The Final Dispatch Three Stars are appended automatically. Do NOT write them.
+        - Length: Target 350-450 words.
         </format_requirements>
         """
         task_instruction = "Task: Generate the Championship End-of-Season recap, crowning the champion, summarizing the storylines, and honoring the top scorers."
@@ -263,8 +503,7 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
         - Subline: [One sentence analytical summary]
         - The Lede: [Punchy storyline hook]
         - The Matchups: [Markdown headings for each series with recaps]
-        - The Dispatch Three Stars: [Exactly THREE stars for the week's heroes.]
-          * Format: **[1st/2nd/3rd] Star: [Player Name] ([Team])** - [G]G, [A]A, [Pts]Pts. - [Reasoning]. 
+        - Stat Sections: The Series Tracker and The Dispatch Three Stars are appended automatically. Do NOT write them.
         </format_requirements>
         """
         task_instruction = "Task: Generate the weekly Playoff wrap-up."
@@ -281,74 +520,68 @@ def generate_weekly_digest_report(target_date_str: Optional[str] = None):
         - Subline: [Contextual summary]
         - The Lede: [Standings shift or storyline]
         - The Recaps: [Combine recaps into a narrative]
-        - The Dispatch Three Stars: [Exactly THREE stars for the week's heroes.]
-          * Format: **[1st/2nd/3rd] Star: [Player Name] ([Team])** - [G]G, [A]A, [Pts]Pts. - [Reasoning]. 
+        - Stat Sections: The Dispatch Three Stars are appended automatically. Do NOT write them.
         </format_requirements>
         """
         task_instruction = "Task: Generate the Regular Season wrap-up."
 
-    prompt = f"DATA BRIEF:\n{json_brief}\n\n{task_instruction}"
+    prompt = (
+        f"DATA BRIEF:\n{json_brief}\n\n"
+        f"PRE-RENDERED STAT SECTIONS (appended after your text, do not repeat):\n{stat_sections}\n\n"
+        f"{task_instruction}"
+    )
+    contents = [base_instructions, mode_instructions, prompt]
     
     try:
-        # Execute LLM call
-        response = client.models.generate_content(
-            model="gemini-2.5-flash", 
-            contents=[base_instructions, mode_instructions, prompt]
-        )
-        report_text = response.text
-        
-        # --- POST-PROCESSING & FORMATTING ---
-        # Evaluate output for team mentions to dynamically assign header artwork
-        teaser_logo = "/assets/images/rink-header.jpg"
-        for team, logo_path in LOGO_MAP.items():
-            if team in report_text:
-                teaser_logo = logo_path
-                break
-
-        # Parse generated text to isolate the headline and subline for Jekyll metadata
-        lines = report_text.strip().split('\n')
-        generated_headline = lines[0].replace('#', '').strip()
-        generated_subline = lines[1].strip() if len(lines) > 1 else "The Season Wraps Up."
-
-        # Ensure output directory structure exists
-        os.makedirs(POSTS_DIR, exist_ok=True)
-        
-        # Determine appropriate filename via target date or dynamic resolution
-        if target_date_str:
-            file_date = datetime.strptime(target_date_str, "%Y-%m-%d") 
+        filepath = resolve_post_filepath(target_date_str, json_brief)
+
+        if drafts > 1:
+            if stream:
+                print("⚠️ Streaming is disabled when drafting multiple candidates.")
+                stream = False
+            report_text, post = draft_best_of_n(contents, stat_sections, filepath, drafts)
         else:
-            file_date_str = json.loads(json_brief)['report_metadata']['current_date']
-            file_date = datetime.strptime(file_date_str, '%B %d, %Y')
-            
-        filename = f"{file_date.strftime('%Y-%m-%d')}-dispatch.md"
-        filepath = os.path.join(POSTS_DIR, filename)
-        
-        # Construct Jekyll configuration block
-        front_matter = f"""---
-layout: single
-title: "{generated_headline}"
-excerpt: "{generated_subline}"
-header:
-  teaser: "{teaser_logo}"
-author_profile: true
----
+            if stream:
+                # Stream tokens straight to a draft file so progress is visible and survives crashes
+                prose = stream_report_to_draft(contents, f"{filepath}{DRAFT_SUFFIX}")
+            else:
+                # Execute LLM call
+                prose = backend.generate(contents, call_site="reporter").text
+            report_text, post = render_post(prose, stat_sections)
 
-"""
-        # Write asset to disk
-        with open(filepath, "w") as f:
-            f.write(front_matter)
-            f.write(report_text)
+        # Write asset to disk in a single atomic swap
+        commit_post_atomically(filepath, post)
+        if stream and os.path.exists(f"{filepath}{DRAFT_SUFFIX}"):
+            os.remove(f"{filepath}{DRAFT_SUFFIX}")
 
         print(f"\n✅ Published: {filepath}")
-        print("-" * 30)
-        print(report_text)
+        if stream:
+            # Streaming mode has already echoed the prose as it arrived
+            print(stat_sections)
+        else:
+            print("-" * 30)
+            print(report_text)
+        return filepath
 
+    except NoPassingDraft as e:
+        # A verdict rather than a failure: nothing is published and the run is blocked
+        print(f"🛑 {e}")
+        raise
     except Exception as e:
         print(f"❌ LLM Generation or File Writing Error: {e}")
+        return None
 
 
 if __name__ == "__main__":
     # Allow for temporal testing by accepting a date string via the CLI 
-    # (e.g., `python3 src/reporter.py 2026-03-25`)
-    passed_date = sys.argv[1] if len(sys.argv) > 1 else None
-    generate_weekly_digest_report(passed_date)
\ No newline at end of file
+    # (e.g., `python3 src/reporter.py 2026-03-25 --stream` or `--drafts 3`)
+    parser = argparse.ArgumentParser(description="Generate the weekly dispatch.")
+    parser.add_argument("date", nargs="?", default=None, help="Report date (YYYY-MM-DD). Defaults to the latest games.")
+    parser.add_argument("--stream", action="store_true", help="Stream the report as it is generated.")
+    parser.add_argument("--drafts", type=int, default=1, help="Concurrent drafts; the first to pass the factual audit is published.")
+    args = parser.parse_args()
+    try:
+        generate_weekly_digest_report(args.date, stream=args.stream, drafts=args.drafts)
+    except NoPassingDraft:
+        from gate_policy import EXIT_BLOCKED
+        raise SystemExit(EXIT_BLOCKED)
\ No newline at end of file
@@ -1,22 +1,29 @@
 import os
 import time
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import WebDriverException, InvalidSessionIdException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from tracing import traced
+from leagues import active_division
+from league_db import open_db, scrape_batch_id
 
 # --- CONFIGURATION ---
-HUB_URL = "https://www.dmhl.ca/stats#/533/scores?division_id=41979"
-BOXSCORE_TEMPLATE = "https://www.dmhl.ca/stats#/533/game/{game_id}/boxscore"
+# The division's registered URLs (see leagues.py), overridable so the scraper (and watcher)
+# can run against a local stand-in league site
+DIVISION = active_division()
+HUB_URL = os.getenv("LEAGUE_HUB_URL", DIVISION.hub_url)
+BOXSCORE_TEMPLATE = os.getenv("LEAGUE_BOXSCORE_URL", DIVISION.boxscore_url)
 
-# File Persistence
-DATA_DIR = "data"
-DETAILS_FILE = os.path.join(DATA_DIR, "game_details.csv")
-MANIFEST_FILE = os.path.join(DATA_DIR, "games_manifest.csv")
+MANIFEST_ROW_XPATH = "//main//table//tbody/tr[@role='article']"
+MANIFEST_SETTLE_SCROLLS = 12  # Upper bound; scrolling stops once the row count is stable
 
+# File Persistence (the league database, with CSV exports alongside; see league_db.py)
+DATA_DIR = DIVISION.data_dir
+
+@traced()
 def initialize_headless_browser():
     """Initializes a headless Chrome instance for CI/CD compatibility."""
     options = Options()
@@ -43,24 +50,30 @@ def format_event_record(game_id, event_type, team="N/A", desc="N/A", strength="N
         'Time': time_val if time_val else "N/A"
     }
 
-def scrape_division_manifest(driver):
+@traced()
+def scrape_division_manifest(driver, hub_url=None):
     """
     Fetches the high-level league schedule and merges it with local Commissioner insights.
     Logic ensures that manual human enrichment is preserved across automated scrape cycles.
     """
     print(f"Building manifest...")
-    driver.get(HUB_URL)
+    driver.get(hub_url or HUB_URL)
     try:
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.XPATH, "//main//table//tbody/tr[@role='article']")))
+        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.XPATH, MANIFEST_ROW_XPATH)))
     except:
         return []
 
-    # Angular settle time: Ensures dynamic content is fully rendered
-    for _ in range(12):
+    # Angular settle time: keep scrolling until lazily rendered rows stop appearing
+    row_count, stable_checks = -1, 0
+    for _ in range(MANIFEST_SETTLE_SCROLLS):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(0.5)
+        current = len(driver.find_elements(By.XPATH, MANIFEST_ROW_XPATH))
+        stable_checks = stable_checks + 1 if current == row_count else 0
+        if stable_checks >= 2: break
+        row_count = current
     
-    rows = driver.find_elements(By.XPATH, "//main//table//tbody/tr[@role='article']")
+    rows = driver.find_elements(By.XPATH, MANIFEST_ROW_XPATH)
     manifest_data, seen_ids = [], set()
     
     for row in rows:
@@ -95,38 +108,24 @@ def scrape_division_manifest(driver):
         except: continue
             
     # --- DATA INTEGRITY: Commissioner Note Preservation ---
-    # We treat the existing manifest as the secondary source of truth for 'Notes'
-    new_df = pd.DataFrame(manifest_data)
-    
-    if os.path.exists(MANIFEST_FILE):
-        old_df = pd.read_csv(MANIFEST_FILE)
-        
-        # Standardize GameID types to prevent 'False Misses' during the map
-        old_df['GameID'] = old_df['GameID'].astype(str)
-        new_df['GameID'] = new_df['GameID'].astype(str)
-        
-        if 'Notes' in old_df.columns:
-            # Map existing notes back to the new manifest using GameID as the Unique Key.
-            # This 'Left Join' ensures manual insights survive the schedule update.
-            notes_map = old_df.set_index('GameID')['Notes'].to_dict()
-            new_df['Notes'] = new_df['GameID'].map(notes_map).fillna("")
-            print("📝 Preserved existing Commissioner notes.")
-        else:
-            new_df['Notes'] = ""
-    else:
-        new_df['Notes'] = ""
-
-    new_df.to_csv(MANIFEST_FILE, index=False)
-    print(f"✅ Manifest complete: {len(new_df)} games indexed.")
+    # Notes live in their own table keyed by GameID, so manual insights survive the schedule
+    # update; the schedule swap and the manifest CSV export commit as one transaction.
+    if not manifest_data:
+        print("⚠️ No games parsed from the schedule; keeping the stored manifest.")
+        return manifest_data
+    with open_db() as db:
+        db.replace_schedule(manifest_data)
+    print(f"✅ Manifest complete: {len(manifest_data)} games indexed.")
     return manifest_data
 
-def scrape_detailed_boxscore(driver, game_id):
+@traced()
+def scrape_detailed_boxscore(driver, game_id, boxscore_template=None):
     """
     Deep-dives into a specific game's boxscore.
     Uses established CSS/XPath patterns to extract rosters, goals, and penalties.
     """
     print(f" | 🏒 Boxscore:", end=" ", flush=True)
-    target_url = BOXSCORE_TEMPLATE.format(game_id=game_id)
+    target_url = (boxscore_template or BOXSCORE_TEMPLATE).format(game_id=game_id)
     
     for attempt in range(3):
         driver.get(target_url)
@@ -195,47 +194,68 @@ def scrape_detailed_boxscore(driver, game_id):
     print("Failed.")
     return []
 
+def forfeit_event_records(game):
+    """Builds the final-score and official records for a forfeited game (no boxscore exists)."""
+    gid = str(game['GameID'])
+    s_parts = str(game.get('Score')).split('-')
+    h_score, a_score = (s_parts[0].strip(), s_parts[1].strip()) if len(s_parts) > 1 else ("0", "0")
+    return [
+        format_event_record(gid, 'PeriodScore', team=game['Home'], desc=h_score, period='Final'),
+        format_event_record(gid, 'PeriodScore', team=game['Away'], desc=a_score, period='Final'),
+        format_event_record(gid, 'Official', desc='Status: Official Forfeit')
+    ]
+
+def scrape_game_events(driver, game, boxscore_template=None):
+    """
+    Collects every event record for one manifest game.
+    Forfeits are recorded from the manifest alone; played games are deep-scraped.
+    Every record is stamped with one scrape batch id, so a batch stored twice can be told
+    apart from identical events within one game.
+    """
+    gid = str(game['GameID'])
+    print(f"[{gid}] {game.get('Home')} vs {game.get('Away')}", end="")
+
+    # Edge Case: Handle Forfeits without deep-scraping empty boxscores
+    if str(game.get('Status')).strip().lower() == "forfeit":
+        print(" 🏳️ Recording Forfeit...", end="")
+        events = forfeit_event_records(game)
+        print(" Done.")
+    else:
+        events = scrape_detailed_boxscore(driver, gid, boxscore_template)
+
+    batch = scrape_batch_id()
+    for event in events:
+        event['ScrapedAt'] = batch
+    return events
+
+def append_game_events(events):
+    """Stores one game's scraped event records (replacing any earlier scrape of that game)."""
+    with open_db() as db:
+        db.replace_game_events(events[0]['GameID'], events)
+
+def load_scraped_game_ids():
+    """Returns the GameIDs that already have telemetry on file."""
+    with open_db() as db:
+        return db.scraped_game_ids()
+
+@traced()
 def run_scraping_pipeline():
     """Execution entry point: coordinates the manifest build and boxscore deep-scrape."""
-    if not os.path.exists(DATA_DIR): os.makedirs(DATA_DIR)
+    if not os.path.exists(DATA_DIR): os.makedirs(DATA_DIR, exist_ok=True)
     driver = initialize_headless_browser()
     try:
         manifest = scrape_division_manifest(driver)
-        existing_gids = set()
-        if os.path.exists(DETAILS_FILE):
-            existing_gids = set(pd.read_csv(DETAILS_FILE)['GameID'].astype(str).values)
-            
+        # Skip games already in the database to optimize run-time
+        existing_gids = load_scraped_game_ids()
         games_to_scrape = [game for game in manifest if str(game['GameID']) not in existing_gids]
         
         print(f"\n🔍 Found {len(games_to_scrape)} new game(s) since last publication.\n")
-        for game in manifest:
-            gid = str(game['GameID'])
-            
-            # Skip games already in the database to optimize run-time
-            if os.path.exists(DETAILS_FILE):
-                if gid in pd.read_csv(DETAILS_FILE)['GameID'].astype(str).values: continue
-
-            print(f"[{gid}] {game.get('Home')} vs {game.get('Away')}", end="")
-            
-            # Edge Case: Handle Forfeits without deep-scraping empty boxscores
-            if str(game.get('Status')).strip().lower() == "forfeit":
-                print(" 🏳️ Recording Forfeit...", end="")
-                s_parts = str(game.get('Score')).split('-')
-                h_score, a_score = (s_parts[0].strip(), s_parts[1].strip()) if len(s_parts) > 1 else ("0", "0")
-                f_events = [
-                    format_event_record(gid, 'PeriodScore', team=game['Home'], desc=h_score, period='Final'),
-                    format_event_record(gid, 'PeriodScore', team=game['Away'], desc=a_score, period='Final'),
-                    format_event_record(gid, 'Official', desc='Status: Official Forfeit')
-                ]
-                pd.DataFrame(f_events).to_csv(DETAILS_FILE, mode='a', header=not os.path.exists(DETAILS_FILE), index=False)
-                print(" Done.")
-                continue
-
+        for game in games_to_scrape:
             # Core Boxscore Extraction
             try:
-                combined_events = scrape_detailed_boxscore(driver, gid)
+                combined_events = scrape_game_events(driver, game)
                 if combined_events:
-                    pd.DataFrame(combined_events).to_csv(DETAILS_FILE, mode='a', header=not os.path.exists(DETAILS_FILE), index=False)
+                    append_game_events(combined_events)
             except (InvalidSessionIdException, WebDriverException):
                 # Resilience: Restart browser session if connection hangs
                 driver.quit(); driver = initialize_headless_browser(); continue
@@ -243,4 +263,4 @@ def run_scraping_pipeline():
         driver.quit()
 
 if __name__ == "__main__":
-    run_scraping_pipeline()
\ No newline at end of file
+    run_scraping_pipeline()
@@ -0,0 +1,174 @@
+"""
+Entry-Point Startup Benchmark
+
+Measures the cold-start cost of every pipeline entry point with `python -X importtime`:
+each module is imported in a fresh interpreter, its cumulative import time and the
+process wall time are recorded, and the heaviest direct imports are listed so regressions
+can be traced to a specific dependency.
+
+Every run is appended to `data/startup_bench.jsonl` and compared against the previous one,
+so start-up cost is tracked per entry point over time.
+
+Usage:
+    python3 src/startup_bench.py [--repeat 5] [--modules validator bias_checker] [--no-save]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# --- CONFIGURATION & CONSTANTS ---
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = "data/startup_bench.jsonl"
+DEFAULT_REPEAT = 3
+TOP_IMPORTS = 3
+
+ENTRY_POINTS = [
+    "pipeline", "scraper", "enricher", "analyzer", "viz_generator", "reporter",
+    "validator", "bias_checker", "gate", "scout", "backfill_reports",
+]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str, int]]:
+    """
+    Parses `-X importtime` output.
+
+    Args:
+        stderr (str): The interpreter's stderr.
+
+    Returns:
+        List[Tuple[int, str, int]]: (nesting depth, module name, cumulative microseconds)
+        for every import, in the order the interpreter reported them.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, raw_name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header row
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        imports.append((depth, raw_name.strip(), int(cumulative)))
+    return imports
+
+
+def measure_entry_point(module: str) -> Dict[str, Any]:
+    """
+    Imports one module in a fresh interpreter and times it.
+
+    Args:
+        module (str): Module name under src/.
+
+    Returns:
+        Dict[str, Any]: 'import_ms', 'wall_ms' and the 'heaviest' direct imports, or 'error'.
+    """
+    code = f"import sys; sys.path.insert(0, {SRC_DIR!r}); import {module}"
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+
+    imports = parse_importtime(proc.stderr)
+    position = next((i for i, (depth, name, _) in enumerate(imports) if depth == 0 and name == module), None)
+    if position is None:
+        return {"error": "module not found in importtime output"}
+
+    # Children are reported (depth 1) immediately before their parent, back to the previous top-level import
+    children = []
+    for depth, name, us in reversed(imports[:position]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((name, us))
+    own_us = imports[position][2]
+    heaviest = sorted(children, key=lambda item: -item[1])[:TOP_IMPORTS]
+    return {
+        "import_ms": round(own_us / 1000, 1),
+        "wall_ms": round(wall_ms, 1),
+        "heaviest": [[name, round(us / 1000, 1)] for name, us in heaviest],
+    }
+
+
+def run_benchmark(modules: List[str], repeat: int = DEFAULT_REPEAT) -> Dict[str, Dict[str, Any]]:
+    """
+    Measures each entry point `repeat` times and keeps the median run.
+
+    Args:
+        modules (List[str]): Entry points to measure.
+        repeat (int): Fresh-interpreter runs per entry point.
+
+    Returns:
+        Dict[str, Dict]: Per-module median results (see `measure_entry_point`).
+    """
+    results = {}
+    for module in modules:
+        runs = [measure_entry_point(module) for _ in range(max(1, repeat))]
+        ok = [r for r in runs if "error" not in r]
+        if not ok:
+            results[module] = runs[0]
+            continue
+        median_import = statistics.median(r["import_ms"] for r in ok)
+        results[module] = min(ok, key=lambda r: abs(r["import_ms"] - median_import))
+    return results
+
+
+def load_previous(path: str = HISTORY_FILE) -> Optional[Dict[str, Any]]:
+    """Returns the most recent recorded benchmark, if any."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=SRC_DIR).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def report(results: Dict[str, Dict[str, Any]], previous: Optional[Dict[str, Any]]) -> None:
+    """Prints the per-entry-point table with deltas against the previous run."""
+    before = (previous or {}).get("results", {})
+    print(f"{'ENTRY POINT':<18} {'IMPORT':>9} {'WALL':>9} {'Δ IMPORT':>10}  HEAVIEST IMPORTS")
+    print("-" * 90)
+    for module, result in results.items():
+        if "error" in result:
+            print(f"{module:<18} {'—':>9} {'—':>9} {'':>10}  ⚠️ {result['error']}")
+            continue
+        prior = before.get(module, {}).get("import_ms")
+        delta = f"{result['import_ms'] - prior:+.1f}" if prior is not None else ""
+        heaviest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in result["heaviest"])
+        print(f"{module:<18} {result['import_ms']:>7.1f}ms {result['wall_ms']:>7.1f}ms {delta:>10}  {heaviest}")
+    if previous:
+        print(f"\nΔ vs. {previous.get('timestamp')} ({previous.get('revision') or 'unknown revision'})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import cost per entry point.")
+    parser.add_argument("--modules", nargs="+", default=ENTRY_POINTS, help="Entry points to measure.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Fresh interpreters per entry point.")
+    parser.add_argument("--no-save", action="store_true", help=f"Do not append the run to {HISTORY_FILE}.")
+    args = parser.parse_args()
+
+    print(f"⏱️  Measuring {len(args.modules)} entry point(s) x {args.repeat} cold start(s)...\n")
+    previous = load_previous()
+    results = run_benchmark(args.modules, args.repeat)
+    report(results, previous)
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        record = {"timestamp": datetime.now().isoformat(timespec="seconds"), "revision": _git_revision(),
+                  "python": sys.version.split()[0], "results": results}
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"💾 Recorded in {HISTORY_FILE}")
@@ -0,0 +1,221 @@
+"""
+Deterministic Stat-Section Renderer
+
+This module computes the purely statistical sections of a dispatch (The Dispatch Three
+Stars, The Hardware leaderboard, and the playoff Series Tracker) directly from the data
+brief and renders them from fixed Markdown templates.
+
+Because these sections are derived programmatically rather than generated, the LLM is
+only asked to write narrative prose, and the rendered block is wrapped in HTML comment
+markers so the factual validator can skip it entirely.
+
+pandas (and the analyzer) are imported inside the rendering functions: the audit gates
+only need `strip_stat_sections` and should not pay pandas' import cost at start-up.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# --- CONFIGURATION & CONSTANTS ---
+SECTION_START = "<!-- stat-sections:start -->"
+SECTION_END = "<!-- stat-sections:end -->"
+
+STAR_LABELS = ["1st", "2nd", "3rd"]
+HARDWARE_SIZE = 3
+SERIES_TARGET = 3  # Series points required to advance ("Race to Three")
+
+
+# --- STAT COMPUTATION ---
+
+def tally_window_lines(lines: Optional["pd.DataFrame"], game_ids: Iterable[str]) -> "pd.DataFrame":
+    """
+    Aggregates per-player scoring lines for the games in the reporting window by slicing 
+    the analyzer's materialized player-game table.
+
+    Args:
+        lines (pd.DataFrame | None): Output of `analyzer.load_player_game_lines`.
+        game_ids (Iterable[str]): GameIDs inside the reporting window.
+
+    Returns:
+        pd.DataFrame: One row per point-getter (Player, Team, GP, G, A, Pts, PPG, SHG, GWG),
+        ranked by points, then goals, then game-winners.
+    """
+    import pandas as pd
+    from analyzer import summarize_player_lines
+
+    columns = ['Player', 'Team', 'GP', 'G', 'A', 'Pts', 'PPG', 'SHG', 'GWG']
+    if lines is None or lines.empty:
+        return pd.DataFrame(columns=columns)
+
+    flat = lines.reset_index()
+    window = flat[flat['GameID'].astype(str).isin({str(g) for g in game_ids})]
+    table = summarize_player_lines(window)
+    table = table[table['Pts'] > 0]
+    table = table.sort_values(by=['Pts', 'G', 'GWG', 'Player'], ascending=[False, False, False, True])
+    return table[columns].reset_index(drop=True)
+
+
+def select_three_stars(window_lines: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """
+    Picks the top three performers of the window (most points, favoring goals).
+
+    Args:
+        window_lines (pd.DataFrame): Output of `tally_window_lines`.
+
+    Returns:
+        List[Dict]: Up to three star records in ranked order.
+    """
+    return window_lines.head(len(STAR_LABELS)).to_dict(orient='records')
+
+
+def select_hardware_leaders(player_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Selects the season's top point-getters, keeping anyone tied with the final spot.
+
+    Args:
+        player_stats (List[Dict]): Season leaderboard records from the analyzer.
+
+    Returns:
+        List[Dict]: The leaderboard podium (may exceed three entries on ties).
+    """
+    if not player_stats:
+        return []
+    import pandas as pd
+
+    leaders = pd.DataFrame(player_stats)
+    leaders = leaders.sort_values(by=['Pts', 'G'], ascending=False).reset_index(drop=True)
+    cutoff = leaders.iloc[min(HARDWARE_SIZE, len(leaders)) - 1]['Pts']
+    return leaders[leaders['Pts'] >= cutoff].to_dict(orient='records')
+
+
+# --- TEMPLATES ---
+
+def _star_reasoning(star: Dict[str, Any]) -> str:
+    """Builds a factual one-line justification from the star's stat line."""
+    parts = []
+    if star['G']:
+        parts.append(f"{star['G']} goal{'s' if star['G'] != 1 else ''}")
+    if star['A']:
+        parts.append(f"{star['A']} assist{'s' if star['A'] != 1 else ''}")
+    games = f"{star['GP']} game{'s' if star['GP'] != 1 else ''}"
+    summary = f"Recorded {' and '.join(parts) or 'no points'} across {games}"
+
+    extras = []
+    if star['GWG']:
+        extras.append("the game-winner" if star['GWG'] == 1 else f"{star['GWG']} game-winners")
+    if star['PPG']:
+        extras.append(f"{star['PPG']} power-play goal{'s' if star['PPG'] != 1 else ''}")
+    if star['SHG']:
+        extras.append(f"{star['SHG']} shorthanded goal{'s' if star['SHG'] != 1 else ''}")
+    if extras:
+        listed = extras[0] if len(extras) == 1 else f"{', '.join(extras[:-1])} and {extras[-1]}"
+        summary += f", including {listed}"
+    return summary + "."
+
+
+def render_three_stars(stars: List[Dict[str, Any]], is_finals: bool = False) -> str:
+    """
+    Renders the Three Stars section in the house format:
+    **[1st/2nd/3rd] Star: [Player Name] ([Team])** - [G]G, [A]A, [Pts]Pts. - [Reasoning].
+    """
+    title = "The Final Dispatch Three Stars" if is_finals else "The Dispatch Three Stars"
+    out = [f"## {title}", ""]
+    if not stars:
+        out.append("No skater recorded a point in this window.")
+    for label, star in zip(STAR_LABELS, stars):
+        out.append(
+            f"**{label} Star: {star['Player']} ({star['Team']})** - "
+            f"{star['G']}G, {star['A']}A, {star['Pts']}Pts. - {_star_reasoning(star)}"
+        )
+        out.append("")
+    return "\n".join(out).rstrip()
+
+
+def render_hardware(leaders: List[Dict[str, Any]]) -> str:
+    """Renders the season points leaderboard: **[Name] ([Team]) - [Total Points] Pts**."""
+    out = ["## The Hardware (League Leaders)", ""]
+    for leader in leaders:
+        out.append(
+            f"**{leader['Player']} ({leader['Team']}) - {leader['Pts']} Pts** - "
+            f"{leader['G']} goals and {leader['A']} assists in {leader['GP']} games."
+        )
+        out.append("")
+    return "\n".join(out).rstrip()
+
+
+def render_series_tracker(series: List[Dict[str, Any]], active_teams: set) -> str:
+    """Renders the 'Race to Three' status for every playoff series active this week."""
+    out = ["## Series Tracker", ""]
+    for s in series:
+        if s['TeamA'].lower() not in active_teams and s['TeamB'].lower() not in active_teams:
+            continue
+        pts_a, pts_b = int(s['PtsA']), int(s['PtsB'])
+        if max(pts_a, pts_b) >= SERIES_TARGET and pts_a != pts_b:
+            status = f"{s['TeamA'] if pts_a > pts_b else s['TeamB']} advances"
+        elif pts_a == pts_b:
+            status = "Series tied"
+        else:
+            status = f"{s['TeamA'] if pts_a > pts_b else s['TeamB']} leads"
+        out.append(f"- **{s['TeamA']} {pts_a}, {s['TeamB']} {pts_b}** - {status} in the race to {SERIES_TARGET}.")
+    return "\n".join(out) if len(out) > 2 else ""
+
+
+# --- ORCHESTRATION ---
+
+def render_stat_sections(brief: Dict[str, Any], is_playoffs: bool = False, is_finals: bool = False,
+                         lines: Optional["pd.DataFrame"] = None) -> str:
+    """
+    Computes and renders every deterministic section for a reporter data brief.
+
+    In Finals mode the stars honor the championship game (the latest game date in the
+    window) and the season Hardware leaderboard is included. In Playoff mode the active
+    series are summarized.
+
+    Args:
+        brief (Dict): The decoded data brief built by the reporter.
+        is_playoffs (bool): Whether the window is in Playoff mode.
+        is_finals (bool): Whether the window is the Championship Finale.
+        lines (pd.DataFrame, optional): Player-game table; loaded from the league database if omitted.
+
+    Returns:
+        str: The Markdown block, wrapped in validator skip markers.
+    """
+    import pandas as pd
+    from analyzer import load_player_game_lines
+
+    sources = brief.get("data_sources", {})
+    schedule = pd.DataFrame(sources.get("schedule_and_arenas", []))
+    game_ids = schedule['GameID'].astype(str) if not schedule.empty else pd.Series(dtype=str)
+    if lines is None:
+        # Only the window's games are needed (an indexed lookup in the league database)
+        lines = load_player_game_lines(list(game_ids))
+        if lines is None:
+            print("⚠️ Player-game lines not found. Run the analyzer before rendering stat sections.")
+
+    if is_finals and not schedule.empty:
+        # Restrict the stars to the championship game night
+        final_dates = pd.to_datetime(schedule['Date'], format='mixed', errors='coerce')
+        game_ids = game_ids[final_dates == final_dates.max()]
+
+    sections = []
+    if is_finals:
+        sections.append(render_hardware(select_hardware_leaders(sources.get("individual_leaders", []))))
+    elif is_playoffs and not schedule.empty:
+        active_teams = {str(t).lower() for t in pd.concat([schedule['Home'], schedule['Away']])}
+        tracker = render_series_tracker(sources.get("playoff_series_points", []), active_teams)
+        if tracker:
+            sections.append(tracker)
+    sections.append(render_three_stars(select_three_stars(tally_window_lines(lines, game_ids)), is_finals))
+
+    return f"{SECTION_START}\n" + "\n\n".join(sections) + f"\n{SECTION_END}"
+
+
+def strip_stat_sections(report_text: str) -> str:
+    """Removes the deterministic block so audits only consider generated prose."""
+    start = report_text.find(SECTION_START)
+    end = report_text.find(SECTION_END)
+    if start == -1 or end == -1:
+        return report_text
+    return report_text[:start] + report_text[end + len(SECTION_END):]
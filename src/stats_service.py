@@ -0,0 +1,668 @@
+"""
+League Stats Service
+
+Loads the active division's league data once into in-memory indexes and answers ad-hoc
+stat questions from memory, without re-reading tables or calling the LLM:
+
+* standings - Regular season or playoff table (or one team's row) and playoff series points.
+* h2h       - Every decided meeting between two teams (team-pair hash lookup).
+* player    - A player's season line and game-by-game lines.
+* leaders   - Season leaders by any stat, or leaders over a date window (binary search over
+              date-sorted game lines), optionally for one team.
+* game(s)   - One game's schedule row, final score and compact event summary, or a team's
+              games over a date range.
+
+Team and player spellings resolve through the fuzzy name indexes ("Shockers", "Flat Earthers").
+Before each query the service checks whether another connection committed to the league
+database (`PRAGMA data_version`) or a CSV export changed on disk, and rebuilds the snapshot if
+so; a long-lived server therefore never serves numbers older than the last analyzer run. The
+reporter and scout use the same queries as a library through `get_service()`.
+
+Usage:
+    python3 src/stats_service.py standings [--playoffs] [--team TEAM]
+    python3 src/stats_service.py h2h Shockers "Flat Earthers"
+    python3 src/stats_service.py player "Fla8 Player8" [--last 5]
+    python3 src/stats_service.py leaders [--stat G] [--team TEAM] [--since 2026-02-01] [--until 2026-02-28]
+    python3 src/stats_service.py game 1005
+    python3 src/stats_service.py serve [--host 127.0.0.1] [--port 8765]
+
+HTTP routes mirror the CLI and return `{"result": ..., "query_ms": ...}`:
+    /standings?playoffs=1&team=  /series  /h2h?a=&b=  /player?name=&last=
+    /leaders?stat=&team=&since=&until=&limit=  /game/<id>  /games?team=&since=&until=  /health
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from bisect import bisect_left, bisect_right
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+from analyzer import build_game_summaries, parse_manifest_dates
+from league_db import DERIVED_TABLES, DETAILS_FILE, DIVISION, MANIFEST_FILE, open_db
+from name_index import NameIndex
+
+# --- CONFIGURATION & CONSTANTS ---
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.getenv("STATS_SERVICE_PORT", "8765"))
+
+LEADER_STATS = ("Pts", "G", "A", "PIM", "PPG", "SHG", "GWG", "GP")
+LINE_TOTALS = ("G", "A", "Pts", "PIM", "PPG", "SHG", "GWG")
+WINDOW_COLUMNS = LINE_TOTALS + ("GP",)
+# Window leaderboards break ties on goals, then game-winners (as `analyzer.weekly_player_leaders`)
+WINDOW_TIEBREAKERS = ("G", "GWG")
+DEFAULT_LEADER_LIMIT = 10
+
+# CSV exports whose change (hand edits, older tooling) triggers an import and a reload
+WATCHED_FILES = [MANIFEST_FILE, DETAILS_FILE] + [path for path, _ in DERIVED_TABLES.values()]
+
+
+def final_score(game: Dict[str, Any]) -> Optional[Tuple[str, int, int]]:
+    """
+    Parses a manifest row's final score.
+
+    Scores sometimes land in 'Status' (with division info in 'Score'), so 'Status' wins
+    whenever it holds a dash.
+
+    Returns:
+        Tuple[str, int, int] | None: (score text, home goals, away goals), or None if undecided.
+    """
+    status = str(game.get('Status'))
+    raw = status if '-' in status else str(game.get('Score'))
+    parts = raw.split('-')
+    if len(parts) != 2:
+        return None
+    try:
+        return raw, int(parts[0].strip()), int(parts[1].strip())
+    except ValueError:
+        return None
+
+
+def _clean(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces NaN cells with None so results serialize as strict JSON."""
+    return {key: (None if not isinstance(value, (list, dict)) and pd.isna(value) else value)
+            for key, value in record.items()}
+
+
+class LeagueSnapshot:
+    """
+    Immutable in-memory indexes over one consistent read of the league database.
+
+    Attributes:
+        tables (Dict[str, List[Dict]]): Derived tables in the analyzer's stored (ranked) order.
+        teams (NameIndex): Fuzzy resolver over schedule and standings team names.
+        players (NameIndex): Fuzzy resolver over player names.
+        team_keys (Dict[str, str]): Team spelling used in any table -> canonical team.
+        team_rows (Dict[str, Dict[str, Dict]]): Table -> canonical team -> standings row.
+        games (Dict[str, Dict]): GameID -> schedule row with 'GameDate' (ISO) and parsed score.
+        positions (Dict[str, int]): GameID -> schedule position.
+        game_dates (List[str]): Sorted ISO dates of dated games (bisect keys).
+        dated_games (List[str]): GameIDs aligned with `game_dates`.
+        pair_games (Dict[FrozenSet[str], List[str]]): Team pair -> GameIDs in schedule order.
+        team_games (Dict[str, List[str]]): Team -> GameIDs in date order (undated last).
+        summaries (Dict[str, Dict]): GameID -> compact event summary (games with telemetry).
+        player_rows (Dict[str, Dict]): Player -> season line.
+        player_lines (Dict[str, List[Dict]]): Player -> game lines in date order.
+        line_dates (Dict[str, List[str]]): Player -> ISO dates of their lines (bisect keys).
+        window_players (List[str]): Row order of the window arrays.
+        window_dates (List[str]): Sorted distinct line dates (bisect keys for window bounds).
+        window_sums (np.ndarray): Players x (dates + 1) x `WINDOW_COLUMNS` running totals, so any
+            date window's totals for every player are a single subtraction.
+        window_first_seq (np.ndarray): Players x (dates + 1) Seq of each player's first line on
+            or after each date (first-appearance tie order).
+        season_leaders (Dict[str, List[Dict]]): Stat -> season lines ranked by that stat.
+        load_ms (float): Time spent building the snapshot.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.teams = NameIndex({})
+        self.players = NameIndex({})
+        self.team_keys: Dict[str, str] = {}
+        self.team_rows: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.games: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[str, int] = {}
+        self.game_dates: List[str] = []
+        self.dated_games: List[str] = []
+        self.pair_games: Dict[FrozenSet[str], List[str]] = {}
+        self.team_games: Dict[str, List[str]] = {}
+        self.summaries: Dict[str, Dict[str, Any]] = {}
+        self.player_rows: Dict[str, Dict[str, Any]] = {}
+        self.player_lines: Dict[str, List[Dict[str, Any]]] = {}
+        self.line_dates: Dict[str, List[str]] = {}
+        self.window_players: List[str] = []
+        self.window_dates: List[str] = []
+        self.window_sums = np.zeros((0, 1, len(WINDOW_COLUMNS)), dtype=np.int64)
+        self.window_first_seq = np.zeros((0, 1))
+        self.season_leaders: Dict[str, List[Dict[str, Any]]] = {}
+        self.load_ms = 0.0
+
+    @classmethod
+    def load(cls, db) -> "LeagueSnapshot":
+        """
+        Reads every table once and builds the lookup structures.
+
+        Args:
+            db (LeagueDB): An open league database connection.
+
+        Returns:
+            LeagueSnapshot: The populated snapshot.
+        """
+        started = time.perf_counter()
+        snapshot = cls()
+        with db.read_snapshot():
+            frames = {name: db.table(name) for name in DERIVED_TABLES if db.has_table(name)}
+            manifest = db.manifest()
+            details = db.events()
+
+        snapshot.tables = {name: [_clean(row) for row in frame.to_dict(orient='records')]
+                           for name, frame in frames.items()}
+        snapshot._index_games(manifest, details)
+        snapshot._index_standings()
+        snapshot._index_players(frames.get('player_game_lines'))
+        snapshot.load_ms = (time.perf_counter() - started) * 1000
+        return snapshot
+
+    # --- INDEX BUILDERS ---
+
+    def _index_games(self, manifest: pd.DataFrame, details: pd.DataFrame) -> None:
+        standings_teams = [row['Team'] for row in self.tables.get('team_stats', [])]
+        self.teams = NameIndex.for_teams(list(pd.concat([manifest['Home'], manifest['Away']]).dropna())
+                                         + standings_teams)
+        dates = parse_manifest_dates(manifest)
+
+        for record in manifest.to_dict(orient='records'):
+            game = _clean(record)
+            game_id = game['GameID'] = str(record['GameID'])
+            date = dates.get(game_id)
+            game['GameDate'] = None if date is None or pd.isna(date) else date.strftime('%Y-%m-%d')
+            score = final_score(record)
+            game['FinalScore'], game['HomeGoals'], game['AwayGoals'] = score or (None, None, None)
+            self.games[game_id] = game
+            self.positions[game_id] = len(self.positions)
+            if game['Home'] and game['Away']:
+                self.pair_games.setdefault(frozenset((game['Home'], game['Away'])), []).append(game_id)
+                for team in (game['Home'], game['Away']):
+                    self.team_games.setdefault(team, []).append(game_id)
+
+        for game_ids in self.team_games.values():
+            game_ids.sort(key=self._date_order)
+        ordered = sorted((g for g in self.games.values() if g['GameDate']), key=lambda g: g['GameDate'])
+        self.game_dates = [g['GameDate'] for g in ordered]
+        self.dated_games = [g['GameID'] for g in ordered]
+
+        if not details.empty:
+            for summary in build_game_summaries(details, manifest):
+                self.summaries[summary['game_id']] = summary
+
+    def _date_order(self, game_id: str) -> Tuple[bool, str, int]:
+        date = self.games[game_id]['GameDate']
+        return date is None, date or "", self.positions[game_id]
+
+    def _index_standings(self) -> None:
+        for name in ('team_stats', 'playoff_standings', 'player_stats', 'player_game_lines'):
+            for team in dict.fromkeys(row['Team'] for row in self.tables.get(name, [])):
+                self.team_keys[team] = self.resolve_team(team) or team
+        for name in ('team_stats', 'playoff_standings'):
+            self.team_rows[name] = {self.team_keys[row['Team']]: row for row in self.tables.get(name, [])}
+
+    def _index_players(self, lines: Optional[pd.DataFrame]) -> None:
+        season = self.tables.get('player_stats', [])
+        self.player_rows = {row['Player']: row for row in season}
+        # Stable sorts keep the analyzer's stored ranking among ties
+        self.season_leaders = {stat: sorted(season, key=lambda row, s=stat: -row[s]) for stat in LEADER_STATS}
+
+        names = list(self.player_rows)
+        if lines is not None and not lines.empty:
+            lines = lines.assign(GameID=lines['GameID'].astype(str), Date=lines['Date'].astype(str))
+            for row in sorted(lines.to_dict(orient='records'), key=lambda row: (row['Date'], row['Seq'])):
+                self.player_lines.setdefault(row['Player'], []).append(_clean(row))
+            self.line_dates = {player: [row['Date'] for row in rows] for player, rows in self.player_lines.items()}
+            self._index_windows()
+            names += [name for name in self.player_lines if name not in self.player_rows]
+        self.players = NameIndex.for_players(names)
+
+    def _index_windows(self) -> None:
+        self.window_players = list(self.player_lines)
+        self.window_dates = sorted({date for dates in self.line_dates.values() for date in dates})
+        date_pos = {date: i for i, date in enumerate(self.window_dates)}
+        shape = (len(self.window_players), len(self.window_dates))
+        values = np.zeros(shape + (len(WINDOW_COLUMNS),), dtype=np.int64)
+        first_seq = np.full((shape[0], shape[1] + 1), np.inf)
+        for p, player in enumerate(self.window_players):
+            for row in self.player_lines[player]:
+                d = date_pos[row['Date']]
+                values[p, d] += [row[s] for s in LINE_TOTALS] + [1]
+                first_seq[p, d] = min(first_seq[p, d], row['Seq'])
+        self.window_sums = np.concatenate([np.zeros((shape[0], 1, len(WINDOW_COLUMNS)), dtype=np.int64),
+                                           np.cumsum(values, axis=1)], axis=1)
+        self.window_first_seq = np.minimum.accumulate(first_seq[:, ::-1], axis=1)[:, ::-1]
+
+    # --- RESOLUTION ---
+
+    def resolve_team(self, name: Optional[str]) -> Optional[str]:
+        """Canonical team name for any spelling, or None."""
+        return self.teams.best(name) if name else None
+
+    def resolve_player(self, name: Optional[str]) -> Optional[str]:
+        """Canonical player name for any spelling, or None."""
+        return self.players.best(name) if name else None
+
+    # --- QUERIES ---
+
+    def standings(self, playoffs: bool = False, team: Optional[str] = None) -> Any:
+        """
+        The regular season (or playoff) table, or one team's row.
+
+        Returns:
+            List[Dict] | Dict | None: Ranked rows, or the team's row (None if unknown).
+        """
+        name = 'playoff_standings' if playoffs else 'team_stats'
+        if team is None:
+            return [dict(row) for row in self.tables.get(name, [])]
+        row = self.team_rows.get(name, {}).get(self.resolve_team(team))
+        return dict(row) if row is not None else None
+
+    def series(self) -> List[Dict[str, Any]]:
+        """Playoff series points per matchup."""
+        return [dict(row) for row in self.tables.get('playoff_matchups', [])]
+
+    def h2h(self, team: str, opponent: str) -> Optional[Dict[str, Any]]:
+        """
+        Every decided meeting between two teams, from `team`'s perspective.
+
+        Returns:
+            Dict | None: 'teams', 'record' ("W-L-T") and 'games' (schedule order, each with a
+            'Result' of W/L/T), or None if either team is unknown.
+        """
+        us, them = self.resolve_team(team), self.resolve_team(opponent)
+        if not us or not them:
+            return None
+
+        wins = losses = ties = 0
+        games = []
+        for game_id in self.pair_games.get(frozenset((us, them)), []):
+            game = self.games[game_id]
+            if game['FinalScore'] is None:
+                continue
+            ours, theirs = ((game['HomeGoals'], game['AwayGoals']) if game['Home'] == us
+                            else (game['AwayGoals'], game['HomeGoals']))
+            result = "T" if ours == theirs else ("W" if ours > theirs else "L")
+            wins, losses, ties = wins + (result == "W"), losses + (result == "L"), ties + (result == "T")
+            games.append({**game, 'Result': result})
+        return {"teams": [us, them], "record": f"{wins}-{losses}-{ties}", "games": games}
+
+    def player(self, name: str, last: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        A player's season line and game lines (the most recent `last` only, if given).
+
+        Returns:
+            Dict | None: 'player', 'season' and 'lines' (chronological), or None if unknown.
+        """
+        player = self.resolve_player(name)
+        if not player:
+            return None
+        lines = self.player_lines.get(player, [])
+        if last:
+            lines = lines[-last:]
+        season = self.player_rows.get(player)
+        return {"player": player, "season": dict(season) if season else None,
+                "lines": [dict(row) for row in lines]}
+
+    def leaders(self, stat: str = "Pts", limit: Optional[int] = DEFAULT_LEADER_LIMIT, team: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Ranks players by one stat over the season or over an inclusive date window.
+
+        Args:
+            stat (str): One of `LEADER_STATS`.
+            limit (int, optional): Rows to return (all when None).
+            team (str, optional): Restrict to one team's players (any spelling).
+            since, until (str, optional): 'YYYY-MM-DD' window bounds; totals then come from the
+                running-total arrays (two binary searches and one vectorized subtraction).
+
+        Returns:
+            List[Dict]: Player lines (Player, Team, GP, G, A, Pts, PIM, PPG, SHG, GWG).
+
+        Raises:
+            ValueError: For an unknown stat.
+        """
+        if stat not in LEADER_STATS:
+            raise ValueError(f"Unknown stat '{stat}' (expected one of {', '.join(LEADER_STATS)}).")
+
+        canonical = self.resolve_team(team) if team is not None else None
+        if since or until:
+            return self._window_leaders(stat, limit, canonical, since, until)
+
+        rows = self.season_leaders.get(stat, [])
+        if team is not None:
+            rows = [row for row in rows if self.team_keys.get(row['Team'], row['Team']) == canonical]
+        return [dict(row) for row in (rows[:limit] if limit else rows)]
+
+    def _window_leaders(self, stat: str, limit: Optional[int], team: Optional[str],
+                        since: Optional[str], until: Optional[str]) -> List[Dict[str, Any]]:
+        lo = bisect_left(self.window_dates, since) if since else 0
+        hi = bisect_right(self.window_dates, until) if until else len(self.window_dates)
+        totals = self.window_sums[:, hi] - self.window_sums[:, lo]
+        present = np.flatnonzero(totals[:, -1] > 0)
+
+        # Ranked by the stat, then the tiebreakers, then first appearance in the window
+        column = [WINDOW_COLUMNS.index(s) for s in (stat,) + WINDOW_TIEBREAKERS]
+        keys = [self.window_first_seq[present, lo]] + [-totals[present, c] for c in reversed(column)]
+        rows = []
+        for p in present[np.lexsort(keys)]:
+            player = self.window_players[p]
+            first = self.player_lines[player][bisect_left(self.line_dates[player], since) if since else 0]
+            if team is not None and self.team_keys.get(first['Team'], first['Team']) != team:
+                continue
+            rows.append({'Player': player, 'Team': first['Team'], 'GP': int(totals[p, -1]),
+                         **{s: int(totals[p, i]) for i, s in enumerate(LINE_TOTALS)}})
+            if limit and len(rows) == limit:
+                break
+        return rows
+
+    def game(self, game_id: Any) -> Optional[Dict[str, Any]]:
+        """One game's schedule row with its compact event summary ('Summary', None if unscraped)."""
+        game = self.games.get(str(game_id))
+        if game is None:
+            return None
+        return {**game, 'Summary': self.summaries.get(str(game_id))}
+
+    def game_list(self, team: Optional[str] = None, since: Optional[str] = None,
+                  until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Schedule rows in date order, optionally for one team and/or an inclusive date window.
+        Undated games are only included when no window is given.
+        """
+        if team is not None:
+            game_ids = self.team_games.get(self.resolve_team(team), [])
+            if since or until:
+                game_ids = [g for g in game_ids if self.games[g]['GameDate']
+                            and (not since or self.games[g]['GameDate'] >= since)
+                            and (not until or self.games[g]['GameDate'] <= until)]
+        elif since or until:
+            lo = bisect_left(self.game_dates, since) if since else 0
+            hi = bisect_right(self.game_dates, until) if until else len(self.game_dates)
+            game_ids = self.dated_games[lo:hi]
+        else:
+            game_ids = self.dated_games + [g for g, game in self.games.items() if not game['GameDate']]
+        return [dict(self.games[g]) for g in game_ids]
+
+    def recent_games(self, teams: Iterable[str], limit: int) -> List[Dict[str, Any]]:
+        """
+        Event summaries of the last `limit` scheduled games involving any of `teams` (date order).
+        Games without telemetry yet still count toward the limit and are then skipped.
+        """
+        wanted = {self.resolve_team(t) or t for t in teams}
+        ordered = sorted({g for team in wanted for g in self.team_games.get(team, [])}, key=self._date_order)
+        return [self.summaries[g] for g in ordered[-limit:] if g in self.summaries]
+
+
+class StatsService:
+    """
+    A warm, hot-reloading query service over the active division's league database.
+
+    Query methods mirror `LeagueSnapshot`. Each call first checks for committed database
+    changes and changed CSV exports (a pragma and a few `stat` calls), reloading the snapshot
+    if needed; queries then run lock-free against the immutable snapshot.
+
+    Args:
+        path (str, optional): League database file. Defaults to the active division's.
+        verbose (bool): Print a line whenever the snapshot is (re)loaded.
+    """
+
+    def __init__(self, path: Optional[str] = None, verbose: bool = True):
+        self.path = path
+        self.verbose = verbose
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self._snapshot: Optional[LeagueSnapshot] = None
+        self._version: Optional[int] = None
+        self._stamps: Optional[Tuple] = None
+
+    @staticmethod
+    def _file_stamps() -> Tuple:
+        stamps = []
+        for path in WATCHED_FILES:
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    @property
+    def snapshot(self) -> LeagueSnapshot:
+        """The current snapshot, rebuilt first if the league data changed."""
+        with self._lock:
+            if self._db is None:
+                self._db = open_db(self.path, sync=False)
+            stamps = self._file_stamps()
+            if self._snapshot is None or stamps != self._stamps or self._db.data_version() != self._version:
+                self._reload(stamps)
+            return self._snapshot
+
+    def _reload(self, stamps: Tuple) -> None:
+        # Read the change markers first: anything committed during the load triggers another reload
+        self._version = self._db.data_version()
+        self._stamps = stamps
+        self._db.sync_from_csv()
+        self._snapshot = LeagueSnapshot.load(self._db)
+        self.reloads += 1
+        if self.verbose:
+            print(f"📦 Stats snapshot {'reloaded' if self.reloads > 1 else 'loaded'}: {len(self._snapshot.games)} games, "
+                  f"{len(self._snapshot.player_rows)} players in {self._snapshot.load_ms:.1f} ms.")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --- QUERIES ---
+
+    def has_table(self, name: str) -> bool:
+        return name in self.snapshot.tables
+
+    def resolve_team(self, name: Optional[str]) -> Optional[str]:
+        return self.snapshot.resolve_team(name)
+
+    def standings(self, playoffs: bool = False, team: Optional[str] = None) -> Any:
+        return self.snapshot.standings(playoffs, team)
+
+    def series(self) -> List[Dict[str, Any]]:
+        return self.snapshot.series()
+
+    def h2h(self, team: str, opponent: str) -> Optional[Dict[str, Any]]:
+        return self.snapshot.h2h(team, opponent)
+
+    def player(self, name: str, last: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        return self.snapshot.player(name, last)
+
+    def leaders(self, stat: str = "Pts", limit: Optional[int] = DEFAULT_LEADER_LIMIT, team: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.snapshot.leaders(stat, limit, team, since, until)
+
+    def game(self, game_id: Any) -> Optional[Dict[str, Any]]:
+        return self.snapshot.game(game_id)
+
+    def game_list(self, team: Optional[str] = None, since: Optional[str] = None,
+                  until: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.snapshot.game_list(team, since, until)
+
+    def recent_games(self, teams: Iterable[str], limit: int) -> List[Dict[str, Any]]:
+        return self.snapshot.recent_games(teams, limit)
+
+
+_service: Optional[StatsService] = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> StatsService:
+    """The process-wide service for the active division (created on first use)."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = StatsService()
+        return _service
+
+
+# --- QUERY DISPATCH (shared by the CLI and HTTP routes) ---
+
+def _flag(value: Any) -> bool:
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+def _int(value: Any) -> Optional[int]:
+    return int(value) if value not in (None, "") else None
+
+
+def run_query(service: StatsService, query: str, params: Dict[str, Any]) -> Any:
+    """
+    Runs one named query with string parameters.
+
+    Raises:
+        ValueError: For an unknown query, a missing required parameter or a bad value.
+    """
+    def required(name: str) -> str:
+        if not params.get(name):
+            raise ValueError(f"'{query}' requires the '{name}' parameter.")
+        return params[name]
+
+    if query == "standings":
+        return service.standings(_flag(params.get("playoffs")), params.get("team"))
+    if query == "series":
+        return service.series()
+    if query == "h2h":
+        return service.h2h(required("a"), required("b"))
+    if query == "player":
+        return service.player(required("name"), _int(params.get("last")))
+    if query == "leaders":
+        limit = params.get("limit")
+        return service.leaders(params.get("stat") or "Pts", DEFAULT_LEADER_LIMIT if limit is None else _int(limit),
+                               params.get("team"), params.get("since"), params.get("until"))
+    if query == "game":
+        return service.game(required("id"))
+    if query == "games":
+        return service.game_list(params.get("team"), params.get("since"), params.get("until"))
+    raise ValueError(f"Unknown query '{query}'.")
+
+
+# --- HTTP SERVER ---
+
+class StatsRequestHandler(BaseHTTPRequestHandler):
+    """Serves `run_query` as GET /<query>?<params> (and /game/<id>) with JSON responses."""
+
+    service: StatsService = None
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if len(parts) == 2 and parts[0] == "game":
+            params["id"] = parts[1]
+
+        if not parts or parts[0] == "health":
+            snapshot = self.service.snapshot
+            return self._send(200, {"status": "ok", "division": DIVISION.key, "games": len(snapshot.games),
+                                    "players": len(snapshot.player_rows), "reloads": self.service.reloads})
+        started = time.perf_counter()
+        try:
+            result = run_query(self.service, parts[0], params)
+        except ValueError as e:
+            return self._send(400, {"error": str(e)})
+        except Exception as e:
+            return self._send(500, {"error": f"{type(e).__name__}: {e}"})
+        query_ms = (time.perf_counter() - started) * 1000
+        if result is None:
+            return self._send(404, {"error": "No match.", "query_ms": query_ms})
+        self._send(200, {"result": result, "query_ms": query_ms})
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, service: Optional[StatsService] = None) -> None:
+    """Serves the query routes until interrupted (the snapshot is warmed before listening)."""
+    service = service or get_service()
+    service.snapshot
+    handler = type("BoundStatsRequestHandler", (StatsRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"📡 Stats service for {DIVISION.name} on http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        print("🛑 Stats service stopped.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the division's stats from a warm in-memory index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    standings = commands.add_parser("standings", help="Standings table (or one team's row).")
+    standings.add_argument("--playoffs", action="store_true")
+    standings.add_argument("--team", default=None)
+    commands.add_parser("series", help="Playoff series points.")
+    h2h = commands.add_parser("h2h", help="Head-to-head results between two teams.")
+    h2h.add_argument("a")
+    h2h.add_argument("b")
+    player = commands.add_parser("player", help="A player's season line and game lines.")
+    player.add_argument("name")
+    player.add_argument("--last", type=int, default=None, help="Only the most recent N games.")
+    leaders = commands.add_parser("leaders", help="Season or date-window leaders.")
+    leaders.add_argument("--stat", default="Pts", choices=LEADER_STATS)
+    leaders.add_argument("--team", default=None)
+    leaders.add_argument("--since", default=None, help="Window start (YYYY-MM-DD, inclusive).")
+    leaders.add_argument("--until", default=None, help="Window end (YYYY-MM-DD, inclusive).")
+    leaders.add_argument("--limit", type=int, default=DEFAULT_LEADER_LIMIT)
+    game = commands.add_parser("game", help="One game's schedule row and event summary.")
+    game.add_argument("id")
+    games = commands.add_parser("games", help="Schedule rows by team and/or date window.")
+    games.add_argument("--team", default=None)
+    games.add_argument("--since", default=None)
+    games.add_argument("--until", default=None)
+    server = commands.add_parser("serve", help="Serve the queries over HTTP.")
+    server.add_argument("--host", default=DEFAULT_HOST)
+    server.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.host, args.port)
+        sys.exit(0)
+
+    service = get_service()
+    try:
+        service.snapshot
+        started = time.perf_counter()
+        result = run_query(service, args.command, {k: v for k, v in vars(args).items() if k != "command"})
+        query_ms = (time.perf_counter() - started) * 1000
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        service.close()
+
+    if result is None:
+        print("❌ No match.")
+        sys.exit(1)
+    print(json.dumps(result, indent=2, default=str))
+    print(f"⚡ Answered in {query_ms:.3f} ms (warm snapshot).")
@@ -0,0 +1,302 @@
+"""
+Pipeline Tracing
+
+Lightweight spans for answering "where did the publish run's time go". Stages, data
+passes, brief building, LLM calls and audits are wrapped in spans that record:
+
+* Wall time and process CPU time.
+* Peak memory growth (tracemalloc) when memory tracing is enabled.
+* LLM token counts (prompt/response), rolled up into every enclosing span.
+
+Tracing is off unless `PIPELINE_TRACE` is set ('1' for a timestamped file under
+`data/traces/`, or an explicit output path); `PIPELINE_TRACE_MEMORY=1` additionally enables
+tracemalloc, which is accurate but slows pandas-heavy stages noticeably. When disabled,
+`span()` returns a shared no-op context manager and `@traced` functions call straight through.
+
+On exit the run is written as Chrome trace-event JSON (open it in chrome://tracing or
+https://ui.perfetto.dev) and a flat per-span summary is printed.
+
+Usage:
+    PIPELINE_TRACE=1 python3 src/pipeline.py
+    python3 src/tracing.py data/traces/trace-20260301-071500.json   # Summarize a saved trace
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import functools
+import threading
+import contextlib
+import contextvars
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# --- CONFIGURATION & CONSTANTS ---
+TRACE_ENV = "PIPELINE_TRACE"
+MEMORY_ENV = "PIPELINE_TRACE_MEMORY"
+TRACE_DIR = "data/traces"
+SUMMARY_LIMIT = 25
+
+_NOOP = contextlib.nullcontext()
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+_lock = threading.Lock()
+_events: List[Dict[str, Any]] = []
+_open_spans: List["Span"] = []
+_origin = time.perf_counter()
+_enabled = False
+_trace_memory = False
+_output_path: Optional[str] = None
+
+
+class Span:
+    """One timed region. Token counts and memory peaks are accumulated while it is open."""
+
+    __slots__ = ("name", "category", "args", "parent", "start", "cpu_start", "mem_start",
+                 "mem_peak", "prompt_tokens", "response_tokens", "llm_calls")
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any], parent: Optional["Span"]):
+        self.name, self.category, self.args, self.parent = name, category, args, parent
+        self.start = self.cpu_start = 0.0
+        self.mem_start = self.mem_peak = 0
+        self.prompt_tokens = self.response_tokens = self.llm_calls = 0
+
+    def annotate(self, **args: Any) -> None:
+        """Attaches extra key/value details to the exported event."""
+        self.args.update(args)
+
+
+def enable(path: Optional[str] = None, memory: Optional[bool] = None) -> str:
+    """
+    Turns tracing on for the rest of the process and registers the exit-time export.
+
+    Args:
+        path (str, optional): Trace output file. Defaults to a timestamped file in `TRACE_DIR`.
+        memory (bool, optional): Track peak memory with tracemalloc. Defaults to `PIPELINE_TRACE_MEMORY`.
+
+    Returns:
+        str: The trace output path.
+    """
+    global _enabled, _trace_memory, _output_path
+    if memory is None:
+        memory = os.getenv(MEMORY_ENV, "0") == "1"
+    if memory and not _trace_memory:
+        import tracemalloc
+        tracemalloc.start()
+    _trace_memory = _trace_memory or memory
+
+    _output_path = path or _output_path or os.path.join(
+        TRACE_DIR, f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+    if not _enabled:
+        _enabled = True
+        atexit.register(_export_at_exit)
+    return _output_path
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _sample_memory() -> int:
+    """Folds the tracemalloc peak since the last sample into every open span, then resets it."""
+    import tracemalloc
+    current, peak = tracemalloc.get_traced_memory()
+    for open_span in _open_spans:
+        open_span.mem_peak = max(open_span.mem_peak, peak)
+    tracemalloc.reset_peak()
+    return current
+
+
+@contextlib.contextmanager
+def _record(name: str, category: str, args: Dict[str, Any]):
+    span = Span(name, category, args, _current_span.get())
+    token = _current_span.set(span)
+    if _trace_memory:
+        with _lock:
+            span.mem_start = span.mem_peak = _sample_memory()
+            _open_spans.append(span)
+    span.cpu_start = time.process_time()
+    span.start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        end = time.perf_counter()
+        cpu = time.process_time() - span.cpu_start
+        _current_span.reset(token)
+        with _lock:
+            event_args = dict(span.args, cpu_ms=round(cpu * 1000, 3))
+            if _trace_memory:
+                _sample_memory()
+                _open_spans.remove(span)
+                event_args["peak_mem_kb"] = round(max(0, span.mem_peak - span.mem_start) / 1024, 1)
+            if span.llm_calls:
+                event_args.update(llm_calls=span.llm_calls, prompt_tokens=span.prompt_tokens,
+                                  response_tokens=span.response_tokens)
+            _events.append({
+                "name": name, "cat": category, "ph": "X",
+                "ts": round((span.start - _origin) * 1e6, 1), "dur": round((end - span.start) * 1e6, 1),
+                "pid": os.getpid(), "tid": threading.get_ident(), "args": event_args,
+            })
+
+
+def span(name: str, category: str = "function", **args: Any):
+    """
+    Context manager timing a block of code.
+
+    Args:
+        name (str): Span name shown in the trace and summary (e.g., 'analyzer.standings').
+        category (str): Trace category ('stage', 'function', 'llm', ...).
+        **args: JSON-serializable details attached to the event.
+
+    Returns:
+        ContextManager: Yields the `Span` (or None when tracing is disabled).
+    """
+    if not _enabled:
+        return _NOOP
+    return _record(name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "function") -> Callable:
+    """
+    Decorator form of `span`. The span is named `module.function` unless `name` is given
+    (the module is taken from the file name, so scripts run directly are not '__main__').
+    """
+    def decorator(fn: Callable) -> Callable:
+        module = os.path.splitext(os.path.basename(fn.__code__.co_filename))[0]
+        span_name = name or f"{module}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _record(span_name, category, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_tokens(prompt_tokens: int = 0, response_tokens: int = 0) -> None:
+    """Adds one LLM call's token usage to the current span and every span enclosing it."""
+    if not _enabled:
+        return
+    with _lock:
+        open_span = _current_span.get()
+        while open_span is not None:
+            open_span.llm_calls += 1
+            open_span.prompt_tokens += prompt_tokens or 0
+            open_span.response_tokens += response_tokens or 0
+            open_span = open_span.parent
+
+
+def propagate(fn: Callable) -> Callable:
+    """
+    Binds `fn` to the caller's current span so work submitted to a thread pool nests under
+    it (thread pools do not copy context variables on their own).
+    """
+    if not _enabled:
+        return fn
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+
+# --- EXPORT & SUMMARY ---
+
+def export(path: Optional[str] = None) -> str:
+    """
+    Writes the recorded spans as Chrome trace-event JSON.
+
+    Args:
+        path (str, optional): Destination. Defaults to the path chosen by `enable`.
+
+    Returns:
+        str: The written path.
+    """
+    from atomic_io import write_text_atomically
+
+    path = path or _output_path or os.path.join(TRACE_DIR, "trace.json")
+    with _lock:
+        events = sorted(_events, key=lambda e: e["ts"])
+    threads = {t.ident: t.name for t in threading.enumerate()}
+    metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                 "args": {"name": threads.get(tid, f"thread-{tid}")}} for tid in {e["tid"] for e in events}]
+    document = {
+        "traceEvents": metadata + events,
+        "displayTimeUnit": "ms",
+        "otherData": {"argv": sys.argv, "recorded_at": datetime.now().isoformat(timespec="seconds")},
+    }
+    write_text_atomically(path, json.dumps(document))
+    return path
+
+
+def summarize(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregates complete ('X') events by span name.
+
+    Args:
+        events (List[Dict]): Chrome trace events (recorded in-process or loaded from a file).
+
+    Returns:
+        List[Dict]: One row per span name ('name', 'calls', 'wall_ms', 'max_ms', 'cpu_ms',
+        'peak_mem_kb', 'llm_calls', 'tokens'), slowest total wall time first.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        if event.get("ph") != "X":
+            continue
+        args = event.get("args", {})
+        row = rows.setdefault(event["name"], {"name": event["name"], "calls": 0, "wall_ms": 0.0, "max_ms": 0.0,
+                                              "cpu_ms": 0.0, "peak_mem_kb": None, "llm_calls": 0, "tokens": 0})
+        duration_ms = event["dur"] / 1000
+        row["calls"] += 1
+        row["wall_ms"] += duration_ms
+        row["max_ms"] = max(row["max_ms"], duration_ms)
+        row["cpu_ms"] += args.get("cpu_ms", 0.0)
+        if "peak_mem_kb" in args:
+            row["peak_mem_kb"] = max(row["peak_mem_kb"] or 0.0, args["peak_mem_kb"])
+        if event.get("cat") == "llm":
+            row["llm_calls"] += 1
+        row["tokens"] += args.get("prompt_tokens", 0) + args.get("response_tokens", 0)
+    return sorted(rows.values(), key=lambda r: -r["wall_ms"])
+
+
+def print_summary(events: List[Dict[str, Any]], limit: int = SUMMARY_LIMIT, stream=None) -> None:
+    """Prints the flat per-span summary table (inclusive times; nested spans overlap)."""
+    stream = stream or sys.stderr
+    rows = summarize(events)
+    print(f"\n{'SPAN':<42} {'CALLS':>5} {'WALL':>10} {'MAX':>10} {'CPU':>10} {'PEAK MEM':>10} {'TOKENS':>8}", file=stream)
+    print("-" * 101, file=stream)
+    for row in rows[:limit]:
+        memory = f"{row['peak_mem_kb'] / 1024:.1f}MB" if row["peak_mem_kb"] is not None else "—"
+        print(f"{row['name'][:42]:<42} {row['calls']:>5} {row['wall_ms']:>8.1f}ms {row['max_ms']:>8.1f}ms "
+              f"{row['cpu_ms']:>8.1f}ms {memory:>10} {row['tokens'] or '':>8}", file=stream)
+    if len(rows) > limit:
+        print(f"... {len(rows) - limit} more span name(s) in the trace file.", file=stream)
+
+
+def _export_at_exit() -> None:
+    with _lock:
+        events = list(_events)
+    if not events:
+        return
+    try:
+        path = export()
+    except OSError as e:
+        print(f"❌ Could not write trace: {e}", file=sys.stderr)
+        return
+    print_summary(events)
+    print(f"🧭 Trace written to {path} (open in chrome://tracing or ui.perfetto.dev)", file=sys.stderr)
+
+
+# Environment opt-in, so every entry point (not just the pipeline runner) can be traced
+_env_setting = os.getenv(TRACE_ENV, "").strip()
+if _env_setting and _env_setting != "0":
+    enable(None if _env_setting == "1" else _env_setting)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 src/tracing.py <trace.json>")
+        sys.exit(2)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        print_summary(json.load(f).get("traceEvents", []), limit=10**6, stream=sys.stdout)
@@ -10,18 +10,23 @@ actual outcomes (Total Points).
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
+from atomic_io import atomic_write
+from tracing import traced
+from leagues import active_division
 
 # --- CONFIGURATION & CONSTANTS ---
-INPUT_FILE = "data/team_stats.csv"
+DIVISION = active_division()
+INPUT_FILE = DIVISION.data_path("team_stats.csv")
 
 # Route output directly to the Jekyll static assets directory for immediate deployment
-OUTPUT_DIR = "docs/assets/images"
+OUTPUT_DIR = DIVISION.assets_dir
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "league_parity.png")
 
-# Define entities to exclude from the visual analysis (e.g., mid-season drops, exhibition teams)
-EXCLUDED_TEAMS = ["Arctic Dolphins", "Pdiym"]
+# Entities excluded from the visual analysis (e.g., mid-season drops, exhibition teams), per division
+EXCLUDED_TEAMS = DIVISION.excluded_teams
 
 
+@traced()
 def generate_parity_chart() -> None:
     """
     Executes the visualization pipeline.
@@ -98,7 +103,8 @@ def generate_parity_chart() -> None:
     plt.tight_layout()
 
     # --- PHASE 4: ARTIFACT EXPORT ---
-    plt.savefig(OUTPUT_FILE, dpi=150, bbox_inches='tight')
+    with atomic_write(OUTPUT_FILE, "wb") as f:
+        plt.savefig(f, format='png', dpi=150, bbox_inches='tight')
     plt.close()
     
     print(f"✅ Rendering Complete: Visualization archived to {OUTPUT_FILE}")
@@ -0,0 +1,305 @@
+"""
+League Watcher (Service Mode)
+
+A long-running alternative to launching `publish.sh` by hand. One warm process keeps the
+browser session, the imported analytics stack and the game telemetry in memory, and:
+
+1. Periodically refreshes the schedule manifest, backing off while nothing changes
+   (and harder after failures) and snapping back to the base interval once games land.
+2. Detects newly finalized games that have no telemetry in the league database yet.
+3. Scrapes only those boxscores and stores them (one transaction per game).
+4. Appends those games to the in-memory telemetry, folds them into the derived tables
+   (only their player-game lines, standings rows and playoff series are computed), regenerates
+   the parity chart and queues a dispatch with their game summaries in
+   `data/dispatch_queue.jsonl` (optionally drafting it right away).
+
+Point it at a local stand-in league site with `--hub-url`/`--boxscore-url` (or the
+`LEAGUE_HUB_URL`/`LEAGUE_BOXSCORE_URL` environment variables) to exercise it offline. One
+watcher covers one division (`LEAGUE_DIVISION`, see `leagues.py`); run one per division.
+
+Usage:
+    python3 src/watcher.py [--interval 900] [--max-interval 14400] [--draft] [--once]
+"""
+
+import os
+import re
+import sys
+import json
+import signal
+import argparse
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+import analyzer
+from league_db import open_db
+
+# --- CONFIGURATION & CONSTANTS ---
+DIVISION = analyzer.DIVISION
+DETAILS_FILE = analyzer.DETAILS_FILE
+MANIFEST_FILE = analyzer.MANIFEST_FILE
+QUEUE_FILE = DIVISION.data_path("dispatch_queue.jsonl")
+
+POLL_INTERVAL_S = 15 * 60          # Base interval while games are landing
+MAX_POLL_INTERVAL_S = 4 * 60 * 60  # Ceiling for idle and failure backoff
+IDLE_BACKOFF_FACTOR = 1.5
+FAILURE_BACKOFF_FACTOR = 2.0
+
+# Manifest 'Status' values that mean the boxscore is final (scores sometimes land in Status)
+FINAL_STATUS_PREFIXES = ("final", "forfeit")
+SCORE_PATTERN = re.compile(r"^\s*\d+\s*-\s*\d+\s*$")
+
+
+def is_final(game: Dict[str, Any]) -> bool:
+    """Returns True when a manifest row describes a completed game."""
+    status = str(game.get('Status', '')).strip().lower()
+    return status.startswith(FINAL_STATUS_PREFIXES) or bool(SCORE_PATTERN.match(status))
+
+
+def next_poll_delay(delay: float, found_new: bool, failed: bool,
+                    base: float = POLL_INTERVAL_S, ceiling: float = MAX_POLL_INTERVAL_S) -> float:
+    """
+    Computes the wait before the next manifest refresh.
+
+    Args:
+        delay (float): The previous delay in seconds.
+        found_new (bool): The last poll ingested at least one game.
+        failed (bool): The last poll raised or returned an empty manifest.
+        base (float): Interval after new games land.
+        ceiling (float): Maximum delay.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    if failed:
+        return min(ceiling, max(base, delay) * FAILURE_BACKOFF_FACTOR)
+    if found_new:
+        return base
+    return min(ceiling, max(base, delay * IDLE_BACKOFF_FACTOR))
+
+
+class SeleniumLeagueSource:
+    """
+    League site access over one persistent headless browser session. The session is
+    opened on first use and rebuilt only after a WebDriver failure.
+    """
+
+    def __init__(self, hub_url: Optional[str] = None, boxscore_url: Optional[str] = None):
+        import scraper
+        self._scraper = scraper
+        self.hub_url = hub_url or scraper.HUB_URL
+        self.boxscore_url = boxscore_url or scraper.BOXSCORE_TEMPLATE
+        self._driver = None
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = self._scraper.initialize_headless_browser()
+        return self._driver
+
+    def fetch_manifest(self) -> List[Dict[str, Any]]:
+        """Refreshes the manifest (stored in the league database with notes preserved)."""
+        return self._scraper.scrape_division_manifest(self.driver, self.hub_url)
+
+    def fetch_game(self, game: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Returns the event records for one finalized game, retrying once on a dead session."""
+        from selenium.common.exceptions import WebDriverException
+        try:
+            return self._scraper.scrape_game_events(self.driver, game, self.boxscore_url)
+        except WebDriverException:
+            self.reset()
+            return self._scraper.scrape_game_events(self.driver, game, self.boxscore_url)
+
+    def reset(self) -> None:
+        """Discards the browser session so the next call starts a fresh one."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+        self._driver = None
+
+    def close(self) -> None:
+        self.reset()
+
+
+class LeagueWatcher:
+    """
+    Polls a league source and incrementally ingests newly finalized games.
+
+    Args:
+        source: Any object with `fetch_manifest()`, `fetch_game(game)`, `reset()` and `close()`
+            (see `SeleniumLeagueSource`).
+        draft (bool): Draft the queued dispatch immediately instead of leaving it for the next run.
+        visuals (bool): Regenerate the parity chart after each ingest.
+    """
+
+    def __init__(self, source, draft: bool = False, visuals: bool = True):
+        self.source = source
+        self.draft = draft
+        self.visuals = visuals
+        self.stop_event = threading.Event()
+        self.details: Optional[pd.DataFrame] = None
+        self.known_ids: Set[str] = set()
+        self._cache_loaded = False
+
+    # --- DATA CACHE ---
+
+    def load_cache(self) -> None:
+        """Loads the telemetry once; later polls reuse it until new games are appended."""
+        self.details = analyzer.initialize_game_data()
+        self.known_ids = set(self.details['GameID']) if self.details is not None else set()
+        self._cache_loaded = True
+        print(f"🗄️  Telemetry cache: {len(self.known_ids)} game(s) on file.")
+
+    def append_events(self, events: List[Dict[str, Any]]) -> None:
+        with open_db() as db:
+            db.replace_game_events(events[0]['GameID'], events)
+
+    def extend_cache(self, game_ids: List[str]) -> None:
+        """
+        Appends the stored rows of newly ingested games to the in-memory telemetry. They are
+        read back from the database so dtypes match exactly what a batch load would see.
+        """
+        with open_db() as db:
+            fresh = analyzer.normalize_details(db.events(game_ids=game_ids))
+        if self.details is None:
+            self.details = fresh
+        else:
+            self.details = pd.concat([self.details, fresh], ignore_index=True)
+
+    # --- POLL CYCLE ---
+
+    def poll_once(self) -> List[str]:
+        """
+        Runs one refresh cycle.
+
+        Returns:
+            List[str]: GameIDs ingested during this cycle.
+
+        Raises:
+            RuntimeError: If the manifest could not be loaded (triggers failure backoff).
+        """
+        if not self._cache_loaded:
+            self.load_cache()
+
+        manifest = self.source.fetch_manifest()
+        if not manifest:
+            raise RuntimeError("Manifest refresh returned no games.")
+
+        pending = [g for g in manifest if is_final(g) and str(g['GameID']) not in self.known_ids]
+        print(f"🔍 {len(manifest)} game(s) in manifest; {len(pending)} newly finalized.")
+        if not pending:
+            return []
+
+        ingested = []
+        for game in pending:
+            events = self.source.fetch_game(game)
+            if events:
+                self.append_events(events)
+                ingested.append(str(game['GameID']))
+
+        if ingested:
+            self.known_ids.update(ingested)
+            self.extend_cache(ingested)
+            self.refresh_outputs(ingested)
+        return ingested
+
+    def refresh_outputs(self, game_ids: List[str]) -> None:
+        """Updates derived tables and visuals, then queues the dispatch covering `game_ids`."""
+        with open_db() as db:
+            manifest_df = db.manifest()
+        if not analyzer.update_analysis(self.details, game_ids, manifest_df):
+            analyzer.run_analysis_pipeline(self.details, manifest_df)
+
+        if self.visuals:
+            try:
+                import viz_generator
+                viz_generator.generate_parity_chart()
+            except Exception as e:
+                print(f"⚠️ Parity chart skipped: {e}")
+
+        self.queue_dispatch(game_ids, manifest_df)
+
+    def queue_dispatch(self, game_ids: List[str], manifest_df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Appends a dispatch request for the newest ingested game date to `QUEUE_FILE`.
+
+        Returns:
+            Dict[str, Any]: The queued entry ('report_date', 'games', 'summaries', 'status', 'post',
+            'queued_at').
+        """
+        dates = analyzer.parse_manifest_dates(manifest_df).reindex(game_ids).dropna()
+        report_date = dates.max().strftime('%Y-%m-%d') if not dates.empty else None
+        summaries = []
+        if self.details is not None:
+            summaries = analyzer.build_game_summaries(self.details[self.details['GameID'].isin(game_ids)], manifest_df)
+        entry = {"queued_at": datetime.now().isoformat(timespec="seconds"), "report_date": report_date,
+                 "games": game_ids, "summaries": summaries, "status": "queued", "post": None}
+
+        if self.draft:
+            try:
+                import reporter
+                entry["post"] = reporter.generate_weekly_digest_report(report_date)
+                entry["status"] = "drafted" if entry["post"] else "draft_failed"
+            except Exception as e:
+                print(f"❌ Draft generation failed: {e}")
+                entry["status"] = "draft_failed"
+
+        os.makedirs(os.path.dirname(QUEUE_FILE), exist_ok=True)
+        with open(QUEUE_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"📬 Dispatch queued for {report_date or 'latest games'} ({entry['status']}, {len(game_ids)} game(s)).")
+        return entry
+
+    # --- SERVICE LOOP ---
+
+    def run(self, interval: float = POLL_INTERVAL_S, max_interval: float = MAX_POLL_INTERVAL_S,
+            max_polls: Optional[int] = None) -> None:
+        """
+        Polls until stopped (SIGINT/SIGTERM) or `max_polls` cycles have run.
+        """
+        delay, polls = interval, 0
+        print(f"👀 Watching the league (base interval {interval / 60:.0f} min, ceiling {max_interval / 60:.0f} min).")
+        try:
+            while not self.stop_event.is_set():
+                failed, ingested = False, []
+                try:
+                    ingested = self.poll_once()
+                except Exception as e:
+                    print(f"❌ Poll failed: {e}")
+                    self.source.reset()
+                    failed = True
+
+                polls += 1
+                if max_polls is not None and polls >= max_polls:
+                    break
+                delay = next_poll_delay(delay, bool(ingested), failed, interval, max_interval)
+                print(f"💤 Next poll in {delay / 60:.1f} min.")
+                self.stop_event.wait(delay)
+        finally:
+            self.source.close()
+            print("🛑 Watcher stopped.")
+
+    def stop(self, *_: Any) -> None:
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll the league for finished games and update incrementally.")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL_S, help="Base poll interval (seconds).")
+    parser.add_argument("--max-interval", type=float, default=MAX_POLL_INTERVAL_S, help="Backoff ceiling (seconds).")
+    parser.add_argument("--hub-url", default=None, help="Schedule page (defaults to LEAGUE_HUB_URL / the DMHL hub).")
+    parser.add_argument("--boxscore-url", default=None, help="Boxscore URL template with {game_id}.")
+    parser.add_argument("--draft", action="store_true", help="Draft the dispatch as soon as games are ingested.")
+    parser.add_argument("--no-visuals", action="store_true", help="Skip regenerating the parity chart.")
+    parser.add_argument("--once", action="store_true", help="Run a single poll cycle and exit.")
+    args = parser.parse_args()
+
+    watcher = LeagueWatcher(SeleniumLeagueSource(args.hub_url, args.boxscore_url),
+                            draft=args.draft, visuals=not args.no_visuals)
+    signal.signal(signal.SIGTERM, watcher.stop)
+    signal.signal(signal.SIGINT, watcher.stop)
+    watcher.run(args.interval, args.max_interval, max_polls=1 if args.once else None)
+    sys.exit(0)
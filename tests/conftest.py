@@ -0,0 +1,115 @@
+"""
+Shared fixtures for the pipeline tests.
+
+The pipeline modules live as flat scripts in `src/` and resolve their data, posts and cache
+paths relative to the working directory, so every test that touches league data runs inside
+a throwaway directory holding a small synthetic league. All LLM traffic goes to the
+deterministic offline backend.
+"""
+
+import os
+import sys
+import random
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Offline, untraced, metric-free runs regardless of the developer's shell
+os.environ["LLM_BACKEND"] = "fake"
+os.environ["LLM_FAKE_LATENCY"] = "0"
+os.environ["LLM_METRICS"] = "0"
+os.environ.pop("PIPELINE_TRACE", None)
+os.environ.pop("LEAGUE_DIVISION", None)
+
+TEAMS = ["The Shockers", "The Sahara", "Don Cherry's", "Flat-Earthers"]
+GAME_DATES = ["Mon Jan 5", "Wed Jan 7", "Mon Jan 12", "Wed Jan 14", "Mon Feb 23"]
+SCRAPED_AT = "2026-03-10"
+
+
+def roster(team: str):
+    """Ten synthetic skaters per team ('Sho1 Player1' ... 'Sho10 Player10')."""
+    prefix = team.split()[-1][:3]
+    return [f"{prefix}{i} Player{i}" for i in range(1, 11)]
+
+
+def write_league(root: str, seed: int = 7):
+    """
+    Writes a deterministic four-team league (manifest + event telemetry) under `root/data`.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The manifest and the event rows.
+    """
+    import pandas as pd
+
+    rng = random.Random(seed)
+    os.makedirs(os.path.join(root, "data"), exist_ok=True)
+    os.makedirs(os.path.join(root, "docs", "_posts"), exist_ok=True)
+
+    manifest, details = [], []
+    game_id = 1000
+    for date in GAME_DATES:
+        order = TEAMS[:]
+        rng.shuffle(order)
+        for home, away in ((order[0], order[1]), (order[2], order[3])):
+            game_id += 1
+            home_goals, away_goals = rng.randint(0, 5), rng.randint(0, 5)
+            manifest.append(dict(GameID=game_id, Home=home, Away=away, Division="Low B",
+                                 GameType="Playoffs" if "Feb" in date else "Regular Season",
+                                 Score=f"{home_goals} - {away_goals}", Date=date, Time="9:00 PM",
+                                 Status="Final", Facility="St. Mikes Arena", Notes=""))
+            details.extend(game_events(game_id, home, away, home_goals, away_goals, rng))
+
+    manifest_df, details_df = pd.DataFrame(manifest), pd.DataFrame(details)
+    manifest_df.to_csv(os.path.join(root, "data", "games_manifest.csv"), index=False)
+    details_df.to_csv(os.path.join(root, "data", "game_details.csv"), index=False)
+    return manifest_df, details_df
+
+
+def game_events(game_id, home, away, home_goals, away_goals, rng, scraped_at=SCRAPED_AT):
+    """Event rows for one game, shaped like `scraper.format_event_record` output."""
+    def event(event_type, team, description, strength="", period="N/A", time="N/A"):
+        return dict(GameID=game_id, EventType=event_type, Team=team, Description=description,
+                    Strength=strength, ScrapedAt=scraped_at, Period=period, Time=time)
+
+    rows = [event("PeriodScore", home, str(home_goals), period="Final"),
+            event("PeriodScore", away, str(away_goals), period="Final")]
+    for team in (home, away):
+        rows.extend(event("RosterAppearance", team, player) for player in roster(team))
+
+    goals = [home] * home_goals + [away] * away_goals
+    rng.shuffle(goals)
+    for i, team in enumerate(goals):
+        scorer, first, second = rng.sample(roster(team), 3)
+        description = f"#{rng.randint(1, 99)} {scorer}"
+        if i % 3:
+            description += f" (#{rng.randint(1, 99)} {first}, #{rng.randint(1, 99)} {second})"
+        rows.append(event("Goal", team, description, strength=rng.choice(["EV", "EV", "PP", "SH"]),
+                          period=str(1 + i % 3), time=f"{10 + i}:00"))
+    for team in (home, away):
+        rows.append(event("Penalty", team, f"Tripping: #{rng.randint(1, 99)} {rng.choice(roster(team))} (2 mins)",
+                          period="2", time="05:00"))
+    rows.append(event("Official", "N/A", "Referee: Pat Quinn"))
+    return rows
+
+
+@pytest.fixture
+def league_dir(tmp_path, monkeypatch):
+    """A working directory holding the synthetic league; the stats service starts cold."""
+    import stats_service
+
+    write_league(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(stats_service, "_service", None)
+    return tmp_path
+
+
+@pytest.fixture
+def analyzed_league(league_dir):
+    """The synthetic league with the analysis pipeline's derived tables already built."""
+    import analyzer
+
+    analyzer.run_analysis_pipeline()
+    return league_dir
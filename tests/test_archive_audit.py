@@ -0,0 +1,38 @@
+"""Archive-wide validation: one shared context, per-post JSON reports, same verdicts in parallel."""
+
+import json
+import os
+
+import reporter
+import validator
+
+
+def publish(dates):
+    return [reporter.generate_weekly_digest_report(date) for date in dates]
+
+
+def test_parallel_archive_audit_matches_serial_run(analyzed_league, tmp_path):
+    posts = publish(["2026-01-07", "2026-01-14", "2026-02-23"])
+    assert all(posts)
+
+    serial = validator.audit_archive(workers=1, output_dir=str(tmp_path / "serial"))
+    parallel = validator.audit_archive(workers=2, output_dir=str(tmp_path / "parallel"))
+
+    assert serial["posts"] == parallel["posts"] == 3
+    assert serial["passed"] == parallel["passed"] == 3
+    assert parallel["workers"] == 2
+    for post in posts:
+        name = os.path.splitext(os.path.basename(post))[0] + ".json"
+        with open(tmp_path / "serial" / name) as f, open(tmp_path / "parallel" / name) as g:
+            first, second = json.load(f), json.load(g)
+        first.pop("elapsed_s"), second.pop("elapsed_s")
+        assert first == second
+    assert (tmp_path / "parallel" / "summary.json").exists()
+
+
+def test_archive_range_is_bounded_by_post_date(analyzed_league, tmp_path):
+    publish(["2026-01-07", "2026-02-23"])
+
+    summary = validator.audit_archive(since="2026-02-01", workers=1, output_dir=str(tmp_path / "audits"))
+
+    assert summary["posts"] == 1
@@ -0,0 +1,35 @@
+"""Audit windows are selected by game date, not by when the games were scraped."""
+
+import pandas as pd
+
+import validator
+from fact_index import FactIndex
+
+
+def index_for(dates):
+    manifest = pd.DataFrame([dict(GameID=gid, Home="A", Away="B", Score="1 - 0", Date=date)
+                             for gid, date in enumerate(dates, start=1)])
+    # Every game was backfilled in one scraper run on the same day
+    details = pd.DataFrame([dict(GameID=gid, EventType="Goal", Team="A", Description="#1 Sam Lee",
+                                 Strength="EV", Period="1", ScrapedAt="2026-03-10")
+                            for gid in range(1, len(dates) + 1)])
+    return FactIndex.from_data(details, manifest)
+
+
+def test_games_between_is_half_open():
+    index = index_for(["Mon Jan 5", "Mon Jan 12", "Mon Jan 19"])
+
+    assert index.games_between(pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-12")) == {"2"}
+    assert index.games_between(pd.Timestamp("2026-01-04"), pd.Timestamp("2026-01-19")) == {"1", "2", "3"}
+
+
+def test_backfilled_games_land_in_their_played_week():
+    index = index_for(["Mon Jan 5", "Mon Feb 2", "Wed Feb 4"])
+
+    week = validator.reporting_window_game_ids(index, pd.Timestamp("2026-02-04"))
+    fortnight = validator.audit_window_game_ids(index, pd.Timestamp("2026-01-12"))
+
+    assert week == {"2", "3"}
+    assert fortnight == {"1"}
+    assert not index.has_player_event("Sam Lee", "goal", game_ids=validator.audit_window_game_ids(
+        index, pd.Timestamp("2026-03-10")))
@@ -0,0 +1,107 @@
+"""Best-of-N drafting: deterministic screening, cancellation and the blocked no-pass outcome."""
+
+import os
+import re
+import time
+
+import pytest
+
+import pipeline
+import reporter
+import validator
+from gate_policy import EXIT_BLOCKED, EXIT_PUBLISHABLE
+from llm_backend import FakeBackend, flatten_contents
+from pipeline import Stage, StageOutcome, run_pipeline
+
+
+class DraftBackend(FakeBackend):
+    """Streams the offline report; chosen temperatures misreport a score or stream slowly."""
+    name = "drafts"
+
+    def __init__(self, wrong=(), slow=(), chunk_delay=0.05):
+        super().__init__(stream_chunks=20)
+        self.wrong, self.slow, self.chunk_delay = set(wrong), set(slow), chunk_delay
+        self.streamed = {}
+
+    def generate_stream(self, contents, call_site="generic", model=None, temperature=None):
+        text = self._respond(call_site, flatten_contents(contents))
+        if temperature in self.wrong:
+            text = re.sub(r"\d+-\d+", "17-16", text, count=1)
+        step = max(1, len(text) // self.stream_chunks)
+        for i in range(0, len(text), step):
+            if temperature in self.slow:
+                time.sleep(self.chunk_delay)
+            self.streamed[temperature] = self.streamed.get(temperature, 0) + 1
+            yield text[i:i + step]
+
+
+class NoExtraction(FakeBackend):
+    def generate(self, contents, call_site="generic", **kwargs):
+        raise AssertionError("draft screening must not call the LLM")
+
+
+@pytest.fixture
+def drafting(analyzed_league, monkeypatch):
+    monkeypatch.setattr(validator, "backend", NoExtraction())
+
+    def use(backend):
+        monkeypatch.setattr(reporter, "backend", backend)
+        return backend
+    return use
+
+
+def posts():
+    return sorted(os.listdir(reporter.POSTS_DIR))
+
+
+def test_first_passing_draft_is_published_without_llm_extraction(drafting):
+    drafting(DraftBackend(wrong=[reporter.DRAFT_TEMPERATURES[1]]))
+
+    filepath = reporter.generate_weekly_digest_report("2026-02-23", drafts=2)
+
+    assert filepath and os.path.basename(filepath) in posts()
+    with open(filepath) as f:
+        assert "17-16" not in f.read()
+
+
+def test_losing_drafts_stop_streaming_once_one_passes(drafting):
+    fast, slow = reporter.DRAFT_TEMPERATURES[:2]
+    backend = drafting(DraftBackend(slow=[slow]))
+
+    reporter.generate_weekly_digest_report("2026-02-23", drafts=2)
+    time.sleep(5 * backend.chunk_delay)
+
+    assert backend.streamed[fast] >= backend.stream_chunks
+    assert backend.streamed[slow] < backend.stream_chunks
+
+
+def test_no_passing_draft_publishes_nothing(drafting):
+    drafting(DraftBackend(wrong=reporter.DRAFT_TEMPERATURES))
+    before = posts()
+
+    with pytest.raises(reporter.NoPassingDraft) as raised:
+        reporter.generate_weekly_digest_report("2026-02-23", drafts=3)
+
+    assert len(raised.value.rejections) == 3
+    assert all("SCORE ERROR" in rejection for rejection in raised.value.rejections)
+    assert posts() == before
+
+
+def test_no_passing_draft_blocks_the_pipeline_before_the_gate(tmp_path, monkeypatch):
+    def no_pass(*args, **kwargs):
+        raise reporter.NoPassingDraft(["Draft 1 (temperature 1.0): SCORE ERROR"])
+
+    monkeypatch.setattr(reporter, "generate_weekly_digest_report", no_pass)
+    runs = []
+
+    def gate(upstream):
+        runs.append("gate")
+        return StageOutcome(EXIT_PUBLISHABLE, [])
+
+    stages = [Stage("report", pipeline._make_report_runner(None, False, drafts=3)),
+              Stage("gate", gate, after=("report",))]
+    state = str(tmp_path / "state.json")
+
+    assert run_pipeline(stages, state_path=state) == EXIT_BLOCKED
+    assert runs == []
+    assert "report" not in pipeline.load_state(state)
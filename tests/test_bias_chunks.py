@@ -0,0 +1,61 @@
+"""Per-section bias audits: chunking, cache keys and re-sending only edited chunks."""
+
+import bias_checker
+from bias_checker import CHUNK_CHAR_LIMIT, audit_chunks, chunk_key, split_into_chunks
+from llm_backend import FakeBackend
+
+
+class CountingBackend(FakeBackend):
+    """A cacheable stand-in that counts the chunks actually sent."""
+    name = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, contents, call_site="generic", **kwargs):
+        self.calls += 1
+        return super().generate(contents, call_site=call_site, **kwargs)
+
+
+POST = "---\ntitle: x\n---\n# Headline\nSubline.\n\n## The Recaps\nA close one.\n\n## The Lede\nBig week.\n"
+
+
+def test_chunks_follow_sections_and_pack_long_ones_under_their_heading():
+    long_section = "## Long\n\n" + "\n\n".join("word " * 100 for _ in range(12))
+
+    assert split_into_chunks(POST) == ["# Headline\nSubline.", "## The Recaps\nA close one.", "## The Lede\nBig week."]
+    pieces = split_into_chunks(long_section)
+    assert len(pieces) > 1
+    assert all(p.startswith("## Long") and len(p) <= CHUNK_CHAR_LIMIT + 20 for p in pieces)
+
+
+def test_chunk_key_ignores_whitespace_but_not_backend_or_model():
+    key = chunk_key("Big  week.\n", "gemini")
+
+    assert key == chunk_key("Big week.", "gemini")
+    assert key != chunk_key("Big week.", "fake")
+    assert key != chunk_key("Big week.", "gemini", model="another-model")
+
+
+def test_only_edited_chunks_are_resent():
+    backend, cache = CountingBackend(), {}
+    chunks = split_into_chunks(POST)
+
+    audit_chunks(backend, chunks, cache)
+    assert backend.calls == 3 and len(cache) == 3
+
+    edited = chunks[:2] + ["## The Lede\nBig week, bigger stakes."]
+    evaluations, cached = audit_chunks(backend, edited, cache)
+    assert backend.calls == 4 and cached == 2
+    assert len(evaluations) == 3
+
+
+def test_fake_backend_verdicts_are_never_persisted():
+    cache = {}
+
+    evaluations, _ = audit_chunks(FakeBackend(), split_into_chunks(POST), cache)
+
+    assert cache == {}
+    assert all("Absent" in evaluation for evaluation in evaluations)
+    assert "fake" in bias_checker.UNCACHED_BACKENDS
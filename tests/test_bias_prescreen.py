@@ -0,0 +1,64 @@
+"""Lexicon pre-screen: clean sections skip the full audit but keep the balance review."""
+
+import bias_checker
+import bias_lexicon
+from bias_checker import BALANCE_CATEGORIES
+from llm_backend import FakeBackend
+
+CLEAN = "# Headline\nSubline.\n\n## The Recaps\nThe Shockers won 3-2.\n\n## The Lede\nA tight week.\n"
+FLAGGED = CLEAN + "\n## Fallout\nThe Sahara looked lazy and gave up late.\n"
+
+
+class PromptLog(FakeBackend):
+    name = "prompt-log"
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def generate(self, contents, call_site="generic", **kwargs):
+        self.prompts.append(contents)
+        return super().generate(contents, call_site=call_site, **kwargs)
+
+
+def run_audit(monkeypatch, tmp_path, text):
+    backend = PromptLog()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bias_checker, "shared_backend", lambda: backend)
+    return bias_checker.audit_bias("post.md", prescreen=True, article_text=text), backend.prompts
+
+
+def test_clean_post_gets_one_combined_balance_review(monkeypatch, tmp_path):
+    verdict, prompts = run_audit(monkeypatch, tmp_path, CLEAN)
+
+    assert verdict["status"] == "pass"
+    assert verdict["sections_reviewed"] == 0 and verdict["balance_checked"]
+    assert len(prompts) == 1
+    assert all(category in prompts[0] for category in BALANCE_CATEGORIES)
+    assert "Subjective Dismissal" not in prompts[0]
+    assert "A tight week." in prompts[0] and "The Shockers won 3-2." in prompts[0]
+
+
+def test_flagged_sections_get_the_full_audit(monkeypatch, tmp_path):
+    verdict, prompts = run_audit(monkeypatch, tmp_path, FLAGGED)
+
+    assert verdict["sections_reviewed"] == 1
+    full = [p for p in prompts if "Subjective Dismissal" in p]
+    assert len(full) == 1 and "looked lazy" in full[0]
+    assert len(prompts) == 2
+
+
+def test_measurement_counts_duplicate_posts_once(monkeypatch, tmp_path):
+    posts = tmp_path / "posts"
+    posts.mkdir()
+    biased = "# Headline\nThe Sahara were pathetic.\n"
+    (tmp_path / "biased_post.md").write_text(biased)
+    (posts / "2026-02-28-dispatch.md").write_text(biased)
+    (posts / "2026-03-02-dispatch.md").write_text(CLEAN)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bias_lexicon, "POSTS_DIR", str(posts))
+
+    results = bias_lexicon.measure()
+
+    assert results["posts"] == 2 and results["duplicates"] == 1
+    assert results["precision"] == results["recall"] == 1.0
@@ -0,0 +1,57 @@
+"""Local claim extraction and the sentences it hands to the LLM fallback."""
+
+import pandas as pd
+import pytest
+
+from claim_extractor import Gazetteer, extract_claims, merge_claims
+
+
+@pytest.fixture
+def gazetteer():
+    details = pd.DataFrame([
+        dict(EventType="RosterAppearance", Description="Sean Murphy"),
+        dict(EventType="RosterAppearance", Description="Dana Kowalski"),
+        dict(EventType="Goal", Description="#12 Sean Murphy (#4 Dana Kowalski)"),
+        dict(EventType="Official", Description="Referee: Pat Quinn"),
+    ])
+    manifest = pd.DataFrame([dict(Home="The Shockers", Away="Don Cherry's")])
+    return Gazetteer.from_data(details, manifest)
+
+
+def test_structured_lines_and_resolved_prose_stay_local(gazetteer):
+    report = ("---\ntitle: x\n---\n"
+              "The Shockers beat Don Cherry's 5-2 on Monday. Murphy scored twice. Pat Quinn kept order.\n"
+              "**1st Star: Sean Murphy (The Shockers)** - 2G, 1A, 3Pts. - Great.\n")
+
+    claims, unresolved = extract_claims(report, gazetteer)
+
+    assert unresolved == []
+    assert claims["matchups"] == [{"home": "The Shockers", "away": "Don Cherry's", "score": "5-2"}]
+    assert {"player": "Sean Murphy", "type": "goal"} in claims["events"]
+    assert claims["star_lines"][0]["pts"] == 3
+    assert claims["officials"] == ["Pat Quinn"]
+
+
+@pytest.mark.parametrize("sentence", [
+    "The Shockrs won 5-2 over the Wizards.",          # score without two known teams
+    "Jon Smyth scored the winner late in the third.",  # scoring claim naming no known player
+])
+def test_unverifiable_claims_go_to_the_fallback(gazetteer, sentence):
+    claims, unresolved = extract_claims(sentence, gazetteer)
+
+    assert unresolved == [sentence.rstrip()]
+    assert claims["matchups"] == [] and claims["events"] == []
+
+
+def test_merge_drops_duplicate_events_and_officials():
+    local = {"matchups": [], "events": [{"player": "A", "type": "goal"}], "officials": ["Pat Quinn"],
+             "star_lines": [], "hardware_lines": []}
+    fallback = {"matchups": [{"home": "X", "away": "Y", "score": "1-0"}],
+                "events": [{"player": "A", "type": "goal"}, {"player": "B", "type": "assist"}],
+                "officials": ["Pat Quinn"]}
+
+    merged = merge_claims(local, fallback)
+
+    assert merged["events"] == [{"player": "A", "type": "goal"}, {"player": "B", "type": "assist"}]
+    assert merged["officials"] == ["Pat Quinn"]
+    assert len(merged["matchups"]) == 1
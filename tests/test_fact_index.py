@@ -0,0 +1,49 @@
+"""Fact index lookups: exact/alias resolution for verification, fuzzy matching only as a hint."""
+
+import pandas as pd
+import pytest
+
+import validator
+from fact_index import FactIndex
+
+
+@pytest.fixture
+def index():
+    details = pd.DataFrame([
+        dict(GameID=1, EventType="Goal", Description="#12 John Smith (#4 Dana Kowalski)"),
+        dict(GameID=1, EventType="Penalty", Description="Hooking: #4 Dana Kowalski (2 mins)"),
+        dict(GameID=1, EventType="Official", Description="Referee: Pat Quinn"),
+    ], columns=["GameID", "EventType", "Team", "Description", "Strength", "Period"])
+    manifest = pd.DataFrame([dict(GameID=1, Home="Don Cherry's", Away="The Shockers", Score="3 - 2",
+                                  Date="Mon Jan 5")])
+    return FactIndex.from_data(details, manifest)
+
+
+def test_exact_names_and_known_aliases_resolve(index):
+    assert index.resolve_player("John Smith") == "john smith"
+    assert index.resolve_player("Smith") == "john smith"          # unique surname alias
+    assert index.resolve_team("Cherry's") == index.resolve_team("Don Cherry's")
+    assert index.resolve_team("Shockers") == "the shockers"
+    assert index.lookup_scores("Cherry's", "Shockers") == ["3-2", "2-3"]
+
+
+def test_fuzzy_only_matches_do_not_verify(index):
+    assert index.resolve_player("Jon Smyth") is None
+    assert not index.has_player_event("Jon Smyth", "goal")
+    assert index.resolve_team("Don Cherrys Club") is None
+    assert index.lookup_scores("Shockerz", "Cherry's") == []
+
+
+def test_fuzzy_matching_is_kept_for_suggestions(index):
+    assert index.suggest_player("Jon Smyth") == "John Smith"
+    assert index.suggest_team("Shockerz") == "The Shockers"
+
+
+def test_misspelled_star_is_reported_as_a_discrepancy(analyzed_league):
+    context = validator.load_audit_context()
+    report = "Big night.\n\n**1st Star: Sho1 Playr1 (The Shockers)** - 1G, 0A, 1Pts. - Solid.\n"
+
+    verdict = validator.audit_post("2026-02-23-dispatch.md", context, report_text=report)
+
+    assert not verdict["passed"]
+    assert any("Sho1 Playr1" in e and "closest known: Sho1 Player1" in e for e in verdict["errors"])
@@ -0,0 +1,32 @@
+"""Compact per-game summaries sent to the LLM in place of raw event rows."""
+
+import random
+
+import pandas as pd
+
+from analyzer import build_game_summaries
+from conftest import game_events
+
+
+def test_summary_keeps_only_reader_facing_fields():
+    events = pd.DataFrame(game_events(1001, "The Shockers", "The Sahara", 2, 1, random.Random(3)))
+    manifest = pd.DataFrame([dict(GameID=1001, Home="The Shockers", Away="The Sahara",
+                                  Date="Mon Jan 5 2026", GameType="Regular Season")])
+
+    [summary] = build_game_summaries(events, manifest)
+
+    assert summary["game_id"] == "1001"
+    assert summary["final_score"] == {"The Shockers": 2, "The Sahara": 1}
+    assert len(summary["goals"]) == 3
+    assert all("scorer" in goal and "ScrapedAt" not in goal for goal in summary["goals"])
+    assert summary["officials"] == ["Referee: Pat Quinn"]
+    assert summary["roster_size"] == {"The Shockers": 10, "The Sahara": 10}
+
+
+def test_summaries_follow_manifest_order_and_skip_games_without_events():
+    rng = random.Random(5)
+    events = pd.DataFrame(game_events(2, "A", "B", 1, 0, rng) + game_events(1, "C", "D", 0, 1, rng))
+    manifest = pd.DataFrame([dict(GameID=gid, Home="A", Away="B", Date="Mon Jan 5", GameType="")
+                             for gid in (1, 3, 2)])
+
+    assert [s["game_id"] for s in build_game_summaries(events, manifest)] == ["1", "2"]
@@ -0,0 +1,66 @@
+"""The combined gate: concurrent audits, bias cancellation and the merged exit code."""
+
+import asyncio
+import time
+
+import pytest
+
+import bias_checker
+import gate
+import reporter
+import validator
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_NEEDS_REVIEW, EXIT_PUBLISHABLE, load_policy
+from llm_backend import FakeBackend
+
+
+class SlowBiasBackend(FakeBackend):
+    name = "slow"
+
+    def __init__(self, latency):
+        super().__init__()
+        self.delay, self.calls = latency, 0
+
+    def generate(self, contents, call_site="generic", **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return super().generate(contents, call_site=call_site, **kwargs)
+
+
+@pytest.fixture
+def post(analyzed_league):
+    return reporter.generate_weekly_digest_report("2026-02-23")
+
+
+def test_clean_post_passes_both_gates(post, monkeypatch):
+    monkeypatch.setattr(bias_checker, "shared_backend", lambda: SlowBiasBackend(0))
+
+    merged = asyncio.run(gate.run_gate(post, load_policy()))
+
+    assert merged["status"] == "pass" and merged["blocked_by"] == []
+    assert gate.gate_exit_code(merged) == EXIT_PUBLISHABLE
+
+
+def test_factual_failure_cancels_pending_bias_chunks(post, monkeypatch):
+    backend = SlowBiasBackend(0.5)
+    monkeypatch.setattr(bias_checker, "shared_backend", lambda: backend)
+    with open(post, "a") as f:
+        f.write("\nThe Shockers beat The Sahara 17-16.\n")
+        for i in range(8):
+            f.write(f"\n## Fallout {i}\nThe Sahara looked lazy in game {i}.\n")
+
+    merged = asyncio.run(gate.run_gate(post, load_policy(), validator.load_audit_context()))
+
+    assert merged["blocked_by"] == ["validator"]
+    assert merged["bias"]["status"] == "cancelled"
+    assert backend.calls < 9
+    assert gate.gate_exit_code(merged) == EXIT_BLOCKED
+
+
+@pytest.mark.parametrize("merged, code", [
+    ({"status": "pass", "publishable": True, "blocked_by": []}, EXIT_PUBLISHABLE),
+    ({"status": "blocked", "publishable": False, "blocked_by": ["bias"]}, EXIT_NEEDS_REVIEW),
+    ({"status": "blocked", "publishable": False, "blocked_by": ["validator", "bias"]}, EXIT_BLOCKED),
+    ({"status": "error", "publishable": False, "blocked_by": []}, EXIT_ERROR),
+])
+def test_merged_exit_codes(merged, code):
+    assert gate.gate_exit_code(merged) == code
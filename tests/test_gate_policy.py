@@ -0,0 +1,82 @@
+"""Structured verdicts, editorial policy overrides and the shared gate exit codes."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import reporter
+from conftest import SRC_DIR
+from gate_policy import (EXIT_BLOCKED, EXIT_ERROR, EXIT_PUBLISHABLE, apply_policy, exit_code,
+                         load_policy)
+
+
+def bias_verdict(*categories, status=None):
+    status = status or ("fail" if len(categories) > 1 else "minor" if categories else "pass")
+    return {"gate": "bias", "post": "2026-02-28-dispatch.md", "status": status,
+            "categories": {c: [] for c in categories}}
+
+
+def test_default_policy_blocks_any_flagged_category():
+    policy = load_policy("missing-policy.json")
+
+    assert exit_code(apply_policy(bias_verdict(), policy)) == EXIT_PUBLISHABLE
+    assert exit_code(apply_policy(bias_verdict("Player Fixation"), policy)) == EXIT_BLOCKED
+    assert exit_code(apply_policy(bias_verdict(status="error"), policy)) == EXIT_ERROR
+
+
+def test_policy_file_tolerates_and_overrides(tmp_path):
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps({
+        "bias": {"allow_categories": ["Player Fixation"]},
+        "overrides": {"2026-02-28-dispatch.md": {"gates": ["bias"], "approved_by": "Ed", "reason": "Satire"}},
+    }))
+    policy = load_policy(str(path))
+
+    tolerated = apply_policy(bias_verdict("Player Fixation"), policy)
+    assert tolerated["publishable"] and tolerated["override"] is None
+
+    overridden = apply_policy(bias_verdict("Outcome Skew", "Subjective Dismissal"), policy)
+    assert overridden["publishable"] and overridden["override"]["approved_by"] == "Ed"
+
+    factual = apply_policy({"gate": "validator", "post": "2026-02-28-dispatch.md", "status": "fail"}, policy)
+    assert exit_code(factual) == EXIT_BLOCKED
+
+
+def test_errors_are_never_overridable():
+    policy = {"bias": {}, "overrides": {"2026-02-28-dispatch.md": {"approved_by": "Ed"}}}
+
+    assert exit_code(apply_policy(bias_verdict(status="error"), policy)) == EXIT_ERROR
+
+
+def test_invalid_policy_file_is_rejected(tmp_path):
+    path = tmp_path / "policy.json"
+    path.write_text("[1, 2]")
+
+    with pytest.raises(ValueError):
+        load_policy(str(path))
+
+
+def run_validator(post):
+    return subprocess.run([sys.executable, os.path.join(SRC_DIR, "validator.py"), post, "--json"],
+                          capture_output=True, text=True, env=dict(os.environ))
+
+
+def test_validator_cli_emits_json_verdicts_and_exit_codes(analyzed_league):
+    post = reporter.generate_weekly_digest_report("2026-02-23")
+
+    clean = run_validator(post)
+    assert clean.returncode == EXIT_PUBLISHABLE, clean.stderr
+    assert json.loads(clean.stdout)["status"] == "pass"
+
+    with open(post) as f:
+        text = f.read()
+    tampered = str(analyzed_league / "docs" / "_posts" / "2026-02-24-dispatch.md")
+    with open(tampered, "w") as f:
+        f.write(text + "\nThe Shockers beat The Sahara 17-16.\n")
+
+    blocked = run_validator(tampered)
+    assert blocked.returncode == EXIT_BLOCKED, blocked.stderr
+    assert json.loads(blocked.stdout)["status"] == "fail"
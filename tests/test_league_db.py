@@ -0,0 +1,90 @@
+"""League database: scrape-batch dedupe, atomic telemetry exports and the indexed views."""
+
+import os
+import random
+
+import pandas as pd
+import pytest
+
+import league_db
+from conftest import TEAMS, game_events
+from league_db import dedupe_events, open_db
+
+
+def one_game(scraped_at="2026-03-10T09:00:00.000001", game_id=2001):
+    rows = pd.DataFrame(game_events(game_id, TEAMS[0], TEAMS[1], 2, 1, random.Random(3), scraped_at=scraped_at))
+    # Two identical minors in the same game are two real penalties
+    return pd.concat([rows, rows[rows["EventType"] == "Penalty"].head(1)], ignore_index=True)
+
+
+def test_identical_rows_within_one_batch_are_kept():
+    batch = one_game()
+    assert len(dedupe_events(batch)) == len(batch)
+
+
+def test_a_batch_appended_twice_is_trimmed_to_one_copy():
+    batch = one_game()
+    other = one_game(game_id=2002)
+    doubled = pd.concat([batch, other, batch], ignore_index=True)
+
+    deduped = dedupe_events(doubled)
+    assert len(deduped) == len(batch) + len(other)
+    pd.testing.assert_frame_equal(deduped.reset_index(drop=True),
+                                  pd.concat([batch, other], ignore_index=True))
+
+
+def test_only_the_latest_batch_of_a_game_survives():
+    legacy = one_game(scraped_at="2026-03-10")
+    rescrape = one_game(scraped_at=league_db.scrape_batch_id())
+    assert rescrape["ScrapedAt"].iloc[0] > "2026-03-10"
+
+    deduped = dedupe_events(pd.concat([legacy, rescrape], ignore_index=True))
+    assert list(deduped["ScrapedAt"].unique()) == [rescrape["ScrapedAt"].iloc[0]]
+    assert len(deduped) == len(rescrape)
+
+
+def test_new_game_is_appended_to_the_csv_and_stays_in_sync(league_dir):
+    events = one_game().to_dict(orient="records")
+    with open_db() as db:
+        db.replace_game_events(2001, events)
+        stored = db.events()
+
+    assert pd.read_csv(league_db.DETAILS_FILE).shape == stored.shape
+    assert not [name for name in os.listdir("data") if name.endswith(".tmp")]
+    with open_db(sync=False) as db:
+        assert db.sync_from_csv() == []
+
+
+def test_a_failed_csv_append_leaves_the_csv_and_database_untouched(league_dir, monkeypatch):
+    with open(league_db.DETAILS_FILE, "rb") as f:
+        before = f.read()
+
+    def broken(df, path, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(league_db, "append_csv_atomically", broken)
+    with open_db() as db:
+        with pytest.raises(OSError):
+            db.replace_game_events(2001, one_game().to_dict(orient="records"))
+        assert "2001" not in db.scraped_game_ids()
+
+    with open(league_db.DETAILS_FILE, "rb") as f:
+        assert f.read() == before
+
+
+def test_official_lookups_use_the_expression_index(league_dir):
+    with open_db() as db:
+        plan = " ".join(row[-1] for row in db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT game_id FROM officials WHERE official = ?", ("Pat Quinn",)))
+        games = db.conn.execute("SELECT COUNT(*) FROM officials WHERE official = 'Pat Quinn'").fetchone()[0]
+
+    assert "idx_events_official" in plan
+    assert games == 10
+
+
+def test_scraper_stamps_one_batch_id_per_game():
+    scraper = pytest.importorskip("scraper", exc_type=ImportError)
+    game = {"GameID": 3001, "Home": TEAMS[0], "Away": TEAMS[1], "Score": "1 - 0", "Status": "Forfeit"}
+
+    events = scraper.scrape_game_events(None, game)
+    assert len({event["ScrapedAt"] for event in events}) == 1
@@ -0,0 +1,113 @@
+"""Division registry: entry defaults, partitioned paths, selection and multi-division exit codes."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import leagues
+from conftest import SRC_DIR
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_NEEDS_REVIEW, EXIT_PUBLISHABLE
+
+HIGH_A = {"key": "high-a", "name": "Sunday High A", "short_name": "High A",
+          "hub_url": "https://example.test/scores?division_id=41980"}
+
+
+@pytest.fixture
+def registry_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(leagues.DIVISION_ENV, raising=False)
+
+    def write(*entries):
+        os.makedirs("data", exist_ok=True)
+        with open(leagues.REGISTRY_FILE, "w", encoding="utf-8") as f:
+            json.dump({"divisions": list(entries)}, f)
+    return write
+
+
+def test_missing_registry_means_only_the_default_division(registry_file):
+    registry = leagues.load_registry()
+    assert list(registry) == [leagues.DEFAULT_DIVISION]
+    assert leagues.active_division().data_path("x.csv") == os.path.join("data", "x.csv")
+
+
+def test_new_divisions_are_partitioned_and_filled_with_defaults(registry_file):
+    registry_file(HIGH_A)
+    division = leagues.get_division("high-a")
+
+    assert division.data_dir == os.path.join("data", "divisions", "high-a")
+    assert division.posts_dir == os.path.join("docs", "_posts", "high-a")
+    assert division.assets_dir == os.path.join("docs", "assets", "images", "high-a")
+    assert division.publication == "The High A Dispatch"
+    assert division.league == leagues.DEFAULT.league and not division.is_default
+
+
+def test_a_default_entry_overrides_identity_but_keeps_the_historical_paths(registry_file):
+    registry_file({"key": leagues.DEFAULT_DIVISION, "publication": "The Renamed Dispatch",
+                   "data_dir": "elsewhere"})
+    division = leagues.get_division(leagues.DEFAULT_DIVISION)
+
+    assert division.publication == "The Renamed Dispatch"
+    assert division.data_dir == "data" and division.posts_dir == leagues.POSTS_ROOT
+
+
+@pytest.mark.parametrize("contents, message", [
+    ({"divisions": [{"key": "mid-c", "name": "Mid C"}]}, "missing: hub_url"),
+    ({"divisions": [HIGH_A, HIGH_A]}, "registered twice"),
+    ("not json", "Could not read"),
+])
+def test_malformed_registries_are_rejected(registry_file, contents, message):
+    os.makedirs("data", exist_ok=True)
+    with open(leagues.REGISTRY_FILE, "w", encoding="utf-8") as f:
+        f.write(contents if isinstance(contents, str) else json.dumps(contents))
+    with pytest.raises(ValueError, match=message):
+        leagues.load_registry()
+
+
+def test_selection_expands_all_and_rejects_unknown_keys(registry_file, monkeypatch):
+    registry_file(HIGH_A)
+    assert [d.key for d in leagues.resolve_divisions(["all"])] == [leagues.DEFAULT_DIVISION, "high-a"]
+    assert [d.key for d in leagues.resolve_divisions(["high-a", "high-a"])] == ["high-a"]
+    with pytest.raises(ValueError, match="Unknown division"):
+        leagues.resolve_divisions(["nope"])
+
+    monkeypatch.setenv(leagues.DIVISION_ENV, "high-a")
+    assert leagues.active_division().key == "high-a"
+
+
+def test_llm_quota_is_split_between_workers(monkeypatch):
+    monkeypatch.setenv("LLM_RPM", "10")
+    monkeypatch.setenv("LLM_TPM", "250000")
+    assert leagues._split_quota(3) == {"LLM_RPM": "3", "LLM_TPM": "83333"}
+    assert leagues._split_quota(20)["LLM_RPM"] == "1"
+
+
+def test_multi_division_runs_report_the_most_severe_exit_code(registry_file, monkeypatch):
+    registry_file(HIGH_A, {**HIGH_A, "key": "mid-c"}, {**HIGH_A, "key": "low-c"})
+    codes = {leagues.DEFAULT_DIVISION: EXIT_PUBLISHABLE, "high-a": EXIT_NEEDS_REVIEW, "mid-c": EXIT_BLOCKED,
+             "low-c": EXIT_PUBLISHABLE}
+    seen_env = []
+
+    def fake_run(division, argv, env):
+        seen_env.append(env)
+        return codes[division.key], 0.0, division.data_path(leagues.WORKER_LOG)
+
+    monkeypatch.setattr(leagues, "run_division", fake_run)
+    divisions = leagues.resolve_divisions(["all"])
+    assert leagues.run_divisions(divisions, [], workers=2) == EXIT_BLOCKED
+    assert all(env == seen_env[0] for env in seen_env)
+
+    codes["low-c"] = 139  # A crashed worker counts as an error
+    assert leagues.run_divisions(divisions, [], workers=2) == EXIT_ERROR
+
+
+def test_modules_bind_their_paths_to_the_selected_division(registry_file):
+    registry_file(HIGH_A)
+    probe = "import analyzer, reporter; print(analyzer.DETAILS_FILE); print(reporter.POSTS_DIR)"
+    env = {**os.environ, leagues.DIVISION_ENV: "high-a", "PYTHONPATH": SRC_DIR}
+    out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True).stdout
+
+    assert out.splitlines() == [os.path.join("data", "divisions", "high-a", "game_details.csv"),
+                                os.path.join("docs", "_posts", "high-a")]
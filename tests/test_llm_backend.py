@@ -0,0 +1,50 @@
+"""Offline backends: deterministic fake outputs and cassette record/replay."""
+
+import json
+
+import pytest
+
+from llm_backend import BIAS_CATEGORIES, CassetteBackend, FakeBackend, get_backend
+
+
+def test_fake_backend_is_deterministic_and_streams_the_same_text():
+    backend = FakeBackend(stream_chunks=3)
+    prompt = ["instructions", "DATA BRIEF:\n{}\n"]
+
+    first = backend.generate(prompt, call_site="reporter").text
+    assert first == backend.generate(prompt, call_site="reporter").text
+    assert "".join(backend.generate_stream(prompt, call_site="reporter")) == first
+
+
+def test_fake_backend_shapes_outputs_per_call_site():
+    backend = FakeBackend()
+
+    extraction = json.loads(backend.generate("- The Shockers 3-2 The Sahara", call_site="validator").text)
+    assert extraction["matchups"] == [{"home": "The Shockers", "away": "The Sahara", "score": "3-2"}]
+
+    verdicts = backend.generate("post", call_site="bias_checker").text.splitlines()
+    assert verdicts == [f"- {category}: Absent" for category in BIAS_CATEGORIES]
+
+
+def test_cassette_replays_recorded_responses_byte_for_byte(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    recorder = CassetteBackend(mode="record", path=path, inner=FakeBackend())
+    recorded = recorder.generate("prompt", call_site="scout", temperature=0.5)
+
+    replayed = CassetteBackend(mode="replay", path=path).generate("prompt", call_site="scout", temperature=0.5)
+
+    assert replayed.text == recorded.text
+    assert replayed.from_cache
+
+
+def test_cassette_miss_fails_loudly(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    CassetteBackend(mode="record", path=path, inner=FakeBackend()).generate("prompt", temperature=0.5)
+
+    with pytest.raises(KeyError):
+        CassetteBackend(mode="replay", path=path).generate("prompt", temperature=1.0)
+
+
+def test_unknown_backend_kind_is_rejected():
+    with pytest.raises(ValueError):
+        get_backend("carrier-pigeon")
@@ -0,0 +1,81 @@
+"""LLM usage telemetry: recording rules, cost estimates, percentiles and weekly trends."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import llm_metrics
+
+
+@pytest.fixture
+def metrics_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm_metrics.jsonl")
+    monkeypatch.setenv("LLM_METRICS", "1")
+    monkeypatch.setattr(llm_metrics, "METRICS_FILE", path)
+    return path
+
+
+def record(site, ts, latency_ms=100.0, prompt_tokens=1000, cache="miss", error=None, streamed=False):
+    return {"ts": ts, "call_site": site, "latency_ms": latency_ms, "prompt_tokens": prompt_tokens,
+            "response_tokens": 200, "retries": 0, "cache": cache, "error": error, "streamed": streamed,
+            "cost_usd": 0.001}
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert llm_metrics.percentile(values, 50) == 50
+    assert llm_metrics.percentile(values, 99) == 99
+    assert llm_metrics.percentile([7], 90) == 7
+    assert llm_metrics.percentile([], 50) is None
+
+
+def test_estimate_cost_bills_cached_prompt_tokens_at_the_cached_rate():
+    full = llm_metrics.estimate_cost("gemini-2.5-flash", 1_000_000, 0)
+    cached = llm_metrics.estimate_cost("gemini-2.5-flash", 1_000_000, 0, cached_tokens=1_000_000)
+    assert full == pytest.approx(0.30) and cached == pytest.approx(0.075)
+    assert llm_metrics.estimate_cost("gemini-2.5-flash", 0, 1_000_000) == pytest.approx(2.50)
+    assert llm_metrics.estimate_cost("unpriced-model", 10, 10) is None
+
+
+def test_calls_are_recorded_except_for_the_fake_backend(metrics_file, monkeypatch):
+    llm_metrics.record_call("reporter", "gemini", "gemini-2.5-flash", 1.5, prompt_tokens=400, response_tokens=100)
+    llm_metrics.record_call("reporter", "fake", "gemini-2.5-flash", 0.1)
+    llm_metrics.record_cache_hits("bias_checker", 2, "gemini")
+    llm_metrics.record_call("validator", "gemini", "gemini-2.5-flash", 0.2, error="TimeoutError")
+
+    records = llm_metrics.load_records(metrics_file)
+    assert [r["call_site"] for r in records] == ["reporter", "bias_checker", "bias_checker", "validator"]
+    assert records[0]["latency_ms"] == 1500.0 and records[0]["cost_usd"] > 0
+    assert records[1]["cache"] == "hit" and records[1]["cost_usd"] == 0.0
+    assert records[3]["cost_usd"] is None
+    assert llm_metrics.load_records(metrics_file, site="validator") == records[3:]
+
+    monkeypatch.setenv("LLM_METRICS", "0")
+    llm_metrics.record_call("reporter", "gemini", "gemini-2.5-flash", 1.0)
+    assert len(llm_metrics.load_records(metrics_file)) == 4
+
+
+def test_summary_percentiles_cover_live_calls_only():
+    now = datetime.now().isoformat(timespec="seconds")
+    rows = [record("reporter", now, latency_ms=ms) for ms in (100, 200, 300, 400)]
+    rows += [record("reporter", now, latency_ms=0, cache="hit"), record("reporter", now, latency_ms=9999, error="X")]
+
+    summary = llm_metrics.summarize_by_site(rows)["reporter"]
+    assert summary["calls"] == 6 and summary["errors"] == 1
+    assert summary["cache_hit_rate"] == pytest.approx(1 / 6)
+    assert summary["latency_ms"] == {50: 200, 90: 400, 99: 400}
+
+
+def test_weekly_trends_flag_prompt_growth():
+    this_week = datetime.now()
+    last_week = this_week - timedelta(weeks=1)
+    rows = [record("reporter", last_week.isoformat(timespec="seconds"), prompt_tokens=1000),
+            record("reporter", this_week.isoformat(timespec="seconds"), prompt_tokens=1500),
+            record("reporter", this_week.isoformat(timespec="seconds"), prompt_tokens=0, streamed=True)]
+
+    weeks = llm_metrics.weekly_trends(rows)["reporter"]
+    assert [w["calls"] for w in weeks] == [1, 2]
+    assert weeks[0]["prompt_growth"] is None
+    assert weeks[1]["mean_prompt_tokens"] == 1500
+    assert weeks[1]["prompt_growth"] == pytest.approx(0.5)
+    assert weeks[1]["prompt_growth"] > llm_metrics.PROMPT_BLOAT_THRESHOLD
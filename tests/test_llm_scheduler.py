@@ -0,0 +1,120 @@
+"""Shared scheduler: bucket refill, retry exhaustion and in-flight slots held by streams."""
+
+import pytest
+
+import llm_scheduler
+from llm_scheduler import LLMScheduler, TokenBucket
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm_scheduler, "BACKOFF_BASE_S", 0.0)
+    monkeypatch.setattr(llm_scheduler.time, "sleep", lambda _: None)
+
+
+def test_token_bucket_refills_continuously_up_to_its_capacity():
+    bucket = TokenBucket(per_minute=60, burst_fraction=0.5)  # 30 burst, 0.5 tokens/s refill
+    start = bucket.updated
+    assert bucket.capacity == 30 and bucket.rate == pytest.approx(0.5)
+
+    bucket.take(30, start)
+    assert bucket.wait_time(10, start) == pytest.approx(20.0)
+    assert bucket.wait_time(10, start + 20) == pytest.approx(0.0)
+
+    bucket.wait_time(1, start + 3600)
+    assert bucket.level == pytest.approx(bucket.capacity)
+
+
+def test_oversized_requests_wait_for_a_full_bucket_then_leave_a_debt():
+    bucket = TokenBucket(per_minute=60, burst_fraction=0.5)
+    start = bucket.updated
+    assert bucket.wait_time(100, start) == 0.0  # Capped at the capacity, which is full
+
+    bucket.take(100, start)
+    assert bucket.level == pytest.approx(-70)
+    assert bucket.wait_time(1, start) == pytest.approx(142.0)  # Debt plus one token at 0.5/s
+
+
+def test_drain_empties_the_bucket_without_forgiving_debt():
+    bucket = TokenBucket(per_minute=60, burst_fraction=0.5)
+    bucket.drain(bucket.updated)
+    assert bucket.level == 0.0
+    bucket.take(5, bucket.updated)
+    bucket.drain(bucket.updated)
+    assert bucket.level == pytest.approx(-5)
+
+
+def test_transient_errors_are_retried_and_the_last_one_is_raised(no_backoff):
+    scheduler, calls = LLMScheduler(rpm=0, tpm=0), []
+
+    def flaky():
+        calls.append(1)
+        raise ConnectionError(f"connection reset #{len(calls)}")
+
+    with pytest.raises(ConnectionError, match=f"#{llm_scheduler.MAX_ATTEMPTS}$"):
+        scheduler.call(flaky, "scout")
+    assert len(calls) == llm_scheduler.MAX_ATTEMPTS
+    ledger = scheduler.ledger_snapshot()["scout"]
+    assert (ledger["attempts"], ledger["retries"], ledger["failures"]) == (llm_scheduler.MAX_ATTEMPTS,
+                                                                         llm_scheduler.MAX_ATTEMPTS - 1, 1)
+    assert scheduler.in_flight == 0
+
+
+def test_a_success_after_retries_returns_the_result(no_backoff):
+    scheduler, calls = LLMScheduler(rpm=0, tpm=0), []
+
+    def recovers():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TimeoutError("timed out")
+        return "ok"
+
+    assert scheduler.call(recovers, "scout") == "ok"
+    assert scheduler.ledger_snapshot()["scout"]["retries"] == 2
+    assert scheduler.in_flight == 0
+
+
+def test_permanent_errors_are_not_retried():
+    scheduler, calls = LLMScheduler(rpm=0, tpm=0), []
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        scheduler.call(broken, "scout")
+    assert len(calls) == 1 and scheduler.in_flight == 0
+
+
+def test_a_stream_holds_its_slot_until_exhausted():
+    scheduler = LLMScheduler(rpm=0, tpm=0, max_in_flight=1)
+    stream = scheduler.stream(lambda: iter(["a", "b", "c"]), "reporter")
+
+    assert next(stream) == "a"
+    assert scheduler.in_flight == 1
+    assert list(stream) == ["b", "c"]
+    assert scheduler.in_flight == 0
+
+
+def test_a_closed_or_failed_stream_releases_its_slot():
+    scheduler = LLMScheduler(rpm=0, tpm=0, max_in_flight=1)
+    stream = scheduler.stream(lambda: iter(["a", "b"]), "reporter")
+    next(stream)
+    stream.close()
+    assert scheduler.in_flight == 0
+
+    def dropped():
+        yield "a"
+        raise ConnectionError("connection reset mid-stream")
+
+    stream = scheduler.stream(dropped, "reporter")
+    assert next(stream) == "a"
+    with pytest.raises(ConnectionError):
+        next(stream)
+    assert scheduler.in_flight == 0
+
+
+def test_an_empty_stream_yields_nothing_and_releases():
+    scheduler = LLMScheduler(rpm=0, tpm=0, max_in_flight=1)
+    assert list(scheduler.stream(lambda: iter([]), "reporter")) == []
+    assert scheduler.in_flight == 0
@@ -0,0 +1,50 @@
+"""Trigram name index: aliases, fuzzy resolution, ambiguity and prose mentions."""
+
+from name_index import NameIndex, levenshtein
+
+TEAMS = ["The Shockers", "Don Cherry's", "Flat-Earthers", "Muffin Men"]
+
+
+def test_team_short_forms_are_exact_aliases():
+    index = NameIndex.for_teams(TEAMS)
+
+    assert index.exact("Shockers") == "The Shockers"
+    assert index.exact("Cherry's") == "Don Cherry's"
+    assert index.exact("Flat Earthers") == "Flat-Earthers"
+    assert index.exact("Shokers") is None
+
+
+def test_misspellings_resolve_fuzzily_above_the_threshold():
+    index = NameIndex.for_teams(TEAMS)
+
+    assert index.best("Don Cherrys") == "Don Cherry's"
+    assert index.best("Muffin Man") == "Muffin Men"
+    assert index.best("Zamboni Drivers") is None
+
+
+def test_ambiguous_candidates_are_rejected():
+    index = NameIndex.for_players(["Alex Martin", "Alex Marten"])
+
+    assert index.best("Alex Martyn") is None
+    assert index.best("Alex Martin") == "Alex Martin"
+
+
+def test_surnames_alias_only_unique_players():
+    index = NameIndex.for_players(["Sean Murphy", "Michael Murphy", "Dana Kowalski"])
+
+    assert index.exact("Kowalski") == "Dana Kowalski"
+    assert index.exact("Murphy") is None
+
+
+def test_mentions_are_found_in_order_of_appearance():
+    index = NameIndex.for_teams(TEAMS)
+
+    mentions = index.find_mentions("The Shockrs edged Cherry's, while the Muffin Men rested.")
+
+    assert [name for _, name in mentions] == ["The Shockers", "Don Cherry's", "Muffin Men"]
+    assert [name for _, name in index.find_mentions("The Shockrs won.", fuzzy=False)] == []
+
+
+def test_levenshtein_distance():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
@@ -0,0 +1,78 @@
+"""DAG runner: content-hash skipping, downstream invalidation and failure handling."""
+
+from gate_policy import EXIT_BLOCKED, EXIT_ERROR, EXIT_PUBLISHABLE
+from pipeline import Stage, StageOutcome, run_pipeline
+
+
+def build(tmp_path, runs, gate_code=EXIT_PUBLISHABLE, viz_fails=False):
+    source, table, post = (str(tmp_path / name) for name in ("source.csv", "table.csv", "post.md"))
+
+    def stage(name, output, content, code=EXIT_PUBLISHABLE):
+        def run(upstream):
+            runs.append(name)
+            if code == EXIT_ERROR:
+                return StageOutcome(EXIT_ERROR, [])
+            if output:
+                with open(output, "w") as f:
+                    f.write(content())
+            return StageOutcome(code, [output] if output else [])
+        return run
+
+    with open(source, "a"):
+        pass
+    return [
+        Stage("analyze", stage("analyze", table, lambda: open(source).read().upper()), inputs=[source],
+              outputs=[table]),
+        Stage("viz", stage("viz", None, str, EXIT_ERROR if viz_fails else EXIT_PUBLISHABLE), after=("analyze",),
+              optional=True),
+        Stage("report", stage("report", post, lambda: "post"), after=("analyze",)),
+        Stage("gate", stage("gate", None, str, gate_code), after=("report",)),
+    ], source
+
+
+def test_unchanged_inputs_skip_and_changed_inputs_rerun_downstream(tmp_path):
+    runs, state = [], str(tmp_path / "state.json")
+    stages, source = build(tmp_path, runs)
+
+    assert run_pipeline(stages, state_path=state) == EXIT_PUBLISHABLE
+    assert runs == ["analyze", "viz", "report", "gate"]
+
+    runs.clear()
+    run_pipeline(stages, state_path=state)
+    assert runs == []
+
+    with open(source, "w") as f:
+        f.write("new game")
+    runs.clear()
+    run_pipeline(stages, state_path=state)
+    # The report is rewritten with identical content, so the gate's inputs did not change
+    assert runs == ["analyze", "viz", "report"]
+
+
+def test_skipped_gate_reuses_its_recorded_verdict(tmp_path):
+    runs, state = [], str(tmp_path / "state.json")
+    stages, _ = build(tmp_path, runs, gate_code=EXIT_BLOCKED)
+
+    assert run_pipeline(stages, state_path=state) == EXIT_BLOCKED
+    runs.clear()
+    assert run_pipeline(stages, state_path=state) == EXIT_BLOCKED
+    assert runs == []
+
+
+def test_optional_failures_continue_and_force_reruns_everything(tmp_path):
+    runs, state = [], str(tmp_path / "state.json")
+    stages, _ = build(tmp_path, runs, viz_fails=True)
+
+    assert run_pipeline(stages, state_path=state) == EXIT_PUBLISHABLE
+    runs.clear()
+    run_pipeline(stages, state_path=state, force=True)
+    assert sorted(runs) == ["analyze", "gate", "report", "viz"]
+
+
+def test_required_failure_aborts_the_run(tmp_path):
+    runs = []
+    stages, _ = build(tmp_path, runs)
+    stages[2] = stages[2]._replace(run=lambda upstream: runs.append("report") or StageOutcome(EXIT_ERROR, []))
+
+    assert run_pipeline(stages, state_path=str(tmp_path / "state.json")) == EXIT_ERROR
+    assert "gate" not in runs
@@ -0,0 +1,119 @@
+"""The vectorized player-game table against the original row-by-row leaderboard loop."""
+
+import re
+
+import pandas as pd
+
+from analyzer import (compute_player_game_lines, extract_pims_from_description, impute_season_year,
+                      parse_integer_value, summarize_player_lines)
+
+COLUMNS = ['GameID', 'EventType', 'Team', 'Description', 'Strength', 'Period']
+
+
+def fixture_events() -> pd.DataFrame:
+    """Two games covering a traded player, an unrostered scorer, an unknown offender and a tie."""
+    rows = [
+        # Game 1: Shockers 3-1 Sahara. 'Trade Guy' dresses for the Shockers first.
+        (1, 'PeriodScore', 'Shockers', '3', '', 'Final'), (1, 'PeriodScore', 'Sahara', '1', '', 'Final'),
+        (1, 'RosterAppearance', 'Shockers', 'Trade Guy', '', ''),
+        (1, 'RosterAppearance', 'Shockers', 'Sho Ace', '', ''),
+        (1, 'RosterAppearance', 'Sahara', 'Sah One', '', ''),
+        (1, 'Goal', 'Shockers', '#9 Sho Ace (#4 Trade Guy)', 'PP', '1'),
+        (1, 'Goal', 'Sahara', '#3 Sah One', 'EV', '1'),
+        (1, 'Goal', 'Shockers', '#4 Trade Guy (#9 Sho Ace, #7 Walk On)', 'EV', '2'),
+        (1, 'Goal', 'Shockers', '#7 Walk On', 'SH', '3'),
+        (1, 'Penalty', 'Sahara', 'Slashing: #3 Sah One (2 mins)', '', '2'),
+        (1, 'Penalty', 'Sahara', 'Roughing: #99 Nobody Known (5 mins)', '', '3'),
+        # Game 2: Sahara 2-2 Shockers (no game-winner). 'Trade Guy' now plays for the Sahara.
+        (2, 'PeriodScore', 'Sahara', '2', '', 'Final'), (2, 'PeriodScore', 'Shockers', '2', '', 'Final'),
+        (2, 'RosterAppearance', 'Sahara', 'Trade Guy', '', ''),
+        (2, 'RosterAppearance', 'Shockers', 'Sho Ace', '', ''),
+        (2, 'Goal', 'Sahara', '#4 Trade Guy', 'EV', '1'),
+        (2, 'Goal', 'Shockers', '#9 Sho Ace (#5 Sah One)', 'EV', '1'),
+        (2, 'Goal', 'Sahara', '#3 Sah One (#4 Trade Guy)', 'PP', '2'),
+        (2, 'Goal', 'Shockers', '#9 Sho Ace', 'EV', '3'),
+        (2, 'Penalty', 'Sahara', 'Tripping: #4 Trade Guy (2 mins)', '', '2'),
+    ]
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def legacy_player_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """The pre-materialization leaderboard loop, kept verbatim in behavior as the reference."""
+    metrics, games = {}, {}
+    finals = df[(df['EventType'] == 'PeriodScore') & (df['Period'] == 'Final')]
+    winners = {}
+    for gid in finals['GameID'].unique():
+        res = finals[finals['GameID'] == gid]
+        s1, s2 = parse_integer_value(res.iloc[0]['Description']), parse_integer_value(res.iloc[1]['Description'])
+        if s1 != s2:
+            winners[gid] = (res.iloc[0]['Team'] if s1 > s2 else res.iloc[1]['Team'], min(s1, s2) + 1)
+
+    def init(name, team):
+        if name not in metrics:
+            metrics[name] = dict(Team=team, G=0, A=0, Pts=0, PIM=0, PPG=0, SHG=0, GWG=0)
+            games[name] = set()
+
+    for _, row in df[df['EventType'] == 'RosterAppearance'].iterrows():
+        init(row['Description'].strip(), row['Team'])
+        games[row['Description'].strip()].add(row['GameID'])
+
+    running = {}
+    for _, row in df[df['EventType'] == 'Goal'].iterrows():
+        gid, team, desc = row['GameID'], row['Team'], row['Description']
+        running[(gid, team)] = running.get((gid, team), 0) + 1
+        scorer = re.search(r'#\d+\s+([^(:]+)', desc)
+        if scorer:
+            name = scorer.group(1).strip()
+            init(name, team)
+            m = metrics[name]
+            m['G'] += 1
+            m['Pts'] += 1
+            m['PPG'] += row['Strength'] == 'PP'
+            m['SHG'] += row['Strength'] == 'SH'
+            m['GWG'] += winners.get(gid) == (team, running[(gid, team)])
+            games[name].add(gid)
+        chunk = re.search(r'\((.*?)\)', desc)
+        for raw in (chunk.group(1).split(',') if chunk else []):
+            assist = re.search(r'#\d+\s+([^,]+)', raw)
+            if assist:
+                name = assist.group(1).strip()
+                init(name, team)
+                metrics[name]['A'] += 1
+                metrics[name]['Pts'] += 1
+                games[name].add(gid)
+
+    for _, row in df[df['EventType'] == 'Penalty'].iterrows():
+        offender = re.search(r'#\d+\s+([^:]+)', row['Description'])
+        if offender and offender.group(1).strip() in metrics:
+            metrics[offender.group(1).strip()]['PIM'] += extract_pims_from_description(row['Description'])
+            games[offender.group(1).strip()].add(row['GameID'])
+
+    return pd.DataFrame([dict(Player=name, GP=len(games[name]), **m) for name, m in metrics.items()])
+
+
+def test_vectorized_lines_match_the_legacy_loop():
+    df = fixture_events()
+
+    lines = compute_player_game_lines(df)
+    actual = summarize_player_lines(lines).set_index('Player').sort_index()
+    expected = legacy_player_statistics(df).set_index('Player').sort_index()
+
+    columns = ['Team', 'GP', 'G', 'A', 'Pts', 'PIM', 'PPG', 'SHG', 'GWG']
+    pd.testing.assert_frame_equal(actual[columns], expected[columns], check_dtype=False)
+    assert actual.loc['Trade Guy', 'Team'] == 'Shockers'
+    assert 'Nobody Known' not in actual.index
+
+
+def test_each_line_keeps_the_team_seen_first_in_that_game():
+    lines = compute_player_game_lines(fixture_events()).set_index(['Player', 'GameID'])
+
+    assert lines.loc[('Trade Guy', 1), 'Team'] == 'Shockers'
+    assert lines.loc[('Trade Guy', 2), 'Team'] == 'Sahara'
+    assert lines.loc[('Walk On', 1), ['G', 'A', 'SHG']].tolist() == [1, 1, 1]
+    assert lines.loc[('Trade Guy', 1), 'GWG'] == 1
+    assert lines.xs(2, level='GameID')['GWG'].sum() == 0
+
+
+def test_season_year_is_imputed_from_the_month():
+    assert impute_season_year("Wed Feb 25") == "Wed Feb 25 2026"
+    assert impute_season_year("Mon Oct 6") == "Mon Oct 6 2025"
@@ -0,0 +1,54 @@
+"""Streaming generation: incremental draft writing, resume and the atomic publish."""
+
+import os
+
+import reporter
+from llm_backend import FakeBackend
+
+
+class RecordingBackend(FakeBackend):
+    """Offline backend that remembers every streamed prompt."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prompts = []
+
+    def generate_stream(self, contents, call_site="generic", **kwargs):
+        self.prompts.append(list(contents))
+        return super().generate_stream(contents, call_site=call_site, **kwargs)
+
+
+def test_stream_appends_every_chunk_to_the_draft(tmp_path, monkeypatch):
+    backend = RecordingBackend(stream_chunks=5)
+    monkeypatch.setattr(reporter, "backend", backend)
+    draft_path = tmp_path / "post.md.part"
+
+    text = reporter.stream_report_to_draft(["prompt"], str(draft_path))
+
+    assert text == backend.generate(["prompt"], call_site="reporter").text
+    assert draft_path.read_text() == text
+
+
+def test_stream_resumes_an_interrupted_draft(tmp_path, monkeypatch):
+    backend = RecordingBackend()
+    monkeypatch.setattr(reporter, "backend", backend)
+    draft_path = tmp_path / "post.md.part"
+    draft_path.write_text("# Kept Headline\nKept subline\n")
+
+    text = reporter.stream_report_to_draft(["prompt"], str(draft_path))
+
+    assert text.startswith("# Kept Headline\nKept subline\n")
+    assert draft_path.read_text() == text
+    resume = backend.prompts[0][-1]
+    assert resume.startswith("RESUME:") and "Kept subline" in resume
+
+
+def test_streamed_report_is_published_and_draft_removed(analyzed_league):
+    filepath = reporter.generate_weekly_digest_report("2026-02-23", stream=True)
+
+    assert filepath and os.path.exists(filepath)
+    assert not os.path.exists(f"{filepath}{reporter.DRAFT_SUFFIX}")
+    with open(filepath) as f:
+        post = f.read()
+    assert post.startswith("---\nlayout: single\n")
+    assert "<!-- stat-sections:start -->" in post
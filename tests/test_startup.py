@@ -0,0 +1,38 @@
+"""Deferred imports: LLM-free entry points never load pandas or the provider SDK."""
+
+import json
+import subprocess
+import sys
+
+from conftest import SRC_DIR
+from startup_bench import parse_importtime
+
+PROBE = """
+import sys, json
+sys.path.insert(0, {src!r})
+import {modules}
+print(json.dumps({{"pandas": "pandas" in sys.modules,
+                  "sdk": any(m == "google.genai" or m.startswith("google.genai.") for m in sys.modules)}}))
+"""
+
+
+def loaded_after_import(*modules):
+    code = PROBE.format(src=SRC_DIR, modules=", ".join(modules))
+    return json.loads(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                     check=True).stdout)
+
+
+def test_bias_gate_imports_skip_pandas_and_the_sdk():
+    assert loaded_after_import("bias_checker", "gate_policy", "stat_renderer") == {"pandas": False, "sdk": False}
+
+
+def test_reporter_defers_the_provider_sdk_until_the_first_call():
+    assert loaded_after_import("reporter")["sdk"] is False
+
+
+def test_importtime_output_is_parsed_with_nesting():
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       120 |        120 |   json.decoder\n"
+              "import time:       300 |        420 | json\n")
+
+    assert parse_importtime(stderr) == [(1, "json.decoder", 120), (0, "json", 420)]
@@ -0,0 +1,47 @@
+"""Numeric Three Stars and Hardware lines checked against window and season aggregates."""
+
+import pandas as pd
+import pytest
+
+import validator
+
+
+@pytest.fixture
+def audit(analyzed_league):
+    context = validator.load_audit_context()
+    index = context["fact_index"]
+    post_date = pd.Timestamp("2026-02-23")
+    window = validator.reporting_window_game_ids(index, post_date)
+    return index, window, post_date
+
+
+def top_line(index, **totals_kwargs):
+    totals = index.stat_totals(**totals_kwargs).sort_values("Pts", ascending=False)
+    key = totals.index[0]
+    player = index.player_lines.loc[index.player_lines["Key"] == key, "Player"].iloc[0]
+    return player, totals.loc[key]
+
+
+def test_matching_star_and_hardware_lines_verify(audit):
+    index, window, post_date = audit
+    player, week = top_line(index, game_ids=window)
+    leader, season = top_line(index, through=post_date)
+    claims = {"star_lines": [dict(player=player, team="", g=week.G, a=week.A, pts=week.Pts)],
+              "hardware_lines": [dict(player=leader, team="", pts=season.Pts)]}
+
+    assert validator.verify_stat_lines(claims, index, window, post_date) == []
+
+
+def test_mismatched_lines_report_precise_diffs(audit):
+    index, window, post_date = audit
+    player, week = top_line(index, game_ids=window)
+    leader, season = top_line(index, through=post_date)
+    claims = {"star_lines": [dict(player=player, team="", g=week.G + 1, a=week.A, pts=week.Pts + 1),
+                             dict(player=player, team="", g=1, a=1, pts=3)],
+              "hardware_lines": [dict(player=leader, team="", pts=season.Pts + 2)]}
+
+    errors = validator.verify_stat_lines(claims, index, window, post_date)
+
+    assert any("(G +1, Pts +1)" in e for e in errors)
+    assert any("1G + 1A = 2Pts" in e for e in errors)
+    assert any(e.startswith("HARDWARE ERROR") and "(+2)" in e for e in errors)
@@ -0,0 +1,42 @@
+"""Deterministic stat sections: star selection, tie-aware hardware, series status and markers."""
+
+from stat_renderer import (SECTION_END, SECTION_START, render_series_tracker, render_three_stars,
+                           select_hardware_leaders, strip_stat_sections)
+
+
+def leader(player, pts, goals):
+    return dict(Player=player, Team="The Shockers", GP=5, G=goals, A=pts - goals, Pts=pts)
+
+
+def test_hardware_keeps_everyone_tied_with_the_last_podium_spot():
+    leaders = select_hardware_leaders([leader("A", 9, 4), leader("B", 7, 3), leader("C", 6, 1),
+                                       leader("D", 6, 5), leader("E", 2, 2)])
+
+    assert [row["Player"] for row in leaders] == ["A", "B", "D", "C"]
+
+
+def test_three_stars_render_in_house_format():
+    star = dict(Player="Sho1 Player1", Team="The Shockers", GP=1, G=2, A=1, Pts=3, PPG=1, SHG=0, GWG=1)
+
+    section = render_three_stars([star])
+
+    assert "**1st Star: Sho1 Player1 (The Shockers)** - 2G, 1A, 3Pts." in section
+    assert "including the game-winner and 1 power-play goal." in section
+
+
+def test_series_tracker_reports_leads_ties_and_advances_for_active_teams_only():
+    series = [dict(TeamA="The Shockers", TeamB="The Sahara", PtsA=4, PtsB=2),
+              dict(TeamA="Muffin Men", TeamB="4 Lines", PtsA=2, PtsB=2),
+              dict(TeamA="Don Cherry's", TeamB="Flat-Earthers", PtsA=0, PtsB=2)]
+
+    tracker = render_series_tracker(series, {"the shockers", "muffin men"})
+
+    assert "The Shockers advances" in tracker
+    assert "Series tied" in tracker
+    assert "Flat-Earthers" not in tracker
+
+
+def test_strip_removes_only_the_marked_block():
+    report = f"Prose before.\n{SECTION_START}\n## Stars\n{SECTION_END}\nProse after."
+
+    assert strip_stat_sections(report) == "Prose before.\n\nProse after."
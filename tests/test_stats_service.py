@@ -0,0 +1,94 @@
+"""Stats service: window-leader parity with the analyzer, strict JSON, hot reload and warm latency."""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyzer
+from atomic_io import write_csv_atomically
+from conftest import TEAMS, roster
+from league_db import open_db
+from stats_service import LeagueSnapshot, StatsService
+
+WINDOW_FIELDS = ["Player", "Team", "GP", "G", "A", "Pts", "PIM", "PPG", "SHG", "GWG"]
+
+
+@pytest.fixture
+def service(analyzed_league):
+    service = StatsService(verbose=False)
+    yield service
+    service.close()
+
+
+@pytest.mark.parametrize("since, until", [
+    ("2026-01-01", "2026-12-31"),
+    ("2026-01-12", "2026-02-02"),
+    ("2026-02-23", "2026-02-23"),
+    ("2026-01-06", "2026-01-11"),  # No games: both sides are empty
+])
+def test_window_leaders_match_the_analyzer(service, since, until):
+    expected = analyzer.weekly_player_leaders(analyzer.load_player_game_lines(), since, until)
+    expected = [{field: row[field] for field in WINDOW_FIELDS} for row in expected.to_dict(orient="records")]
+
+    assert service.leaders("Pts", limit=None, since=since, until=until) == expected
+
+
+def test_snapshot_rows_serialize_as_strict_json(analyzed_league):
+    with open_db() as db:
+        stats = db.table("player_stats")
+        lines = db.table("player_game_lines")
+        stats.loc[0, "Team"] = np.nan
+        lines.loc[0, "Team"] = np.nan
+        db.replace_table("player_stats", stats)
+        db.replace_table("player_game_lines", lines)
+        snapshot = LeagueSnapshot.load(db)
+
+    json.dumps(snapshot.tables, allow_nan=False)
+    json.dumps([snapshot.player(name) for name in snapshot.player_lines], allow_nan=False)
+    json.dumps(snapshot.game_list(), allow_nan=False)
+    assert snapshot.player_rows[stats.loc[0, "Player"]]["Team"] is None
+
+
+def test_committed_changes_are_picked_up_on_the_next_query(service):
+    assert service.game("1001")["Notes"] is None
+    assert service.reloads == 1
+
+    service.game("1001")
+    assert service.reloads == 1
+
+    with open_db() as db:
+        db.set_notes({"1001": "Played at the backup rink"})
+    assert service.game("1001")["Notes"] == "Played at the backup rink"
+    assert service.reloads == 2
+
+
+def test_an_edited_csv_export_reloads_the_standings(service):
+    before = {row["Team"]: row for row in service.standings()}
+    stats = pd.read_csv(analyzer.TEAM_STATS_FILE)
+    team = stats.loc[0, "Team"]
+    stats.loc[0, "W"] += 1
+    write_csv_atomically(stats, analyzer.TEAM_STATS_FILE, index=False)
+
+    after = {row["Team"]: row for row in service.standings()}
+    assert service.reloads == 2
+    assert after[team]["W"] == before[team]["W"] + 1
+
+
+def test_warm_queries_take_well_under_a_millisecond(service):
+    service.leaders("Pts")  # Builds the snapshot
+    queries = [lambda: service.leaders("Pts"),
+               lambda: service.leaders("G", since="2026-01-12", until="2026-02-09"),
+               lambda: service.player(roster(TEAMS[0])[0], last=5),
+               lambda: service.game_list(since="2026-01-19", until="2026-02-02")]
+    timings = []
+    for _ in range(200):
+        for query in queries:
+            started = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - started)
+
+    assert service.reloads == 1
+    assert np.median(timings) < 0.001
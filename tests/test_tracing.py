@@ -0,0 +1,60 @@
+"""Span tracing: Chrome trace export, token attribution through thread pools, summaries."""
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import SRC_DIR
+from tracing import summarize
+
+TRACED_RUN = """
+import sys
+sys.path.insert(0, {src!r})
+from concurrent.futures import ThreadPoolExecutor
+import tracing
+from llm_backend import FakeBackend, TracedBackend
+
+backend = TracedBackend(FakeBackend())
+
+@tracing.traced()
+def stage():
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(tracing.propagate(lambda i: backend.generate(f"prompt {{i}}", call_site="scout")), range(3)))
+
+with tracing.span("stage.test", "stage"):
+    stage()
+"""
+
+
+def test_traced_run_exports_nested_spans_with_token_totals(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    env = dict(os.environ, PIPELINE_TRACE=str(trace_path))
+    subprocess.run([sys.executable, "-c", TRACED_RUN.format(src=SRC_DIR)], env=env, check=True,
+                   capture_output=True, cwd=tmp_path)
+
+    events = [e for e in json.loads(trace_path.read_text())["traceEvents"] if e["ph"] == "X"]
+    by_name = {e["name"]: e for e in events}
+    llm_calls = [e for e in events if e["cat"] == "llm"]
+
+    assert len(llm_calls) == 3
+    assert by_name["stage.test"]["args"]["llm_calls"] == 3
+    assert by_name["<string>.stage"]["args"]["llm_calls"] == 3
+    outer = by_name["stage.test"]
+    assert all(outer["ts"] <= e["ts"] and e["ts"] + e["dur"] <= outer["ts"] + outer["dur"] + 1 for e in llm_calls)
+
+
+def test_summary_aggregates_by_span_name():
+    events = [
+        {"name": "a", "cat": "function", "ph": "X", "dur": 2000, "args": {"cpu_ms": 1.0}},
+        {"name": "a", "cat": "function", "ph": "X", "dur": 4000, "args": {"cpu_ms": 2.0}},
+        {"name": "llm.scout", "cat": "llm", "ph": "X", "dur": 1000,
+         "args": {"prompt_tokens": 10, "response_tokens": 5}},
+        {"name": "thread_name", "ph": "M", "args": {}},
+    ]
+
+    rows = summarize(events)
+
+    assert [r["name"] for r in rows] == ["a", "llm.scout"]
+    assert rows[0]["calls"] == 2 and rows[0]["wall_ms"] == 6.0 and rows[0]["max_ms"] == 4.0
+    assert rows[1]["llm_calls"] == 1 and rows[1]["tokens"] == 15
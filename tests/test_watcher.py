@@ -0,0 +1,107 @@
+"""Service mode: poll backoff, incremental ingest parity with a batch run and the dispatch queue."""
+
+import json
+
+import pandas as pd
+import pytest
+
+import analyzer
+import watcher
+from league_db import open_db
+
+HELD_BACK = ["1008", "1010"]  # One regular-season game and one playoff game land while watching
+
+
+class StubSource:
+    """A league site stand-in serving the synthetic manifest and the held-back games."""
+
+    def __init__(self, manifest, held_back):
+        self.manifest = manifest
+        self.held_back = held_back
+        self.fetched = []
+
+    def fetch_manifest(self):
+        return self.manifest.to_dict(orient="records")
+
+    def fetch_game(self, game):
+        self.fetched.append(str(game["GameID"]))
+        return self.held_back[self.held_back["GameID"].astype(str) == str(game["GameID"])].to_dict(orient="records")
+
+    def reset(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def watched_league(league_dir):
+    """The synthetic league analyzed without two of its games, plus a source that serves them."""
+    details = pd.read_csv("data/game_details.csv")
+    held = details["GameID"].astype(str).isin(HELD_BACK)
+    details[~held].to_csv("data/game_details.csv", index=False)
+    analyzer.run_analysis_pipeline()
+    return StubSource(pd.read_csv("data/games_manifest.csv"), details[held])
+
+
+def derived_tables():
+    with open_db() as db:
+        tables = {name: db.table(name) for name in
+                  ("team_stats", "playoff_standings", "playoff_matchups", "player_stats", "player_game_lines")}
+    tables["player_stats"] = tables["player_stats"].sort_values(by="Player").reset_index(drop=True)
+    tables["player_game_lines"] = (tables["player_game_lines"].drop(columns="Seq")
+                                   .sort_values(by=["Player", "GameID"]).reset_index(drop=True))
+    return tables
+
+
+def test_poll_delay_backs_off_when_idle_and_harder_after_failures():
+    base, ceiling = 60, 600
+    assert watcher.next_poll_delay(300, found_new=True, failed=False, base=base, ceiling=ceiling) == base
+    assert watcher.next_poll_delay(100, found_new=False, failed=False, base=base, ceiling=ceiling) == 150
+    assert watcher.next_poll_delay(100, found_new=False, failed=True, base=base, ceiling=ceiling) == 200
+    assert watcher.next_poll_delay(500, found_new=False, failed=False, base=base, ceiling=ceiling) == ceiling
+    assert watcher.next_poll_delay(500, found_new=True, failed=True, base=base, ceiling=ceiling) == ceiling
+
+
+def test_poll_once_ingests_new_games_incrementally(watched_league, monkeypatch):
+    league = watcher.LeagueWatcher(watched_league, visuals=False)
+
+    def no_full_rebuild(*args, **kwargs):
+        raise AssertionError("the watcher rebuilt every derived table")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(analyzer, "run_analysis_pipeline", no_full_rebuild)
+        assert league.poll_once() == HELD_BACK
+        # The cache is extended in place rather than reloaded from the database
+        patch.setattr(analyzer, "initialize_game_data", no_full_rebuild)
+        assert league.poll_once() == []
+
+    assert watched_league.fetched == HELD_BACK
+    assert set(league.details["GameID"]) == {str(gid) for gid in range(1001, 1011)}
+    incremental = derived_tables()
+
+    analyzer.run_analysis_pipeline()
+    batch = derived_tables()
+    for name, expected in batch.items():
+        pd.testing.assert_frame_equal(incremental[name], expected, check_dtype=False, obj=name)
+
+
+def test_poll_once_fails_on_an_empty_manifest(watched_league):
+    watched_league.manifest = watched_league.manifest.iloc[0:0]
+    with pytest.raises(RuntimeError):
+        watcher.LeagueWatcher(watched_league, visuals=False).poll_once()
+
+
+def test_queue_dispatch_records_the_newest_date_and_game_summaries(watched_league):
+    league = watcher.LeagueWatcher(watched_league, visuals=False)
+    league.poll_once()
+
+    with open(watcher.QUEUE_FILE, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry["games"] == HELD_BACK
+    assert entry["report_date"] == "2026-02-23"
+    assert entry["status"] == "queued" and entry["post"] is None
+    assert [s["game_id"] for s in entry["summaries"]] == HELD_BACK
+    assert all(s["final_score"] for s in entry["summaries"])